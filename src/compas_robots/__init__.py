@@ -15,8 +15,10 @@ __version__ = "1.0.1"
 
 
 from .configuration import Configuration
+from .configuration import ConfigurationArray
 from .model.robot import RobotModel
 from .model.tool import ToolModel
+from .trajectory import JointTrajectory
 
 HERE = os.path.dirname(__file__)
 DATA = os.path.abspath(os.path.join(HERE, "data"))
@@ -31,7 +33,7 @@ def get(filename):
     return _find_resource(filename)
 
 
-__all__ = ["Configuration", "RobotModel", "ToolModel", "get"]
+__all__ = ["Configuration", "ConfigurationArray", "JointTrajectory", "RobotModel", "ToolModel", "get"]
 
 __all_plugins__ = [
     "compas_robots.blender.scene",
@@ -5,12 +5,14 @@ from math import pi
 from typing import TYPE_CHECKING
 from typing import cast
 
+import numpy as np
 from compas.data import Data
 from compas.tolerance import TOL
 
 if TYPE_CHECKING:
     from typing import Iterator
     from typing import Optional
+    from typing import Union
 
     from compas_robots.model import JointType
 
@@ -23,6 +25,17 @@ _JOINT_PRISMATIC = 2
 _JOINT_PLANAR = 5
 
 
+def _wrapped_differences(values, other_values, joint_types):
+    """Differences between two arrays of joint values, the smaller difference (+/- 2*pi) for revolute and continuous joints."""
+    diff = np.subtract(values, other_values, dtype=float)
+    d1 = np.mod(diff, 2 * pi)
+    d1 = np.where(diff >= 0, d1, d1 - 2 * pi)
+    d2 = np.where(diff >= 0, d1 - 2 * pi, d1 + 2 * pi)
+    wrapped = np.where(np.abs(d1) < np.abs(d2), d1, d2)
+    revolute = np.isin(np.asarray(joint_types, dtype=int), (_JOINT_REVOLUTE, _JOINT_CONTINUOUS))
+    return np.where(revolute, wrapped, diff)
+
+
 def joint_names_validator(joint_names, key=None, value=None):
     new_joint_names = list(joint_names)
     if key is not None and value is not None:
@@ -263,6 +276,45 @@ class Configuration(Data):
             value = default
         return value
 
+    def __array__(self, dtype=None, copy=None):
+        if copy is False:
+            raise ValueError("The joint values of a Configuration are stored in a list and cannot be viewed as an array without a copy.")
+        return np.array(self.joint_values, dtype=dtype or float)
+
+    @classmethod
+    def from_array(cls, values: np.ndarray, joint_types: Optional[list[JointType]] = None, joint_names: Optional[list[str]] = None) -> Configuration:
+        """Construct a configuration from a one-dimensional array of joint values.
+
+        Parameters
+        ----------
+        values
+            Joint values expressed in radians or meters, depending on the respective type.
+        joint_types
+            Joint types. Defaults to revolute joints.
+        joint_names
+            List of joint names.
+
+        Returns
+        -------
+        Configuration
+            A newly created instance of configuration.
+
+        Examples
+        --------
+        >>> config = Configuration.from_array(np.array([0.5, 1.0]), joint_names=["a", "b"])
+        >>> config["b"]
+        1.0
+        >>> np.asarray(config)
+        array([0.5, 1. ])
+
+        """
+        values = np.asarray(values, dtype=float)
+        if values.ndim != 1:
+            raise ValueError("Expected a one-dimensional array of joint values, got shape {}.".format(values.shape))
+        if joint_types is None:
+            joint_types = [_JOINT_REVOLUTE] * len(values)
+        return cls(values.tolist(), list(joint_types), list(joint_names or []))
+
     @classmethod
     def from_revolute_values(cls, values: list[float], joint_names: Optional[list[str]] = None) -> Configuration:
         """Construct a configuration from revolute joint values in radians.
@@ -585,3 +637,283 @@ class Configuration(Data):
         joint_types = [_type_dict[name] for name in joint_names]
 
         return Configuration(joint_values, joint_types, joint_names)
+
+
+class ConfigurationArray(Data):
+    """Represents many configurations of the same joints as one array of joint values.
+
+    A configuration array stores the joint values of N configurations in a single
+    (N, dof) NumPy array and the joint types and names only once, which makes it much
+    more compact than a list of [Configuration][compas_robots.Configuration] instances.
+    Differences, distances and interpolation are computed for all configurations at once.
+
+    Parameters
+    ----------
+    values
+        An (N, dof) array of joint values expressed in radians or meters, depending on the
+        respective type. Float arrays are used without copying.
+    joint_types
+        Joint types, e.g. a list of `JointType.REVOLUTE` for revolute joints.
+        Defaults to revolute joints.
+    joint_names
+        List of joint names.
+
+    Attributes
+    ----------
+    values : numpy.ndarray
+        The (N, dof) array of joint values.
+    joint_types : list[compas_robots.model.JointType]
+        Joint types of the columns of `values`.
+    joint_names : list[str]
+        Joint names of the columns of `values`.
+
+    Examples
+    --------
+    >>> start = Configuration.from_revolute_values([0.0, 3.0], ["a", "b"])
+    >>> end = Configuration.from_revolute_values([1.0, -3.0], ["a", "b"])
+    >>> path = ConfigurationArray.from_configurations([start]).interpolated(end, np.linspace(0.0, 1.0, 5))
+    >>> len(path)
+    5
+    >>> path.max_differences(end).round(3).tolist()
+    [1.0, 0.75, 0.5, 0.25, 0.0]
+
+    """
+
+    def __init__(
+        self,
+        values: Optional[np.ndarray] = None,
+        joint_types: Optional[list[JointType]] = None,
+        joint_names: Optional[list[str]] = None,
+        **kwargs,
+    ):
+        super(ConfigurationArray, self).__init__(**kwargs)
+        values = np.zeros((0, len(joint_types or []))) if values is None else np.asarray(values, dtype=float)
+        if values.ndim != 2:
+            raise ValueError("Expected an (N, dof) array of joint values, got shape {}.".format(values.shape))
+
+        joint_types = list(joint_types) if joint_types is not None else [_JOINT_REVOLUTE] * values.shape[1]
+        joint_names = list(joint_names or [])
+        joint_names_validator(joint_names)
+
+        if len(joint_types) != values.shape[1]:
+            raise ValueError("{} joint values per configuration must have {} joint_types, but {} given.".format(values.shape[1], values.shape[1], len(joint_types)))
+
+        if joint_names and len(joint_names) != values.shape[1]:
+            raise ValueError("{} joint values per configuration must have either 0 or {} names, but {} given".format(values.shape[1], values.shape[1], len(joint_names)))
+
+        self.values = values
+        self.joint_types = joint_types
+        self.joint_names = joint_names
+
+    @property
+    def __dtype__(self):
+        return "compas_robots/ConfigurationArray"
+
+    @property
+    def __data__(self):
+        return {
+            "values": self.values.tolist(),
+            "joint_types": self.joint_types,
+            "joint_names": self.joint_names,
+        }
+
+    @classmethod
+    def __from_data__(cls, data):
+        values = np.array(data["values"], dtype=float).reshape(-1, len(data["joint_types"]))
+        return cls(values, data["joint_types"], data["joint_names"])
+
+    def __str__(self):
+        return "ConfigurationArray({} configurations, {})".format(len(self), tuple(int(t) for t in self.joint_types))
+
+    def __repr__(self):
+        return self.__str__()
+
+    def __len__(self):
+        return self.values.shape[0]
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def __getitem__(self, index):
+        if isinstance(index, (int, np.integer)):
+            return Configuration(self.values[index].tolist(), list(self.joint_types), list(self.joint_names))
+        return ConfigurationArray(self.values[index], self.joint_types, self.joint_names)
+
+    def __array__(self, dtype=None, copy=None):
+        if copy:
+            return np.array(self.values, dtype=dtype)
+        return np.asarray(self.values, dtype=dtype)
+
+    @classmethod
+    def from_array(cls, values: np.ndarray, joint_types: Optional[list[JointType]] = None, joint_names: Optional[list[str]] = None) -> ConfigurationArray:
+        """Construct a configuration array from an (N, dof) array of joint values without copying it.
+
+        Parameters
+        ----------
+        values
+            An (N, dof) array of joint values.
+        joint_types
+            Joint types. Defaults to revolute joints.
+        joint_names
+            List of joint names.
+
+        Returns
+        -------
+        ConfigurationArray
+            A newly created configuration array.
+
+        """
+        return cls(values, joint_types, joint_names)
+
+    @classmethod
+    def from_configurations(cls, configurations: list[Configuration]) -> ConfigurationArray:
+        """Construct a configuration array from configurations of the same joints.
+
+        The joint types and names are taken from the first configuration. The values of
+        configurations with joint names are reordered to match them.
+
+        Parameters
+        ----------
+        configurations
+            The configurations.
+
+        Returns
+        -------
+        ConfigurationArray
+            A newly created configuration array.
+
+        """
+        configurations = list(configurations)
+        if not configurations:
+            raise ValueError("At least one configuration is required.")
+        first = configurations[0]
+        values = np.array([cls._ordered_values(first, config) for config in configurations], dtype=float)
+        return cls(values, list(first.joint_types), list(first.joint_names))
+
+    @staticmethod
+    def _ordered_values(reference, config):
+        if reference.joint_names and config.joint_names and list(reference.joint_names) != list(config.joint_names):
+            value_by_name = dict(zip(config.joint_names, config.joint_values))
+            return [value_by_name[name] for name in reference.joint_names]
+        return list(config.joint_values)
+
+    def to_configurations(self) -> list[Configuration]:
+        """Get the configurations of the array.
+
+        Returns
+        -------
+        list[Configuration]
+            One configuration per row of the array.
+
+        """
+        return list(self)
+
+    def _other_values(self, other):
+        if isinstance(other, (Configuration, ConfigurationArray)):
+            other_values = np.asarray(other, dtype=float)
+            if self.joint_names and other.joint_names and list(self.joint_names) != list(other.joint_names):
+                if set(self.joint_names) != set(other.joint_names):
+                    raise ValueError("Configurations have different joint names.")
+                column_by_name = {name: i for i, name in enumerate(other.joint_names)}
+                other_values = other_values[..., [column_by_name[name] for name in self.joint_names]]
+        else:
+            other_values = np.asarray(other, dtype=float)
+        if other_values.shape[-1] != self.values.shape[1]:
+            raise ValueError("Can't compare configurations with different lengths of joint_values.")
+        return other_values
+
+    def differences(self, other: Union[Configuration, ConfigurationArray, np.ndarray]) -> np.ndarray:
+        """Differences to other joint values.
+
+        If the joint type is revolute or continuous, the smaller difference
+        (+/- 2*`\\pi`) is calculated, as in [Configuration.iter_differences][compas_robots.Configuration.iter_differences].
+
+        Parameters
+        ----------
+        other
+            A configuration, a configuration array of the same length, or joint values broadcastable to (N, dof).
+
+        Returns
+        -------
+        numpy.ndarray
+            The (N, dof) differences.
+
+        Raises
+        ------
+        ValueError
+            If the configurations are not comparable.
+
+        """
+        return _wrapped_differences(self.values, self._other_values(other), self.joint_types)
+
+    def max_differences(self, other: Union[Configuration, ConfigurationArray, np.ndarray]) -> np.ndarray:
+        """Maximum absolute differences to other joint values.
+
+        Parameters
+        ----------
+        other
+            A configuration, a configuration array of the same length, or joint values broadcastable to (N, dof).
+
+        Returns
+        -------
+        numpy.ndarray
+            The (N,) maximum absolute differences.
+
+        """
+        return np.abs(self.differences(other)).max(axis=-1)
+
+    def distances(self, other: Union[Configuration, ConfigurationArray, np.ndarray]) -> np.ndarray:
+        """Euclidean distances in joint space to other joint values.
+
+        Parameters
+        ----------
+        other
+            A configuration, a configuration array of the same length, or joint values broadcastable to (N, dof).
+
+        Returns
+        -------
+        numpy.ndarray
+            The (N,) distances.
+
+        """
+        return np.linalg.norm(self.differences(other), axis=-1)
+
+    def close_to(self, other: Union[Configuration, ConfigurationArray, np.ndarray], tol: float = 1e-3) -> np.ndarray:
+        """Whether the joint values are within a certain range of other joint values.
+
+        Parameters
+        ----------
+        other
+            A configuration, a configuration array of the same length, or joint values broadcastable to (N, dof).
+        tol
+            The tolerance under which we consider 2 floats the same. Defaults to 1e-3.
+
+        Returns
+        -------
+        numpy.ndarray
+            An (N,) boolean array.
+
+        """
+        return self.max_differences(other) <= tol
+
+    def interpolated(self, other: Union[Configuration, ConfigurationArray, np.ndarray], t: Union[float, np.ndarray]) -> ConfigurationArray:
+        """Interpolate linearly towards other joint values along the smaller differences.
+
+        Parameters
+        ----------
+        other
+            A configuration, a configuration array of the same length, or joint values broadcastable to (N, dof).
+        t
+            The interpolation parameter, 0 for this array and 1 for `other`.
+            An array of parameters interpolates an array of length one at each of them.
+
+        Returns
+        -------
+        ConfigurationArray
+            The interpolated configurations.
+
+        """
+        t = np.asarray(t, dtype=float)
+        values = self.values - t[..., None] * self.differences(other)
+        return ConfigurationArray(values, self.joint_types, self.joint_names)
@@ -2,8 +2,10 @@ from __future__ import annotations
 
 import inspect
 import sys
+import xml.etree.ElementTree as ET
 from typing import TYPE_CHECKING
 
+from compas import _iotools
 from compas.data import Data
 from compas.files.xml import XML
 from compas.files.xml import XMLElement
@@ -29,6 +31,14 @@ def _tag_without_namespace(element, default_namespace):
     return tagname
 
 
+def _read_chunks(f, size=65536):
+    while True:
+        chunk = f.read(size)
+        if not chunk:
+            break
+        yield chunk
+
+
 class URDF(object):
     """Class for working with URDF files.
 
@@ -40,6 +50,7 @@ class URDF(object):
     ----------
     xml : XML
         Instance of the XML reader/parser class.
+        When the URDF was parsed in streaming mode, it is generated from the robot on first access.
     robot : object
         Root element of the URDF model, i.e. a robot instance.
 
@@ -52,9 +63,21 @@ class URDF(object):
     [URDF XSD Schema](https://github.com/ros/urdfdom/blob/master/xsd/urdf.xsd).
     """
 
-    def __init__(self, xml=None):
-        self.xml = xml
+    def __init__(self, xml=None, keep_source=True):
+        self._xml = xml
         self._robot = None
+        self._keep_source = keep_source
+
+    @property
+    def xml(self):
+        if self._xml is None and self._robot is not None:
+            # Parsed in streaming mode, rebuild the document from the object graph
+            self.robot = self._robot
+        return self._xml
+
+    @xml.setter
+    def xml(self, xml):
+        self._xml = xml
 
     @property
     def robot(self):
@@ -64,7 +87,10 @@ class URDF(object):
                 self.xml.root,
                 _tag_without_namespace(self.xml.root, default_namespace),
                 default_namespace,
+                keep_source=self._keep_source,
             )
+            if not self._keep_source:
+                URDFParser.release_source(self._robot)
         return self._robot
 
     @robot.setter
@@ -91,38 +117,59 @@ class URDF(object):
         return urdf
 
     @classmethod
-    def from_file(cls, source: Union[str, IO]) -> URDF:
+    def from_file(cls, source: Union[str, IO], streaming: bool = False, keep_source: bool = True) -> URDF:
         """Construct a URDF from a file path or file-like object.
 
         Parameters
         ----------
         source
             File path or file-like object.
+        streaming
+            If `True`, the robot is parsed incrementally while reading the file
+            and the XML elements are released as soon as they have been parsed,
+            instead of building the XML document first.
+        keep_source
+            If `False`, the parsed objects do not keep a reference to the XML element they were created from.
 
         Examples
         --------
         >>> urdf = URDF.from_file(compas_robots.get("ur_description/urdf/ur5.urdf"))
+        >>> urdf = URDF.from_file(compas_robots.get("ur_description/urdf/ur5.urdf"), streaming=True)
+        >>> urdf.robot.name
+        'ur5'
 
         """
-        return cls(XML.from_file(source))
+        if streaming:
+            urdf = cls(keep_source=keep_source)
+            urdf._robot = URDFParser.parse_file(source, keep_source=keep_source)
+            return urdf
+        return cls(XML.from_file(source), keep_source=keep_source)
 
     read = from_file
 
     @classmethod
-    def from_string(cls, text: str) -> URDF:
+    def from_string(cls, text: str, streaming: bool = False, keep_source: bool = True) -> URDF:
         """Construct a URDF from a string.
 
         Parameters
         ----------
         text
             XML string.
+        streaming
+            If `True`, the robot is parsed incrementally without building the XML document first.
+        keep_source
+            If `False`, the parsed objects do not keep a reference to the XML element they were created from.
 
         Examples
         --------
         >>> urdf = URDF.from_string('<robot name="panda"/>')
 
         """
-        return cls(XML.from_string(text))
+        if streaming:
+            urdf = cls(keep_source=keep_source)
+            urdf._robot = URDFParser.parse_string(text, keep_source=keep_source)
+            return urdf
+        return cls(XML.from_string(text), keep_source=keep_source)
 
     def to_file(self, destination: Optional[str] = None, prettify: bool = False) -> None:
         """Writes the string representation of this URDF instance,
@@ -180,6 +227,7 @@ class URDFParser(object):
     """Class for parsing URDF elements into an object graph."""
 
     _parsers = dict()
+    _dispatch = dict()
 
     @classmethod
     def install_parser(cls, parser_type: type, *tags: str, **kwargs) -> None:
@@ -210,9 +258,20 @@ class URDFParser(object):
 
         for tag in tags:
             cls._parsers[tag] = {"type": parser_type, "proxy": kwargs.get("proxy_type")}
+        cls._dispatch.clear()
+
+    @classmethod
+    def _get_dispatch(cls, path):
+        # Resolve the parser type and its metadata only once per path
+        dispatch = cls._dispatch.get(path)
+        if dispatch is None:
+            parser_type_info = cls._parsers.get(path, None) or {"type": URDFGenericElement}
+            parser_type = parser_type_info.get("proxy") or parser_type_info["type"]
+            dispatch = cls._dispatch[path] = (parser_type, get_metadata(parser_type))
+        return dispatch
 
     @classmethod
-    def parse_element(cls, element: XMLElement, path: str = "", element_default_namespace: Optional[str] = None) -> object:
+    def parse_element(cls, element: XMLElement, path: str = "", element_default_namespace: Optional[str] = None, keep_source: bool = True) -> object:
         """Recursively parse URDF element and its children.
 
         If the parser type implements a class method `from_urdf`,
@@ -228,6 +287,9 @@ class URDFParser(object):
             Full path to the element.
         element_default_namespace
             Default namespace at the current level current document.
+        keep_source
+            If `False`, the objects created for the children do not keep a reference to their XML element.
+            The reference of the returned object can be dropped with [release_source][compas_robots.files.URDFParser.release_source].
 
         Returns
         -------
@@ -247,12 +309,13 @@ class URDFParser(object):
             default_ns = child.attrib.get("xmlns") or element_default_namespace
             child_name = _tag_without_namespace(child, default_ns)
             child_path = "/".join([path, child_name])
-            children.append(cls.parse_element(child, child_path, default_ns))
+            children.append(cls.parse_element(child, child_path, default_ns, keep_source))
 
-        parser_type_info = cls._parsers.get(path, None) or {"type": URDFGenericElement}
-        parser_type = parser_type_info.get("proxy") or parser_type_info["type"]
+        return cls._create_object(element, path, children, default_ns, keep_source)
 
-        metadata = get_metadata(parser_type)
+    @classmethod
+    def _create_object(cls, element, path, children, default_ns, keep_source=True):
+        parser_type, metadata = cls._get_dispatch(path)
 
         attributes = dict(element.attrib)
         text = element.text.strip() if element.text else None
@@ -261,14 +324,126 @@ class URDFParser(object):
             if "from_urdf" in metadata:
                 obj = metadata["from_urdf"](attributes, children, text)
             else:
-                obj = cls.from_generic_urdf(parser_type, attributes, children, text, default_ns)
+                obj = cls.from_generic_urdf(parser_type, attributes, children, text, default_ns, metadata)
         except Exception as e:
             raise TypeError("Cannot create instance of %s. Message=%s" % (parser_type, e))
 
         obj._urdf_source = element
 
+        if not keep_source:
+            # The tags of the children are only needed to build this object
+            for child in children:
+                cls.release_source(child)
+
         return obj
 
+    @staticmethod
+    def release_source(obj: object) -> None:
+        """Drop the reference of a parsed object to the XML element it was created from.
+
+        Generic elements keep the tag of the element, which is needed to write them back to URDF.
+
+        Parameters
+        ----------
+        obj
+            An object created by the parser.
+
+        """
+        source = vars(obj).pop("_urdf_source", None)
+        if source is not None and isinstance(obj, URDFGenericElement) and not hasattr(obj, "tag"):
+            obj.tag = source.tag
+
+    @classmethod
+    def parse_file(cls, source: Union[str, IO], keep_source: bool = True) -> object:
+        """Parse a URDF document incrementally while reading it.
+
+        The object graph is built bottom-up as the closing tag of each element is read,
+        and the content of each XML element is released as soon as its object has been created,
+        so the complete XML document is never held in memory.
+
+        Parameters
+        ----------
+        source
+            File path, URL or file-like object.
+        keep_source
+            If `False`, the parsed objects do not keep a reference to the (emptied) XML element they were created from.
+
+        Returns
+        -------
+        object
+            An instance of the model object represented by the root element, i.e. a robot instance.
+
+        Raises
+        ------
+        TypeError
+            If an element instance cannot be created.
+
+        """
+        with _iotools.open_file(source, "rb") as f:
+            return cls._parse_chunks(_read_chunks(f), keep_source)
+
+    @classmethod
+    def parse_string(cls, text: str, keep_source: bool = True) -> object:
+        """Parse a URDF document from a string without building the XML document.
+
+        Parameters
+        ----------
+        text
+            XML string.
+        keep_source
+            If `False`, the parsed objects do not keep a reference to the (emptied) XML element they were created from.
+
+        Returns
+        -------
+        object
+            An instance of the model object represented by the root element, i.e. a robot instance.
+
+        """
+        return cls._parse_chunks([text], keep_source)
+
+    @classmethod
+    def _parse_chunks(cls, chunks, keep_source=True):
+        parser = ET.XMLPullParser(events=("start-ns", "start", "end"))
+        namespaces = {}
+        # One [element, path, default namespace, children, namespace to build with] entry per open element
+        stack = []
+        root = None
+
+        for chunk in chunks:
+            parser.feed(chunk)
+            for event, item in parser.read_events():
+                if event == "start-ns":
+                    prefix, uri = item
+                    namespaces["xmlns:" + prefix if prefix else "xmlns"] = uri
+                elif event == "start":
+                    # Same attributes as the XML reader, which adds namespace declarations to the declaring element
+                    if namespaces:
+                        item.attrib.update(namespaces)
+                        namespaces = {}
+                    if stack:
+                        parent = stack[-1]
+                        default_ns = item.attrib.get("xmlns") or parent[2]
+                        path = parent[1] + "/" + _tag_without_namespace(item, default_ns)
+                        # parse_element builds the parent with the namespace of its last child
+                        parent[4] = default_ns
+                    else:
+                        default_ns = item.attrib.get("xmlns")
+                        path = _tag_without_namespace(item, default_ns)
+                    stack.append([item, path, default_ns, [], default_ns])
+                else:
+                    element, path, _, children, build_ns = stack.pop()
+                    obj = cls._create_object(element, path, children, build_ns, keep_source)
+                    element.clear()
+                    if stack:
+                        stack[-1][3].append(obj)
+                    else:
+                        root = obj
+
+        parser.close()
+        if not keep_source:
+            cls.release_source(root)
+        return root
+
     @classmethod
     def from_generic_urdf(
         cls,
@@ -277,9 +452,10 @@ class URDFParser(object):
         children=None,
         text=None,
         default_namespace=None,
+        metadata=None,
     ):
         kwargs = attributes
-        kwargs.update(cls.build_kwargs_by_type(children, parser_type, default_namespace))
+        kwargs.update(cls.build_kwargs_by_type(children, parser_type, default_namespace, metadata))
 
         return parser_type(**kwargs)
 
@@ -289,10 +465,18 @@ class URDFParser(object):
 
     @classmethod
     def _argname_from_element(cls, element, metadata, default_namespace):
+        urdf_tag = _tag_without_namespace(element._urdf_source, default_namespace)
+
+        argnames = metadata.setdefault("argnames", {})
+        if urdf_tag not in argnames:
+            argnames[urdf_tag] = cls._argname_from_tag(urdf_tag, metadata)
+        return argnames[urdf_tag]
+
+    @classmethod
+    def _argname_from_tag(cls, urdf_tag, metadata):
         init_args = metadata["init_args"]
 
         # Match URDF tag to an argument name in the constructor
-        urdf_tag = _tag_without_namespace(element._urdf_source, default_namespace)
         if urdf_tag in init_args:
             return urdf_tag
 
@@ -312,9 +496,10 @@ class URDFParser(object):
         raise ValueError("Cannot find a matching argument for %s" % urdf_tag)
 
     @classmethod
-    def build_kwargs_by_type(cls, elements, parser_type, default_namespace):
+    def build_kwargs_by_type(cls, elements, parser_type, default_namespace, metadata=None):
         result = dict()
-        metadata = get_metadata(parser_type)
+        if metadata is None:
+            metadata = get_metadata(parser_type)
 
         for child in elements:
             key = cls._argname_from_element(child, metadata, default_namespace)
@@ -349,11 +534,14 @@ class URDFGenericElement(Data):
 
     @property
     def __data__(self):
-        return {
+        data = {
             "attr": self.attr,
             "elements": [d.__data__ for d in self.elements],
             "text": self.text,
         }
+        if hasattr(self, "tag") or hasattr(self, "_urdf_source"):
+            data["tag"] = self.tag if hasattr(self, "tag") else self._urdf_source.tag
+        return data
 
     @classmethod
     def __from_data__(cls, data):
@@ -361,6 +549,8 @@ class URDFGenericElement(Data):
         generic.attr = data["attr"]
         generic.elements = [cls.__from_data__(d) for d in data["elements"]]
         generic.text = data["text"]
+        if "tag" in data:
+            generic.tag = data["tag"]
         return generic
 
     # @classmethod
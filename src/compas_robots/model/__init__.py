@@ -1,5 +1,6 @@
 from __future__ import absolute_import
 
+from .cache import RobotModelCache
 from .geometry import BoxProxy
 from .geometry import CapsuleProxy
 from .geometry import CylinderProxy
@@ -18,6 +19,12 @@ from .joint import Limit
 from .joint import Mimic
 from .joint import ParentLink
 from .joint import SafetyController
+from .kinematics import ForwardKinematicsCache
+from .kinematics import InverseKinematicsResult
+from .kinematics import InverseKinematicsSolver
+from .kinematics import KinematicChain
+from .kinematics import condition_number
+from .kinematics import manipulability
 from .link import Collision
 from .link import Inertia
 from .link import Inertial
@@ -26,6 +33,7 @@ from .link import Mass
 from .link import Visual
 
 __all__ = [
+    "RobotModelCache",
     "BoxProxy",
     "CapsuleProxy",
     "CylinderProxy",
@@ -44,6 +52,12 @@ __all__ = [
     "Mimic",
     "ParentLink",
     "SafetyController",
+    "ForwardKinematicsCache",
+    "InverseKinematicsResult",
+    "InverseKinematicsSolver",
+    "KinematicChain",
+    "condition_number",
+    "manipulability",
     "Collision",
     "Inertia",
     "Inertial",
@@ -54,6 +54,10 @@ class ProxyObject(object):
         memo[id(self)] = new_copy
         return new_copy
 
+    def __reduce__(self):
+        # NOTE: Pickle would otherwise look up its hooks through `__getattr__` before the proxied object is set
+        return type(self), (self._proxied_object,)
+
     def __str__(self):
         return str(self._proxied_object)
 
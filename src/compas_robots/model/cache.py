@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+import hashlib
+import io
+import os
+import pickle
+import re
+import tempfile
+from typing import TYPE_CHECKING
+
+import compas
+from compas import _iotools
+
+import compas_robots
+
+from .robot import RobotModel
+
+if TYPE_CHECKING:
+    from typing import IO
+    from typing import Optional
+    from typing import Union
+
+    from compas_robots.resources import AbstractMeshLoader
+
+_CACHE_FORMAT = 1
+_SIMPLE_TYPES = (str, int, float, bool, type(None))
+_ENTRY_FILENAME = re.compile(r"^[0-9a-f]{64}\.pickle$")
+
+
+def _loader_key(loader):
+    # Loaders are identified by their type and their simple settings, e.g. base paths or repository names
+    settings = sorted((name, value) for name, value in vars(loader).items() if isinstance(value, _SIMPLE_TYPES))
+    return "{}.{}{!r}".format(type(loader).__module__, type(loader).__name__, settings)
+
+
+class RobotModelCache(object):
+    """On-disk cache of robot models parsed from URDF files.
+
+    Models are stored in a compact binary format, keyed by a hash of the URDF content,
+    the versions of `compas_robots` and `compas` and, if geometry is loaded,
+    the resource loaders and precision used to load it.
+    A cache miss, or an entry that cannot be read, falls back to parsing the URDF.
+
+    The cache does not track the mesh files themselves: if the meshes of a model change
+    but its URDF does not, the cache needs to be cleared with [clear][compas_robots.model.RobotModelCache.clear].
+    Entries are stored with `pickle`, so the cache directory must be trusted.
+
+    Parameters
+    ----------
+    directory
+        Directory to store the cached models in. It is created if it does not exist.
+
+    Attributes
+    ----------
+    directory : str
+        Directory to store the cached models in.
+    hits : int
+        Number of models loaded from the cache.
+    misses : int
+        Number of models parsed because they were not in the cache.
+
+    Examples
+    --------
+    >>> import tempfile
+    >>> cache = RobotModelCache(tempfile.mkdtemp())
+    >>> robot = cache.load(compas_robots.get("ur_description/urdf/ur5.urdf"))
+    >>> robot = cache.load(compas_robots.get("ur_description/urdf/ur5.urdf"))
+    >>> cache.hits, cache.misses
+    (1, 1)
+
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, urdf: bytes, resource_loaders: Optional[list[AbstractMeshLoader]] = None, precision: Optional[int] = None) -> str:
+        """Compute the cache key of a URDF model.
+
+        Parameters
+        ----------
+        urdf
+            Content of the URDF file.
+        resource_loaders
+            Resource loaders used to load the geometry, or `None` if the geometry is not loaded.
+        precision
+            The precision used to load the geometry.
+
+        Returns
+        -------
+        str
+            Hexadecimal digest identifying the cache entry.
+
+        """
+        digest = hashlib.sha256()
+        digest.update(urdf)
+        digest.update("{}|{}|{}".format(_CACHE_FORMAT, compas_robots.__version__, compas.__version__).encode("utf-8"))
+        if resource_loaders is not None:
+            digest.update("|geometry|{!r}".format(precision).encode("utf-8"))
+            for loader in resource_loaders:
+                digest.update("|{}".format(_loader_key(loader)).encode("utf-8"))
+        return digest.hexdigest()
+
+    def _filepath(self, key):
+        return os.path.join(self.directory, key + ".pickle")
+
+    def load(
+        self,
+        source: Union[str, IO],
+        *resource_loaders: AbstractMeshLoader,
+        load_geometry: Optional[bool] = None,
+        precision: Optional[int] = None,
+    ) -> RobotModel:
+        """Load a robot model from a URDF file, using the cached model if available.
+
+        Parameters
+        ----------
+        source
+            File path, URL or file-like object of the URDF.
+        resource_loaders
+            Resource loaders to load the geometry with, see [RobotModel.load_geometry][compas_robots.RobotModel.load_geometry].
+        load_geometry
+            If `True`, the meshes are loaded and stored in the cache together with the model.
+            Defaults to `True` if resource loaders are given, and to `False` otherwise.
+        precision
+            The precision for parsing geometric data.
+
+        Returns
+        -------
+        RobotModel
+            The robot model.
+
+        """
+        with _iotools.open_file(source, "rb") as f:
+            urdf = f.read()
+        if not isinstance(urdf, bytes):
+            urdf = urdf.encode("utf-8")
+
+        if load_geometry is None:
+            load_geometry = bool(resource_loaders)
+        key = self.key(urdf, list(resource_loaders) if load_geometry else None, precision)
+        filepath = self._filepath(key)
+
+        robot = self._read(filepath)
+        if robot is not None:
+            self.hits += 1
+            return robot
+
+        self.misses += 1
+        robot = RobotModel.from_urdf_file(io.BytesIO(urdf))
+        if load_geometry:
+            robot.load_geometry(*resource_loaders, precision=precision)
+        self._write(filepath, robot)
+        return robot
+
+    def _read(self, filepath):
+        if not os.path.exists(filepath):
+            return None
+        try:
+            with open(filepath, "rb") as f:
+                return RobotModel.__from_data__(pickle.load(f))
+        except Exception:
+            # Unreadable entries, e.g. from an interrupted write, are parsed again and replaced
+            return None
+
+    def _write(self, filepath, robot):
+        if not os.path.isdir(self.directory):
+            os.makedirs(self.directory)
+        # Write to a temporary file first, so that concurrent readers never see a partial entry
+        handle, temp_filepath = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(handle, "wb") as f:
+                pickle.dump(robot.__data__, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_filepath, filepath)
+        except Exception:
+            os.remove(temp_filepath)
+            raise
+
+    def clear(self) -> None:
+        """Remove all cached models from the cache directory.
+
+        Other files in the directory are kept.
+
+        """
+        if not os.path.isdir(self.directory):
+            return
+        for filename in os.listdir(self.directory):
+            if _ENTRY_FILENAME.match(filename):
+                os.remove(os.path.join(self.directory, filename))
@@ -139,6 +139,10 @@ class MeshDescriptor(Data):
         The scale factors of the mesh in the x-, y-, and z-direction.
     meshes : list[[compas.datastructures.Mesh]]
         List of COMPAS geometric meshes.
+        If the geometry of the model was loaded with `lazy=True`, the meshes are loaded on first access.
+    shares_meshes : bool
+        Whether the meshes are shared with other descriptors of the same file.
+        Call [unshare_meshes][compas_robots.model.MeshDescriptor.unshare_meshes] before modifying them in place.
 
     Examples
     --------
@@ -153,6 +157,59 @@ class MeshDescriptor(Data):
         self.meshes = []
         self.attr = kwargs or {}
 
+    @property
+    def meshes(self):
+        resolver = self._resolver
+        if resolver is not None:
+            meshes, shared = resolver.resolve(self.filename)
+            if shared:
+                self._share_meshes(meshes)
+            else:
+                self.meshes = meshes
+        return self._meshes
+
+    @meshes.setter
+    def meshes(self, meshes):
+        self._meshes = meshes
+        self._shares_meshes = False
+        self._resolver = None
+
+    @property
+    def shares_meshes(self) -> bool:
+        return self._shares_meshes
+
+    def _share_meshes(self, meshes):
+        self._meshes = list(meshes)
+        self._shares_meshes = True
+        self._resolver = None
+
+    def _load_lazily(self, resolver):
+        # The resolver loads the meshes of a file once, no matter how many descriptors and threads ask for them
+        self._meshes = []
+        self._shares_meshes = False
+        self._resolver = resolver
+
+    def unshare_meshes(self) -> list[Mesh]:
+        """Replace meshes shared with other descriptors by copies owned by this descriptor.
+
+        Returns
+        -------
+        list[[compas.datastructures.Mesh]]
+            The meshes of this descriptor, which can be modified in place.
+
+        Examples
+        --------
+        >>> m = MeshDescriptor("link.stl")
+        >>> m._share_meshes([Mesh.from_polyhedron(4)])
+        >>> meshes = m.unshare_meshes()
+        >>> m.shares_meshes
+        False
+
+        """
+        if self._shares_meshes:
+            self.meshes = [mesh.copy() for mesh in self._meshes]
+        return self._meshes
+
     def get_urdf_element(self):
         attributes = {"filename": self.filename}
         # There is no need to record default values.  Usually these
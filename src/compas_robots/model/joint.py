@@ -188,12 +188,32 @@ class Limit(Data):
 
     def __init__(self, effort: float = 0.0, velocity: float = 0.0, lower: float = 0.0, upper: float = 0.0, **kwargs):
         super(Limit, self).__init__()
+        # Bumped on every change of the limits, so that compiled kinematic chains can detect them
+        self._version = 0
         self.effort = float(effort)
         self.velocity = float(velocity)
         self.lower = float(lower)
         self.upper = float(upper)
         self.attr = kwargs
 
+    @property
+    def lower(self):
+        return self._lower
+
+    @lower.setter
+    def lower(self, value):
+        self._lower = value
+        self._version += 1
+
+    @property
+    def upper(self):
+        return self._upper
+
+    @upper.setter
+    def upper(self, value):
+        self._upper = value
+        self._version += 1
+
     def get_urdf_element(self) -> URDFElement:
         attributes = {
             "lower": self.lower,
@@ -484,6 +504,8 @@ class Joint(Data):
                 raise ValueError("Unsupported joint type: %s" % type)
 
         super(Joint, self).__init__()
+        # Bumped on every change of the kinematic properties, so that compiled kinematic chains can detect them
+        self._version = 0
         self.name = name
         self.type = joint_type
         self.parent = parent if isinstance(parent, ParentLink) else ParentLink(parent)
@@ -510,6 +532,7 @@ class Joint(Data):
     @origin.setter
     def origin(self, value):
         self._origin = FrameProxy.create_proxy(value)
+        self._version += 1
 
     @property
     def current_origin(self):
@@ -518,6 +541,47 @@ class Joint(Data):
     @current_origin.setter
     def current_origin(self, value):
         self._current_origin = FrameProxy.create_proxy(value)
+        self._version += 1
+
+    @property
+    def axis(self):
+        return self._axis
+
+    @axis.setter
+    def axis(self, value):
+        self._axis = value
+        self._version += 1
+
+    @property
+    def current_axis(self):
+        return self._current_axis
+
+    @current_axis.setter
+    def current_axis(self, value):
+        self._current_axis = value
+        self._version += 1
+
+    @property
+    def limit(self):
+        return self._limit
+
+    @limit.setter
+    def limit(self, value):
+        self._limit = value
+        self._version += 1
+
+    @property
+    def mimic(self):
+        return self._mimic
+
+    @mimic.setter
+    def mimic(self, value):
+        self._mimic = value
+        self._version += 1
+
+    def _state_version(self):
+        """Version of the kinematic properties of the joint, including its limits."""
+        return self._version, self._limit._version if self._limit is not None else -1
 
     def get_urdf_element(self):
         attributes = {"name": self.name, "type": self.type.urdf_name}
@@ -588,6 +652,7 @@ class Joint(Data):
         """
         self.current_origin.transform(transformation)
         self.current_axis.transform(transformation)
+        self._version += 1
 
     def _create(self, transformation: Transformation) -> None:
         """Internal method to initialize the transformation tree.
@@ -599,6 +664,7 @@ class Joint(Data):
 
         """
         self.current_origin = self.origin.transformed(transformation)
+        self.current_axis = self.axis.copy()
         self.current_axis.transform(self.current_transformation)
 
     def calculate_revolute_transformation(self, position: float) -> Rotation:
@@ -736,6 +802,7 @@ class Joint(Data):
             Scale factor.
         """
         self.current_origin.scale(factor)
+        self._version += 1
         if self.is_scalable():
             self.limit.scale(factor)
 
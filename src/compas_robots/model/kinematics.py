@@ -0,0 +1,966 @@
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING
+
+import numpy as np
+from compas.geometry import Frame
+from compas.geometry import Transformation
+
+from compas_robots import Configuration
+
+from .joint import Joint
+
+if TYPE_CHECKING:
+    from typing import Optional
+    from typing import Union
+
+    from compas_robots import RobotModel
+    from compas_robots import ToolModel
+
+
+def _joint_versions(joints):
+    return [joint._state_version() for joint in joints]
+
+
+class KinematicChain(object):
+    """Precompiled kinematic chain between a base link and a tip link of a robot model.
+
+    The chain stores the origins, axes, types, limits and mimic relations of the joints
+    on the path from base to tip in flat arrays, so that evaluating the pose of the tip
+    only touches the joints that actually affect it.
+
+    Like [RobotModel.compute_transformations][compas_robots.RobotModel.compute_transformations],
+    the chain works on the world-relative rest pose of the joints (`current_origin` and `current_axis`),
+    and joints upstream of the base link are considered to be at rest.
+    Poses of the tip are therefore expressed in the world coordinate system, not relative to the base link.
+    The chain is a snapshot of the model. Chains obtained from
+    [RobotModel.get_kinematic_chain][compas_robots.RobotModel.get_kinematic_chain] are rebuilt
+    when joints are modified through their attributes, limits or [Joint.transform][compas_robots.model.Joint.transform].
+
+    Parameters
+    ----------
+    joints
+        The joints of the chain, ordered from base to tip.
+        The joints may also span a whole tree, as long as every joint comes after the joint of its parent link,
+        in which case the tip is the child link of the last joint.
+    tip_frame
+        Rest frame of the tip link. Defaults to the current origin of the last joint of the chain.
+
+    Attributes
+    ----------
+    joint_names : list[str]
+        Names of all joints of the chain, ordered from base to tip.
+    joint_types : numpy.ndarray
+        Types of all joints of the chain.
+    configurable_joint_names : list[str]
+        Names of the configurable joints of the chain.
+
+    Examples
+    --------
+    >>> robot = compas_robots.RobotModel.ur5()
+    >>> chain = KinematicChain.from_robot_model(robot, "world", "ee_link")
+    >>> chain.configurable_joint_names
+    ['shoulder_pan_joint', 'shoulder_lift_joint', 'elbow_joint', 'wrist_1_joint', 'wrist_2_joint', 'wrist_3_joint']
+    >>> frame = chain.forward_kinematics(robot.zero_configuration())
+    >>> frame.point
+    Point(x=0.817, y=0.191, z=-0.005)
+
+    """
+
+    def __init__(self, joints: list[Joint], tip_frame: Optional[Frame] = None) -> None:
+        super(KinematicChain, self).__init__()
+        joints = list(joints)
+        count = len(joints)
+        self._joints = joints
+        self._versions = _joint_versions(joints)
+
+        self.joint_names = [joint.name for joint in joints]
+        self.joint_types = np.array([int(joint.type) for joint in joints], dtype=int)
+        self.configurable_joint_names = [joint.name for joint in joints if joint.is_configurable()]
+
+        self._parents = np.full(count, -1, dtype=int)
+        self._origins = np.zeros((count, 4, 4))
+        self._axes = np.zeros((count, 3))
+        self._points = np.zeros((count, 3))
+        self._lower = np.zeros(count)
+        self._upper = np.zeros(count)
+        self._has_limit = np.zeros(count, dtype=bool)
+        self._mimic_joints = [None] * count
+        self._mimic_multipliers = np.ones(count)
+        self._mimic_offsets = np.zeros(count)
+
+        index_by_child_link = {}
+        for i, joint in enumerate(joints):
+            self._parents[i] = index_by_child_link.get(joint.parent.link, -1)
+            index_by_child_link[joint.child.link] = i
+            self._origins[i] = _matrix_from_frame(joint.current_origin)
+            self._axes[i] = joint.current_axis.vector
+            self._points[i] = joint.current_origin.point
+            if joint.limit:
+                self._has_limit[i] = True
+                self._lower[i] = joint.limit.lower
+                self._upper[i] = joint.limit.upper
+            if joint.mimic:
+                self._mimic_joints[i] = joint.mimic.joint
+                self._mimic_multipliers[i] = joint.mimic.multiplier
+                self._mimic_offsets[i] = joint.mimic.offset
+
+        revolute = np.isin(self.joint_types, (Joint.REVOLUTE, Joint.CONTINUOUS))
+        prismatic = self.joint_types == Joint.PRISMATIC
+        self._revolute = revolute
+        self._prismatic = prismatic
+        self._clamped = np.isin(self.joint_types, (Joint.REVOLUTE, Joint.PRISMATIC))
+        self._unsupported = np.isin(self.joint_types, (Joint.FLOATING, Joint.PLANAR))
+
+        # Cross-product matrices of the rotation axes, zero for everything but revolute joints,
+        # so that the rotation part of all other joints collapses to the identity.
+        x, y, z = self._axes.T
+        zero = np.zeros(count)
+        cross = np.stack([zero, -z, y, z, zero, -x, -y, x, zero], axis=-1).reshape(count, 3, 3)
+        self._cross = cross * revolute[:, None, None]
+        self._cross_squared = np.matmul(self._cross, self._cross)
+        self._slides = self._axes * prismatic[:, None]
+
+        # Indices of the joints that move the tip, from base to tip
+        path = []
+        index = count - 1
+        while index >= 0:
+            path.append(index)
+            index = self._parents[index]
+        self._tip_path = np.array(path[::-1], dtype=int)
+
+        if tip_frame is None and joints:
+            tip_frame = joints[-1].current_origin
+        self._tip_matrix = _matrix_from_frame(tip_frame) if tip_frame else np.identity(4)
+
+    @classmethod
+    def from_robot_model(cls, robot: RobotModel, link_start_name: Optional[str] = None, link_end_name: Optional[str] = None) -> KinematicChain:
+        """Compile the chain of joints between a pair of start and end links of a robot model.
+
+        Parameters
+        ----------
+        robot
+            The robot model.
+        link_start_name
+            Name of the base link of the chain. Defaults to the root link name.
+        link_end_name
+            Name of the tip link of the chain. Defaults to the last link's name.
+
+        Returns
+        -------
+        KinematicChain
+            The compiled chain.
+
+        """
+        link_names = list(robot.iter_chain(link_start_name, link_end_name))
+        tip_link = robot.get_link_by_name(link_names[-1])
+        tip_frame = tip_link.parent_joint.current_origin if tip_link and tip_link.parent_joint else None
+        joints = [joint for joint in map(robot.get_joint_by_name, link_names) if joint]
+        return cls(joints, tip_frame)
+
+    def __len__(self):
+        return len(self.joint_names)
+
+    def _is_current(self):
+        """Check whether none of the joints of the chain was modified since the chain was compiled."""
+        return _joint_versions(self._joints) == self._versions
+
+    def joint_positions(self, joint_state: Union[Configuration, dict[str, float]]) -> tuple[np.ndarray, np.ndarray]:
+        """Resolve the positions of the joints of the chain from a joint state.
+
+        Joints that are not part of the joint state follow the joint they mimic, if any.
+        Positions are clamped to the joint limits, as in [Joint.calculate_transformation][compas_robots.model.Joint.calculate_transformation].
+
+        Parameters
+        ----------
+        joint_state
+            A configuration instance or a dictionary with joint names and joint values in radians and
+            meters (depending on the joint type).
+
+        Returns
+        -------
+        tuple[numpy.ndarray, numpy.ndarray]
+            The position of each joint of the chain, and a mask of the joints that have a position.
+            Joints without a position stay at rest.
+
+        """
+        values = dict(joint_state.items())
+        count = len(self.joint_names)
+        positions = np.zeros(count)
+        active = np.zeros(count, dtype=bool)
+
+        for i, name in enumerate(self.joint_names):
+            if name in values:
+                positions[i] = values[name]
+                active[i] = True
+            elif self._mimic_joints[i] in values:
+                positions[i] = self._mimic_multipliers[i] * values[self._mimic_joints[i]] + self._mimic_offsets[i]
+                active[i] = True
+
+        return self._clamp(positions, active), active
+
+    def joint_positions_batch(self, joint_values: np.ndarray, joint_names: Optional[list[str]] = None) -> tuple[np.ndarray, np.ndarray]:
+        """Resolve the positions of the joints of the chain from an array of joint values.
+
+        Parameters
+        ----------
+        joint_values
+            An (N, m) array with one set of joint values per row.
+        joint_names
+            The m joint names of the columns of `joint_values`.
+            Defaults to [configurable_joint_names][compas_robots.model.KinematicChain.configurable_joint_names].
+
+        Returns
+        -------
+        tuple[numpy.ndarray, numpy.ndarray]
+            The (N, n) positions of the joints of the chain, and a mask of the n joints that have a position.
+
+        Raises
+        ------
+        ValueError
+            If the number of columns does not match the number of joint names.
+
+        """
+        joint_names = self.configurable_joint_names if joint_names is None else list(joint_names)
+        joint_values = np.atleast_2d(np.asarray(joint_values, dtype=float))
+        if joint_values.shape[-1] != len(joint_names):
+            raise ValueError("Expected {} joint values per row, but {} given.".format(len(joint_names), joint_values.shape[-1]))
+
+        columns, multipliers, offsets, active = self._map_columns(joint_names)
+        if not len(joint_names):
+            return np.zeros((joint_values.shape[0], len(self.joint_names))), active
+
+        positions = joint_values[:, columns] * multipliers + offsets
+        return self._clamp(positions, active), active
+
+    def compute_matrix(self, joint_state: Union[Configuration, dict[str, float]]) -> np.ndarray:
+        """Calculate the 4x4 transformation matrix of the tip of the chain.
+
+        Parameters
+        ----------
+        joint_state
+            A configuration instance or a dictionary with joint names and joint values in radians and
+            meters (depending on the joint type).
+
+        Returns
+        -------
+        numpy.ndarray
+            The 4x4 pose matrix of the tip link in the world coordinate system, with the joints upstream of the base at rest.
+
+        """
+        positions, active = self.joint_positions(joint_state)
+        return self._tip_matrices(positions[None, :], active)[0]
+
+    def compute_matrices(self, joint_values: np.ndarray, joint_names: Optional[list[str]] = None) -> np.ndarray:
+        """Calculate the 4x4 transformation matrices of the tip of the chain for many sets of joint values.
+
+        Parameters
+        ----------
+        joint_values
+            An (N, m) array with one set of joint values per row.
+        joint_names
+            The m joint names of the columns of `joint_values`.
+            Defaults to [configurable_joint_names][compas_robots.model.KinematicChain.configurable_joint_names].
+
+        Returns
+        -------
+        numpy.ndarray
+            An (N, 4, 4) array of pose matrices of the tip link in the world coordinate system,
+            with the joints upstream of the base at rest.
+
+        Examples
+        --------
+        >>> robot = compas_robots.RobotModel.ur5()
+        >>> chain = robot.get_kinematic_chain("world", "ee_link")
+        >>> chain.compute_matrices(np.zeros((10, 6))).shape
+        (10, 4, 4)
+
+        """
+        positions, active = self.joint_positions_batch(joint_values, joint_names)
+        return self._tip_matrices(positions, active)
+
+    def compute_joint_matrices(self, joint_values: np.ndarray, joint_names: Optional[list[str]] = None) -> np.ndarray:
+        """Calculate the 4x4 transformation matrices of the child link frames of all joints for many sets of joint values.
+
+        Parameters
+        ----------
+        joint_values
+            An (N, m) array with one set of joint values per row.
+        joint_names
+            The m joint names of the columns of `joint_values`.
+            Defaults to [configurable_joint_names][compas_robots.model.KinematicChain.configurable_joint_names].
+
+        Returns
+        -------
+        numpy.ndarray
+            An (N, n, 4, 4) array of pose matrices, in the order of [joint_names][compas_robots.model.KinematicChain.joint_names].
+
+        """
+        positions, active = self.joint_positions_batch(joint_values, joint_names)
+        matrices = self._motion_matrices(positions)
+
+        for i, parent in enumerate(self._parents):
+            if parent >= 0:
+                matrices[:, i] = matrices[:, parent] @ matrices[:, i]
+
+        # The motions are accumulated, now place the rest frames of the child links
+        return matrices @ self._origins
+
+    def forward_kinematics(self, joint_state: Union[Configuration, dict[str, float]]) -> Frame:
+        """Calculate the frame of the tip of the chain.
+
+        Parameters
+        ----------
+        joint_state
+            A configuration instance or a dictionary with joint names and joint values in radians and
+            meters (depending on the joint type).
+
+        Returns
+        -------
+        Frame
+            The frame of the tip link in the world coordinate system, with the joints upstream of the base at rest.
+
+        """
+        return _frame_from_matrix(self.compute_matrix(joint_state))
+
+    def jacobian(self, joint_state: Union[Configuration, dict[str, float]], joint_names: Optional[list[str]] = None) -> np.ndarray:
+        """Calculate the geometric Jacobian of the tip of the chain.
+
+        The first three rows map joint velocities to the linear velocity of the origin of the tip link,
+        the last three to its angular velocity, both expressed in the world coordinate system.
+        Like the poses of the chain, the Jacobian is evaluated with the joints upstream of the base at rest.
+        Mimicking joints contribute to the column of the joint they mimic.
+
+        Parameters
+        ----------
+        joint_state
+            A configuration instance or a dictionary with joint names and joint values in radians and
+            meters (depending on the joint type).
+        joint_names
+            The m joint names of the columns of the Jacobian.
+            Defaults to [configurable_joint_names][compas_robots.model.KinematicChain.configurable_joint_names].
+
+        Returns
+        -------
+        numpy.ndarray
+            The 6xm Jacobian, with columns ordered like `joint_names`.
+
+        Examples
+        --------
+        >>> robot = compas_robots.RobotModel.ur5()
+        >>> chain = robot.get_kinematic_chain("world", "ee_link")
+        >>> chain.jacobian(robot.zero_configuration()).shape
+        (6, 6)
+
+        """
+        joint_names = self.configurable_joint_names if joint_names is None else list(joint_names)
+        positions, active = self.joint_positions(joint_state)
+        columns, multipliers, _, mapped = self._map_columns(joint_names)
+        return self._jacobians(positions[None, :], active, columns, multipliers, mapped, len(joint_names))[0]
+
+    def jacobian_batch(self, joint_values: np.ndarray, joint_names: Optional[list[str]] = None) -> np.ndarray:
+        """Calculate the geometric Jacobians of the tip of the chain for many sets of joint values.
+
+        Parameters
+        ----------
+        joint_values
+            An (N, m) array with one set of joint values per row.
+        joint_names
+            The m joint names of the columns of `joint_values`.
+            Defaults to [configurable_joint_names][compas_robots.model.KinematicChain.configurable_joint_names].
+
+        Returns
+        -------
+        numpy.ndarray
+            An (N, 6, m) array of Jacobians in the world coordinate system, with columns ordered like `joint_names`.
+            Columns of joints that are not part of the chain are zero.
+
+        """
+        joint_names = self.configurable_joint_names if joint_names is None else list(joint_names)
+        positions, active = self.joint_positions_batch(joint_values, joint_names)
+        columns, multipliers, _, mapped = self._map_columns(joint_names)
+        return self._jacobians(positions, active, columns, multipliers, mapped, len(joint_names))
+
+    def _map_columns(self, joint_names):
+        """Map every joint of the chain to a column of joint values, following mimic relations."""
+        column_by_name = {name: i for i, name in enumerate(joint_names)}
+        count = len(self.joint_names)
+        columns = np.zeros(count, dtype=int)
+        multipliers = np.ones(count)
+        offsets = np.zeros(count)
+        mapped = np.zeros(count, dtype=bool)
+
+        for i, name in enumerate(self.joint_names):
+            if name in column_by_name:
+                columns[i] = column_by_name[name]
+                mapped[i] = True
+            elif self._mimic_joints[i] in column_by_name:
+                columns[i] = column_by_name[self._mimic_joints[i]]
+                multipliers[i] = self._mimic_multipliers[i]
+                offsets[i] = self._mimic_offsets[i]
+                mapped[i] = True
+
+        return columns, multipliers, offsets, mapped
+
+    def _jacobians(self, positions, active, columns, multipliers, mapped, column_count):
+        matrices = self._motion_matrices(positions)
+        count = positions.shape[0]
+        path = self._tip_path[active[self._tip_path]]
+
+        # Accumulate the motions along the path to the tip, recording the world axis and origin
+        # of every joint before it moves the rest of the chain
+        axes = np.zeros((count, len(path), 3))
+        points = np.zeros((count, len(path), 3))
+        matrix = np.broadcast_to(np.identity(4), (count, 4, 4))
+        for k, i in enumerate(path):
+            axes[:, k] = matrix[:, :3, :3] @ self._axes[i]
+            points[:, k] = matrix[:, :3, :3] @ self._points[i] + matrix[:, :3, 3]
+            matrix = matrix @ matrices[:, i]
+        tip = (matrix @ self._tip_matrix)[:, None, :3, 3]
+
+        revolute = self._revolute[path][:, None]
+        prismatic = self._prismatic[path][:, None]
+        linear = np.where(revolute, np.cross(axes, tip - points), axes * prismatic)
+        angular = axes * revolute
+        weights = (multipliers * mapped)[path][:, None]
+        motions = np.concatenate([linear, angular], axis=-1) * weights
+
+        jacobians = np.zeros((count, 6, column_count))
+        for k, i in enumerate(path):
+            if mapped[i]:
+                jacobians[:, :, columns[i]] += motions[:, k]
+        return jacobians
+
+    def _tip_matrices(self, positions, active):
+        matrices = self._motion_matrices(positions)
+
+        # Joints without a position are at rest and do not contribute to the product
+        matrix = np.broadcast_to(np.identity(4), (positions.shape[0], 4, 4))
+        for i in self._tip_path[active[self._tip_path]]:
+            matrix = matrix @ matrices[:, i]
+        return matrix @ self._tip_matrix
+
+    def _clamp(self, positions, active):
+        if np.any(self._unsupported & active):
+            raise NotImplementedError("Floating and planar joints are not supported")
+        if np.any(self._clamped & active & ~self._has_limit):
+            raise ValueError("Revolute and prismatic joints are required to define a limit")
+
+        clamped = np.where(self._clamped, np.clip(positions, self._lower, self._upper), positions)
+        return np.where(active, clamped, 0.0)
+
+    def _motion_matrices(self, positions):
+        """Vectorized 4x4 motion matrices of all joints for an (N, n) array of positions."""
+        sin = np.sin(positions)[..., None, None]
+        cos = np.cos(positions)[..., None, None]
+        rotations = np.identity(3) + sin * self._cross + (1.0 - cos) * self._cross_squared
+
+        # Rotations are about an axis through the joint origin, translations along the axis
+        translations = self._points - np.einsum("...ij,...j->...i", rotations, self._points)
+        translations = translations + self._slides * positions[..., None]
+
+        matrices = np.zeros(positions.shape + (4, 4))
+        matrices[..., :3, :3] = rotations
+        matrices[..., :3, 3] = translations
+        matrices[..., 3, 3] = 1.0
+        return matrices
+
+
+class ForwardKinematicsCache(object):
+    """Stateful forward kinematics of a robot model that only recomputes what changed.
+
+    The cache remembers the joint values of the last update. When some joint values
+    change, only the transformations of the subtrees below the changed joints are
+    recomputed; the transformations of all other joints are kept as the same objects.
+    The transformations are the same as the ones of
+    [compute_transformations][compas_robots.RobotModel.compute_transformations].
+
+    Use [RobotModel.get_forward_kinematics_cache][compas_robots.RobotModel.get_forward_kinematics_cache]
+    to get the cache of a robot model, which is reset whenever the structure or rest pose
+    of the model changes.
+
+    Parameters
+    ----------
+    robot
+        The robot model.
+
+    Attributes
+    ----------
+    transformations : dict[str, Transformation]
+        The transformation of each joint after the last update. Not to be modified.
+
+    Examples
+    --------
+    >>> robot = compas_robots.RobotModel.ur5()
+    >>> cache = ForwardKinematicsCache(robot)
+    >>> config = robot.zero_configuration()
+    >>> len(cache.update(config))
+    10
+    >>> config["wrist_3_joint"] = 1.0
+    >>> cache.update(config)
+    ['wrist_3_joint', 'ee_fixed_joint', 'wrist_3_link-tool0_fixed_joint']
+
+    """
+
+    def __init__(self, robot: RobotModel) -> None:
+        super(ForwardKinematicsCache, self).__init__()
+        self.robot = robot
+        self.reset()
+
+    @property
+    def transformations(self) -> dict[str, Transformation]:
+        return self._transformations
+
+    def reset(self) -> None:
+        """Forget all joint values and transformations, so that the next update recomputes everything."""
+        self._joints = None
+        self._transformations = {}
+        self._local_transformations = {}
+        self._positions = {}
+        self._parent_transformation = None
+        self._versions = None
+
+    def update(self, joint_state: Union[Configuration, dict[str, float]], parent_transformation: Optional[Transformation] = None) -> list[str]:
+        """Update the transformations to a new joint state.
+
+        Parameters
+        ----------
+        joint_state
+            A configuration instance or a dictionary with joint names and joint values in radians and
+            meters (depending on the joint type).
+        parent_transformation
+            The transformation of the root link. Defaults to the identity matrix.
+
+        Returns
+        -------
+        list[str]
+            The names of the joints whose transformation changed, in the order of [iter_joints][compas_robots.RobotModel.iter_joints].
+
+        """
+        if self._joints is None:
+            self._joints = []
+            for joint in self.robot.iter_joints():
+                parent_link = self.robot.get_link_by_name(str(joint.parent))
+                parent_joint = parent_link.parent_joint if parent_link else None
+                self._joints.append((joint, parent_joint.name if parent_joint else None))
+
+        # Modified joints invalidate all transformations
+        versions = _joint_versions(joint for joint, _ in self._joints)
+        if versions != self._versions:
+            self._versions = versions
+            self._positions = {}
+            self._parent_transformation = None
+
+        if parent_transformation is None:
+            parent_transformation = Transformation()
+        root_changed = self._parent_transformation is None or parent_transformation.matrix != self._parent_transformation.matrix
+        if root_changed:
+            self._parent_transformation = parent_transformation
+
+        values = dict(joint_state.items())
+        changed = []
+        dirty = set()
+
+        for joint, parent_name in self._joints:
+            if joint.name in values:  # if passive/mimicking joint is in the joint_state, the transformation will be calculated according to this value
+                position = values[joint.name]
+            elif joint.mimic and joint.mimic.joint in values:
+                position = joint.mimic.calculate_position(values[joint.mimic.joint])
+            else:
+                position = None
+
+            moved = joint.name not in self._positions or self._positions[joint.name] != position
+            if moved:
+                self._positions[joint.name] = position
+                self._local_transformations[joint.name] = None if position is None else joint.calculate_transformation(position)
+
+            if parent_name is None:
+                parent_changed = root_changed
+                parent = self._parent_transformation
+            else:
+                parent_changed = parent_name in dirty
+                parent = self._transformations[parent_name]
+
+            if moved or parent_changed:
+                local_transformation = self._local_transformations[joint.name]
+                self._transformations[joint.name] = parent if local_transformation is None else parent * local_transformation
+                dirty.add(joint.name)
+                changed.append(joint.name)
+
+        return changed
+
+
+class InverseKinematicsResult(object):
+    """Outcome of an inverse kinematics query.
+
+    Attributes
+    ----------
+    configuration : Configuration | None
+        The solution closest to the start configuration, or `None` if no attempt converged.
+    solutions : list[Configuration]
+        The solutions of all converged attempts, closest to the start configuration first.
+    success : bool
+        `True` if at least one attempt converged.
+    position_error : float
+        Remaining position error of the best attempt, in meters.
+    orientation_error : float
+        Remaining orientation error of the best attempt, in radians.
+    iterations : int
+        Number of iterations of the best attempt.
+    total_iterations : int
+        Number of iterations summed over all attempts.
+    attempts : int
+        Number of attempts, i.e. the start configuration and the random restarts.
+    elapsed_time : float
+        Wall-clock time of the query, in seconds.
+
+    """
+
+    def __init__(self):
+        super(InverseKinematicsResult, self).__init__()
+        self.configuration = None
+        self.solutions = []
+        self.position_error = float("inf")
+        self.orientation_error = float("inf")
+        self.iterations = 0
+        self.total_iterations = 0
+        self.attempts = 0
+        self.elapsed_time = 0.0
+
+    @property
+    def success(self):
+        return self.configuration is not None
+
+    def __str__(self):
+        return "InverseKinematicsResult(success={}, attempts={}, iterations={}, elapsed_time={:.6f})".format(
+            self.success,
+            self.attempts,
+            self.iterations,
+            self.elapsed_time,
+        )
+
+
+class InverseKinematicsSolver(object):
+    """Numerical inverse kinematics solver for a link of a robot model.
+
+    The solver runs a Levenberg-Marquardt iteration, i.e. a damped least-squares
+    step whose damping adapts to the progress of every attempt, on the
+    [KinematicChain][compas_robots.model.KinematicChain] from the root to the link.
+    The start configuration and any number of random restarts are solved together
+    as one vectorized batch. Joint values are kept within the joint limits and
+    mimicking joints follow the joints they mimic.
+
+    Parameters
+    ----------
+    robot
+        The robot model.
+    link_name
+        The name of the link to solve for.
+        Defaults to the link the tool is connected to, or to the end-effector link.
+    tool
+        A tool attached to the link. If given, target frames refer to the tool coordinate frame (TCF).
+    max_iterations
+        Maximum number of iterations per attempt.
+    position_tolerance
+        Position tolerance of a solution, in meters.
+    orientation_tolerance
+        Orientation tolerance of a solution, in radians.
+    damping
+        Initial damping factor of the least-squares step.
+
+    Examples
+    --------
+    >>> robot = compas_robots.RobotModel.ur5()
+    >>> config = robot.zero_configuration()
+    >>> config["shoulder_lift_joint"] = -1.0
+    >>> config["elbow_joint"] = 1.5
+    >>> config["wrist_2_joint"] = 1.0
+    >>> frame = robot.forward_kinematics(config)
+    >>> solver = InverseKinematicsSolver(robot)
+    >>> result = solver.solve(frame, start_configuration=robot.zero_configuration(), attempts=20, random_seed=0)
+    >>> result.success
+    True
+    >>> robot.forward_kinematics(result.configuration).point.distance_to_point(frame.point) < 1e-4
+    True
+
+    """
+
+    def __init__(
+        self,
+        robot: RobotModel,
+        link_name: Optional[str] = None,
+        tool: Optional[ToolModel] = None,
+        max_iterations: int = 100,
+        position_tolerance: float = 1e-5,
+        orientation_tolerance: float = 1e-4,
+        damping: float = 1e-2,
+    ) -> None:
+        super(InverseKinematicsSolver, self).__init__()
+        if link_name is None:
+            link_name = tool.connected_to if tool and tool.connected_to else robot.get_end_effector_link_name()
+
+        self.robot = robot
+        self.link_name = link_name
+        self.tool = tool
+        self.max_iterations = max_iterations
+        self.position_tolerance = position_tolerance
+        self.orientation_tolerance = orientation_tolerance
+        self.damping = damping
+
+        joints = robot.get_configurable_joints()
+        self.joint_names = [joint.name for joint in joints]
+        self.joint_types = [joint.type for joint in joints]
+        self._chain = robot.get_kinematic_chain(robot.root.name, link_name)
+        self._tool_inverse = np.linalg.inv(_matrix_from_frame(tool.frame)) if tool else np.identity(4)
+
+        bounded = [joint.limit is not None and joint.type in (Joint.REVOLUTE, Joint.PRISMATIC) for joint in joints]
+        self._lower = np.array([joint.limit.lower if bound else -np.inf for joint, bound in zip(joints, bounded)])
+        self._upper = np.array([joint.limit.upper if bound else np.inf for joint, bound in zip(joints, bounded)])
+        self._sample_lower = np.where(bounded, self._lower, -np.pi)
+        self._sample_upper = np.where(bounded, self._upper, np.pi)
+
+    def solve(
+        self,
+        frame: Frame,
+        start_configuration: Optional[Configuration] = None,
+        attempts: int = 1,
+        random_seed: Optional[int] = None,
+    ) -> InverseKinematicsResult:
+        """Solve the inverse kinematics for a target frame.
+
+        Parameters
+        ----------
+        frame
+            The target frame in the world coordinate system.
+        start_configuration
+            The configuration of the first attempt. Defaults to the zero configuration.
+        attempts
+            Total number of attempts. All but the first start from a random configuration within the joint limits.
+        random_seed
+            Seed of the random restarts.
+
+        Returns
+        -------
+        InverseKinematicsResult
+            The solutions and statistics of the query.
+
+        """
+        return self.solve_batch([frame], start_configuration, attempts, random_seed)[0]
+
+    def solve_batch(
+        self,
+        frames: list[Frame],
+        start_configuration: Optional[Configuration] = None,
+        attempts: int = 1,
+        random_seed: Optional[int] = None,
+    ) -> list[InverseKinematicsResult]:
+        """Solve the inverse kinematics for many target frames at once.
+
+        Parameters
+        ----------
+        frames
+            The target frames in the world coordinate system.
+        start_configuration
+            The configuration of the first attempt of every target. Defaults to the zero configuration.
+        attempts
+            Number of attempts per target. All but the first start from a random configuration within the joint limits.
+        random_seed
+            Seed of the random restarts.
+
+        Returns
+        -------
+        list[InverseKinematicsResult]
+            The solutions and statistics of each query, in the order of `frames`.
+
+        """
+        start_time = time.perf_counter()
+        attempts = max(1, int(attempts))
+        frame_count = len(frames)
+
+        start = np.array(self._start_values(start_configuration))
+        seeds = np.random.default_rng(random_seed).uniform(self._sample_lower, self._sample_upper, (frame_count, attempts, len(start)))
+        seeds[:, 0] = start
+        seeds = np.clip(seeds, self._lower, self._upper).reshape(-1, len(start))
+
+        targets = np.array([_matrix_from_frame(frame) @ self._tool_inverse for frame in frames])
+        targets = np.repeat(targets, attempts, axis=0)
+
+        values, errors, iterations = self._iterate(seeds, targets)
+        elapsed_time = time.perf_counter() - start_time
+
+        position_errors = np.linalg.norm(errors[:, :3], axis=-1).reshape(frame_count, attempts)
+        orientation_errors = np.linalg.norm(errors[:, 3:], axis=-1).reshape(frame_count, attempts)
+        converged = (position_errors <= self.position_tolerance) & (orientation_errors <= self.orientation_tolerance)
+        values = values.reshape(frame_count, attempts, -1)
+        iterations = iterations.reshape(frame_count, attempts)
+
+        results = []
+        for i in range(frame_count):
+            result = InverseKinematicsResult()
+            result.attempts = attempts
+            result.total_iterations = int(iterations[i].sum())
+            result.elapsed_time = elapsed_time / frame_count
+
+            # Prefer converged attempts close to the start configuration
+            distances = np.abs(values[i] - start).max(axis=-1)
+            errors = position_errors[i] + orientation_errors[i]
+            order = sorted(range(attempts), key=lambda k: (not converged[i, k], distances[k] if converged[i, k] else errors[k]))
+            best = order[0]
+
+            result.solutions = [self._configuration(values[i, k]) for k in order if converged[i, k]]
+            result.configuration = result.solutions[0] if result.solutions else None
+            result.position_error = float(position_errors[i, best])
+            result.orientation_error = float(orientation_errors[i, best])
+            result.iterations = int(iterations[i, best])
+            results.append(result)
+
+        return results
+
+    def _start_values(self, start_configuration):
+        if start_configuration is None:
+            start_configuration = self.robot.zero_configuration()
+        values = dict(start_configuration.items())
+        return [values.get(name, 0.0) for name in self.joint_names]
+
+    def _configuration(self, values):
+        return Configuration(values.tolist(), list(self.joint_types), list(self.joint_names))
+
+    def _errors(self, values, targets):
+        matrices = self._chain.compute_matrices(values, self.joint_names)
+        position = targets[:, :3, 3] - matrices[:, :3, 3]
+        orientation = _rotation_vectors(targets[:, :3, :3] @ np.swapaxes(matrices[:, :3, :3], -1, -2))
+        return np.concatenate([position, orientation], axis=-1)
+
+    def _converged(self, errors):
+        position = np.linalg.norm(errors[:, :3], axis=-1) <= self.position_tolerance
+        orientation = np.linalg.norm(errors[:, 3:], axis=-1) <= self.orientation_tolerance
+        return position & orientation
+
+    def _iterate(self, values, targets):
+        count = len(values)
+        errors = self._errors(values, targets)
+        norms = np.linalg.norm(errors, axis=-1)
+        damping = np.full(count, self.damping)
+        iterations = np.zeros(count, dtype=int)
+        running = ~self._converged(errors)
+
+        for _ in range(self.max_iterations):
+            indices = np.flatnonzero(running)
+            if not len(indices):
+                break
+
+            jacobians = self._chain.jacobian_batch(values[indices], self.joint_names)
+            transposed = np.swapaxes(jacobians, -1, -2)
+            damped = jacobians @ transposed + (damping[indices] ** 2)[:, None, None] * np.identity(6)
+            steps = transposed @ np.linalg.solve(damped, errors[indices][..., None])
+
+            candidates = np.clip(values[indices] + steps[..., 0], self._lower, self._upper)
+            candidate_errors = self._errors(candidates, targets[indices])
+            candidate_norms = np.linalg.norm(candidate_errors, axis=-1)
+            iterations[indices] += 1
+
+            # Accept steps that reduce the error and relax the damping, otherwise increase it
+            improved = candidate_norms < norms[indices]
+            accepted = indices[improved]
+            values[accepted] = candidates[improved]
+            errors[accepted] = candidate_errors[improved]
+            norms[accepted] = candidate_norms[improved]
+            damping[accepted] = np.maximum(damping[accepted] * 0.5, 1e-6)
+            damping[indices[~improved]] *= 4.0
+
+            running[indices] = ~self._converged(errors[indices]) & (damping[indices] < 1e3)
+
+        return values, errors, iterations
+
+
+def _matrix_from_frame(frame):
+    matrix = np.identity(4)
+    matrix[:3, 0] = frame.xaxis
+    matrix[:3, 1] = frame.yaxis
+    matrix[:3, 2] = frame.zaxis
+    matrix[:3, 3] = frame.point
+    return matrix
+
+
+def _frame_from_matrix(matrix):
+    return Frame(matrix[:3, 3].tolist(), matrix[:3, 0].tolist(), matrix[:3, 1].tolist())
+
+
+def _rotation_vectors(rotations):
+    """Axis-angle vectors of an (N, 3, 3) array of rotation matrices."""
+    skew = np.stack(
+        [
+            rotations[:, 2, 1] - rotations[:, 1, 2],
+            rotations[:, 0, 2] - rotations[:, 2, 0],
+            rotations[:, 1, 0] - rotations[:, 0, 1],
+        ],
+        axis=-1,
+    )
+    sine = 0.5 * np.linalg.norm(skew, axis=-1)
+    cosine = 0.5 * (np.trace(rotations, axis1=-2, axis2=-1) - 1.0)
+    angles = np.arctan2(sine, cosine)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        vectors = np.where((sine > 1e-9)[:, None], skew * (0.5 * angles / sine)[:, None], 0.5 * skew)
+
+    # Close to half a turn the skew part vanishes, take the axis from the symmetric part instead
+    flipped = (sine <= 1e-6) & (cosine < 0.0)
+    for i in np.flatnonzero(flipped):
+        symmetric = rotations[i] + np.identity(3)
+        column = symmetric[:, np.argmax(np.linalg.norm(symmetric, axis=0))]
+        vectors[i] = column / np.linalg.norm(column) * angles[i]
+    return vectors
+
+
+def manipulability(jacobian: np.ndarray) -> np.ndarray:
+    """Calculate the manipulability measure of one or many Jacobians.
+
+    The measure is the product of the singular values of the Jacobian, and it is zero at singularities.
+    For manipulators with at least 6 degrees of freedom, it equals `sqrt(det(J @ J.T))`.
+    For manipulators with fewer degrees of freedom, `J @ J.T` is always singular and the measure
+    equals `sqrt(det(J.T @ J))` instead.
+
+    Parameters
+    ----------
+    jacobian
+        A 6xm Jacobian or an (N, 6, m) array of Jacobians.
+
+    Returns
+    -------
+    float | numpy.ndarray
+        The manipulability of each Jacobian.
+
+    Examples
+    --------
+    >>> robot = compas_robots.RobotModel.ur5()
+    >>> config = robot.zero_configuration()
+    >>> config["elbow_joint"] = 1.0
+    >>> float(manipulability(robot.jacobian(config))) > 0
+    True
+
+    """
+    singular_values = np.linalg.svd(jacobian, compute_uv=False)
+    return np.prod(singular_values, axis=-1)
+
+
+def condition_number(jacobian: np.ndarray) -> np.ndarray:
+    """Calculate the condition number of one or many Jacobians.
+
+    The condition number is the ratio between the largest and the smallest singular value
+    of the Jacobian. It is infinite at singularities.
+
+    Parameters
+    ----------
+    jacobian
+        A 6xm Jacobian or an (N, 6, m) array of Jacobians.
+
+    Returns
+    -------
+    float | numpy.ndarray
+        The condition number of each Jacobian.
+
+    """
+    singular_values = np.linalg.svd(jacobian, compute_uv=False)
+    with np.errstate(divide="ignore"):
+        return singular_values[..., 0] / singular_values[..., -1]
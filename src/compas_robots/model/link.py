@@ -343,7 +343,7 @@ class Collision(LinkItem):
             geometry=LinkGeometry.__from_data__(data["geometry"]),
             origin=Frame.__from_data__(data["origin"]) if data["origin"] else None,
             name=data["name"],
-            attr=_attr_from_data(data["attr"]),
+            **_attr_from_data(data["attr"]),
         )
 
         if data["init_transformation"]:
@@ -1,15 +1,21 @@
 from __future__ import annotations
 
+import asyncio
+import collections
+import functools
 import itertools
 import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING
 
+import numpy as np
 from compas.colors import Color
 from compas.data import Data
 from compas.datastructures import Mesh
 from compas.geometry import Frame
 from compas.geometry import Transformation
-from compas.topology import shortest_path
 
 import compas_robots
 from compas_robots import Configuration
@@ -29,6 +35,9 @@ from .geometry import Texture
 from .joint import Axis
 from .joint import Joint
 from .joint import Limit
+from .kinematics import ForwardKinematicsCache
+from .kinematics import InverseKinematicsSolver
+from .kinematics import KinematicChain
 from .link import Collision
 from .link import Link
 from .link import Visual
@@ -42,9 +51,66 @@ if TYPE_CHECKING:
     from compas.geometry import Shape
     from compas.geometry import Vector
 
+    from compas_robots import ToolModel
+    from compas_robots.model import InverseKinematicsResult
     from compas_robots.resources import AbstractMeshLoader
 
 
+def _load_mesh_file(loaders, filename, precision):
+    # Module-level, so that it can also be sent to a process pool
+    start = time.perf_counter()
+    meshes = None
+    for loader in loaders:
+        if loader.can_load_mesh(filename):
+            meshes = loader.load_meshes(filename, precision=precision)
+            break
+    return meshes, time.perf_counter() - start
+
+
+class _LazyMeshResolver(object):
+    """Loads the meshes of a file the first time they are requested.
+
+    A file is loaded only once, also if it is requested by several descriptors or threads at the same time."""
+
+    def __init__(self, loaders, precision, references):
+        self.loaders = loaders
+        self.precision = precision
+        self.references = references
+        self._loaded = {}
+        self._locks = {}
+        self._lock = threading.Lock()
+
+    def resolve(self, filename):
+        with self._lock:
+            lock = self._locks.setdefault(filename, threading.Lock())
+
+        with lock:
+            meshes = self._loaded.get(filename)
+            if meshes is None:
+                meshes, _ = _load_mesh_file(self.loaders, filename, self.precision)
+                if not meshes:
+                    raise Exception("Unable to load meshes for {}".format(filename))
+                self._loaded[filename] = meshes
+
+        return meshes, self.references[filename] > 1
+
+
+async def _load_mesh_file_async(loaders, filename, precision, semaphore):
+    async with semaphore:
+        start = time.perf_counter()
+        meshes = None
+        for loader in loaders:
+            if loader.can_load_mesh(filename):
+                if hasattr(loader, "load_meshes_async"):
+                    meshes = await loader.load_meshes_async(filename, precision=precision)
+                else:
+                    # Loaders that do not implement the loader interface are adapted here too
+                    load = functools.partial(loader.load_meshes, filename, precision=precision)
+                    meshes = await asyncio.get_running_loop().run_in_executor(None, load)
+                break
+        return meshes, time.perf_counter() - start
+
+
 class RobotModel(Data):
     """RobotModel is the root element of the model.
 
@@ -79,6 +145,7 @@ class RobotModel(Data):
         self.materials = list(materials or [])
         self.attr = kwargs
         self.root = None
+        self._forward_kinematics_cache = None
         self._rebuild_tree()
         self._create(self.root, Transformation())
         self._scale_factor = 1.0
@@ -128,13 +195,21 @@ class RobotModel(Data):
 
     def _rebuild_tree(self):
         """Store tree structure from link and joint lists."""
+        self._clear_caches()
         self._adjacency = dict()
         self._links = dict()
         self._joints = dict()
+        self._children_joints = dict()
+        self._parent_joints = dict()
+
+        # Index joints by parent and child link names in a single pass
+        for joint in self.joints:
+            self._children_joints.setdefault(str(joint.parent), []).append(joint)
+            self._parent_joints.setdefault(str(joint.child), joint)
 
         for link in self.links:
-            link.joints = self.find_children_joints(link)
-            link.parent_joint = self.find_parent_joint(link)
+            link.joints = list(self._children_joints.get(link.name, []))
+            link.parent_joint = self._parent_joints.get(link.name)
 
             self._links[link.name] = link
             self._adjacency[link.name] = [joint.name for joint in link.joints]
@@ -144,19 +219,64 @@ class RobotModel(Data):
 
         for joint in self.joints:
             child_name = joint.child.link
-            joint.child_link = self.get_link_by_name(child_name)
+            joint.child_link = self._links.get(child_name)
 
             self._joints[joint.name] = joint
             self._adjacency[joint.name] = [child_name]
 
+    def _clear_caches(self):
+        """Discard cached data derived from the structure of the model."""
+        self._link_order = None
+        self._joint_order = None
+        self._chain_parents = None
+        self._chains = {}
+        self._clear_kinematic_caches()
+
+    def _clear_kinematic_caches(self):
+        """Discard cached data derived from the rest pose of the model."""
+        self._kinematic_chains = {}
+        self._kinematic_tree = None
+        if self._forward_kinematics_cache:
+            self._forward_kinematics_cache.reset()
+
+    def _get_link_order(self, link=None):
+        """Links of the subtree starting at `link` in depth-first order, cached for the root link."""
+        if link is not None and link is not self.root:
+            return self._traverse(link)[0]
+        if self._link_order is None:
+            self._link_order, self._joint_order = self._traverse(self.root) if self.root else ([], [])
+        return self._link_order
+
+    def _get_joint_order(self, link=None):
+        """Joints of the subtree starting at `link`, each link's children joints first, cached for the root link."""
+        if link is not None and link is not self.root:
+            return self._traverse(link)[1]
+        if self._joint_order is None:
+            self._link_order, self._joint_order = self._traverse(self.root) if self.root else ([], [])
+        return self._joint_order
+
+    @staticmethod
+    def _traverse(link):
+        links = []
+        joints = []
+        stack = [link]
+        while stack:
+            link = stack.pop()
+            links.append(link)
+            joints += link.joints
+            stack += [joint.child_link for joint in reversed(link.joints) if joint.child_link]
+        return links, joints
+
     @classmethod
-    def from_urdf_file(cls, file: Union[str, IO]) -> RobotModel:
+    def from_urdf_file(cls, file: Union[str, IO], keep_source: bool = True) -> RobotModel:
         """Construct a robot model from a URDF file model description.
 
         Parameters
         ----------
         file
             File path or file-like object.
+        keep_source
+            If `False`, the parsed objects do not keep a reference to the XML element they were created from.
 
         Returns
         -------
@@ -170,7 +290,7 @@ class RobotModel(Data):
         Robot name=ur5, Links=11, Joints=10 (6 configurable)
 
         """
-        urdf = URDF.from_file(file)
+        urdf = URDF.from_file(file, streaming=True, keep_source=keep_source)
         return urdf.robot
 
     def to_urdf_file(self, file: Union[str, IO], prettify: bool = False) -> None:
@@ -188,13 +308,15 @@ class RobotModel(Data):
         urdf.to_file(file, prettify)
 
     @classmethod
-    def from_urdf_string(cls, text: str) -> RobotModel:
+    def from_urdf_string(cls, text: str, keep_source: bool = True) -> RobotModel:
         """Construct a robot model from a URDF description as string.
 
         Parameters
         ----------
         text
             String containing the XML URDF model.
+        keep_source
+            If `False`, the parsed objects do not keep a reference to the XML element they were created from.
 
         Returns
         -------
@@ -207,7 +329,7 @@ class RobotModel(Data):
         >>> robot = RobotModel.from_urdf_string(urdf_string)
 
         """
-        urdf = URDF.from_string(text)
+        urdf = URDF.from_string(text, streaming=True, keep_source=keep_source)
         return urdf.robot
 
     @classmethod
@@ -271,11 +393,7 @@ class RobotModel(Data):
 
     def find_children_joints(self, link):
         """Returns a list of all children joints of the link."""
-        joints = []
-        for joint in self.joints:
-            if str(joint.parent) == link.name:
-                joints.append(joint)
-        return joints
+        return list(self._children_joints.get(link.name, []))
 
     def find_parent_joint(self, link: Link) -> Optional[Joint]:
         """Returns the parent joint of the link or None if not found.
@@ -298,10 +416,7 @@ class RobotModel(Data):
         'shoulder_pan_joint'
 
         """
-        for joint in self.joints:
-            if str(joint.child) == link.name:
-                return joint
-        return None
+        return self._parent_joints.get(link.name)
 
     def get_link_by_name(self, name: str) -> Optional[Link]:
         """Get a link in a robot model matching by its name.
@@ -364,18 +479,7 @@ class RobotModel(Data):
         ['world', 'base_link', 'shoulder_link', 'upper_arm_link', 'forearm_link', 'wrist_1_link', 'wrist_2_link', 'wrist_3_link', 'ee_link', 'tool0', 'base']
 
         """
-        # Return empty iterator if no root is found
-        if not self.root:
-            return iter([])
-
-        def func(cjoints, links):
-            for j in cjoints:
-                link = j.child_link
-                links.append(link)
-                links += func(link.joints, [])
-            return links
-
-        return iter(func(self.root.joints, [self.root]))
+        return iter(self._get_link_order())
 
     def iter_joints(self) -> Iterator[Joint]:
         """Iterator over the joints that starts with the root link's children joints.
@@ -393,15 +497,7 @@ class RobotModel(Data):
         'elbow_joint', 'wrist_1_joint', 'wrist_2_joint', 'wrist_3_joint', 'ee_fixed_joint', 'wrist_3_link-tool0_fixed_joint']
 
         """
-
-        def func(clink, joints):
-            cjoints = clink.joints
-            joints += cjoints
-            for j in cjoints:
-                joints += func(j.child_link, [])
-            return joints
-
-        return iter(func(self.root, []))
+        return iter(self._get_joint_order())
 
     def iter_link_chain(self, link_start_name: Optional[str] = None, link_end_name: Optional[str] = None) -> Iterator[Link]:
         """Iterator over the chain of links between a pair of start and end links.
@@ -494,6 +590,15 @@ class RobotModel(Data):
         ['world', 'world_joint', 'base_link', 'shoulder_pan_joint', 'shoulder_link', 'shoulder_lift_joint', 'upper_arm_link', 'elbow_joint', 'forearm_link']
 
         """
+        for name in self._get_chain(start, end):
+            yield name
+
+    def _get_chain(self, start=None, end=None):
+        """Names of the elements between start and end, memoized per pair until the structure changes."""
+        key = (start, end)
+        if key in self._chains:
+            return self._chains[key]
+
         if not start:
             if not self.root:
                 raise Exception("No root link found")
@@ -507,13 +612,54 @@ class RobotModel(Data):
                     end = link.name
                     break
 
-        shortest_chain = shortest_path(self._adjacency, start, end)
+        if self._chain_parents is None:
+            self._chain_parents = {child: name for name, children in self._adjacency.items() for child in children}
+
+        # In a tree the chain is unique, walk up the parent pointers from the end
+        chain = [end]
+        while chain[-1] != start:
+            parent = self._chain_parents.get(chain[-1])
+            if parent is None or len(chain) > len(self._chain_parents):
+                raise Exception("No chain found between the specified element")
+            chain.append(parent)
 
-        if not shortest_chain:
+        if end not in self._adjacency:
             raise Exception("No chain found between the specified element")
 
-        for name in shortest_chain:
-            yield name
+        self._chains[key] = chain = tuple(reversed(chain))
+        return chain
+
+    def get_kinematic_chain(self, link_start_name: Optional[str] = None, link_end_name: Optional[str] = None) -> KinematicChain:
+        """Get the precompiled kinematic chain between a pair of start and end links.
+
+        Chains are compiled once and cached until the structure of the model or one of the joints of the chain changes.
+
+        Parameters
+        ----------
+        link_start_name
+            Name of the base link of the chain. Defaults to the root link name.
+        link_end_name
+            Name of the tip link of the chain. Defaults to the last link's name.
+
+        Returns
+        -------
+        KinematicChain
+            The kinematic chain.
+
+        Examples
+        --------
+        >>> robot = RobotModel.ur5()
+        >>> chain = robot.get_kinematic_chain("base_link", "tool0")
+        >>> chain.joint_names
+        ['shoulder_pan_joint', 'shoulder_lift_joint', 'elbow_joint', 'wrist_1_joint', 'wrist_2_joint', 'wrist_3_joint', 'wrist_3_link-tool0_fixed_joint']
+
+        """
+        key = (link_start_name, link_end_name)
+        chain = self._kinematic_chains.get(key)
+        if chain is None or not chain._is_current():
+            chain = KinematicChain.from_robot_model(self, link_start_name, link_end_name)
+            self._kinematic_chains[key] = chain
+        return chain
 
     def get_configurable_joints(self) -> list[Joint]:
         """Returns the configurable joints.
@@ -697,9 +843,17 @@ class RobotModel(Data):
         joint_types = self.get_joint_types_by_names(joint_names)
         return Configuration(values, joint_types, joint_names)
 
-    def load_geometry(self, *resource_loaders: AbstractMeshLoader, **kwargs) -> None:
+    def load_geometry(self, *resource_loaders: AbstractMeshLoader, **kwargs) -> dict[str, float]:
         """Load external geometry resources, such as meshes.
 
+        Each mesh file is loaded only once, and elements that reference the same file share the same meshes.
+        See [MeshDescriptor.unshare_meshes][compas_robots.model.MeshDescriptor.unshare_meshes]
+        to modify the meshes of one element in place.
+
+        With `lazy=True`, the meshes of each element are only loaded when they are first accessed,
+        e.g. when it is drawn or checked for collisions. Combine it with the `visual` and `collision` options
+        to load some geometry up front and the rest on demand.
+
         Parameters
         ----------
         resource_loaders
@@ -714,48 +868,216 @@ class RobotModel(Data):
             has been loaded already, otherwise False.
         precision : int, optional
             The precision for parsing geometric data.
+        max_workers : int, optional
+            Number of threads to fetch and parse mesh files concurrently.
+            Defaults to loading the files one after the other.
+        executor : concurrent.futures.Executor, optional
+            Executor to load the mesh files with, e.g. a `ProcessPoolExecutor` for CPU-bound parsing.
+            The resource loaders must be picklable to use a process pool.
+            Takes precedence over `max_workers`.
+        visual : bool, optional
+            True to load the geometry of visual elements, otherwise False. Defaults to True.
+        collision : bool, optional
+            True to load the geometry of collision elements, otherwise False. Defaults to True.
+        links : list[str | [Link][compas_robots.model.Link]], optional
+            Links, or names of links, to load the geometry of. Defaults to all links.
+        lazy : bool, optional
+            True to load the meshes of each element on first access instead of now, otherwise False.
+            Files are still loaded only once, also when accessed from several threads.
+
+        Returns
+        -------
+        dict[str, float]
+            Time in seconds spent loading each mesh file, by filename, in loading order.
+            Empty if the geometry is loaded lazily.
 
         Examples
         --------
         >>> robot = RobotModel.ur5()
-        >>> robot.load_geometry(LocalPackageMeshLoader(compas_robots.DATA, "ur_description"))
+        >>> timings = robot.load_geometry(LocalPackageMeshLoader(compas_robots.DATA, "ur_description"), max_workers=4)
         >>> print(robot)
         Robot name=ur5, Links=11, Joints=10 (6 configurable)
+        >>> len(timings)
+        14
+
+        Load the collision meshes now and the visual meshes when needed:
+
+        >>> robot = RobotModel.ur5()
+        >>> loader = LocalPackageMeshLoader(compas_robots.DATA, "ur_description")
+        >>> timings = robot.load_geometry(loader, visual=False)
+        >>> timings = robot.load_geometry(loader, collision=False, lazy=True)
+        >>> len(timings)
+        0
+        >>> len(robot.links[1].visual[0].geometry.shape.meshes)
+        1
 
         """
-        force = kwargs.get("force", False)
         precision = kwargs.get("precision")
+        max_workers = kwargs.get("max_workers")
+        executor = kwargs.get("executor")
 
         loaders = list(resource_loaders)
         loaders.insert(0, DefaultMeshLoader())
 
-        for link in self.links:
-            for element in itertools.chain(link.collision, link.visual):
-                shape = element.geometry.shape
-                needs_reload = force or not shape.meshes
-                if "filename" in dir(shape) and needs_reload:
-                    for loader in loaders:
-                        if loader.can_load_mesh(shape.filename):
-                            shape.meshes = loader.load_meshes(shape.filename, precision=precision)
-                            break
-
-                    if not shape.meshes:
-                        raise Exception("Unable to load meshes for {}".format(shape.filename))
-
-    def ensure_geometry(self):
+        shapes = self._shapes_to_load(kwargs.get("force", False), kwargs.get("visual", True), kwargs.get("collision", True), kwargs.get("links"))
+        if kwargs.get("lazy", False):
+            resolver = _LazyMeshResolver(loaders, precision, collections.Counter(shape.filename for shape in shapes))
+            for shape in shapes:
+                shape._load_lazily(resolver)
+            return {}
+
+        filenames = list(dict.fromkeys(shape.filename for shape in shapes))
+        arguments = (itertools.repeat(loaders), filenames, itertools.repeat(precision))
+        if executor is not None:
+            results = executor.map(_load_mesh_file, *arguments)
+        elif max_workers and max_workers > 1:
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                results = list(pool.map(_load_mesh_file, *arguments))
+        else:
+            results = map(_load_mesh_file, *arguments)
+
+        return self._assign_loaded_meshes(shapes, filenames, results)
+
+    async def load_geometry_async(self, *resource_loaders: AbstractMeshLoader, **kwargs) -> dict[str, float]:
+        """Load external geometry resources, such as meshes, without blocking the event loop.
+
+        This is the asynchronous counterpart of [load_geometry][compas_robots.RobotModel.load_geometry].
+        All mesh files are loaded concurrently with
+        [load_meshes_async][compas_robots.resources.AbstractMeshLoader.load_meshes_async],
+        which runs synchronous loaders in the default executor of the event loop.
+
+        Parameters
+        ----------
+        resource_loaders
+            List of objects that implement the
+            resource loading interface ([AbstractMeshLoader][compas_robots.resources.AbstractMeshLoader])
+            and can retrieve external geometry.
+
+        Other Parameters
+        ----------------
+        force : bool, optional
+            True if it should force reloading even if the geometry
+            has been loaded already, otherwise False.
+        precision : int, optional
+            The precision for parsing geometric data.
+        max_concurrency : int, optional
+            Maximum number of mesh files loaded at the same time.
+            Defaults to loading all files at once.
+        visual : bool, optional
+            True to load the geometry of visual elements, otherwise False. Defaults to True.
+        collision : bool, optional
+            True to load the geometry of collision elements, otherwise False. Defaults to True.
+        links : list[str | [Link][compas_robots.model.Link]], optional
+            Links, or names of links, to load the geometry of. Defaults to all links.
+
+        Returns
+        -------
+        dict[str, float]
+            Time in seconds spent loading each mesh file, by filename, in model order.
+
+        Examples
+        --------
+        >>> import asyncio
+        >>> robot = RobotModel.ur5()
+        >>> timings = asyncio.run(robot.load_geometry_async(LocalPackageMeshLoader(compas_robots.DATA, "ur_description")))
+        >>> len(timings)
+        14
+
+        """
+        precision = kwargs.get("precision")
+
+        loaders = list(resource_loaders)
+        loaders.insert(0, DefaultMeshLoader())
+
+        shapes = self._shapes_to_load(kwargs.get("force", False), kwargs.get("visual", True), kwargs.get("collision", True), kwargs.get("links"))
+        filenames = list(dict.fromkeys(shape.filename for shape in shapes))
+        semaphore = asyncio.Semaphore(kwargs.get("max_concurrency") or max(len(filenames), 1))
+        results = await asyncio.gather(*[_load_mesh_file_async(loaders, filename, precision, semaphore) for filename in filenames])
+
+        return self._assign_loaded_meshes(shapes, filenames, results)
+
+    def _iter_geometry_elements(self, visual=True, collision=True, links=None):
+        if links is None:
+            selected_links = self.links
+        else:
+            names = set(link if isinstance(link, str) else link.name for link in links)
+            selected_links = [link for link in self.links if link.name in names]
+            if len(selected_links) != len(names):
+                unknown = names - set(link.name for link in selected_links)
+                raise ValueError("Unknown links: {}".format(", ".join(sorted(unknown))))
+
+        for link in selected_links:
+            if collision:
+                for element in link.collision:
+                    yield element
+            if visual:
+                for element in link.visual:
+                    yield element
+
+    def _shapes_to_load(self, force, visual, collision, links):
+        shapes = []
+        for element in self._iter_geometry_elements(visual, collision, links):
+            shape = element.geometry.shape
+            if "filename" not in dir(shape):
+                continue
+            # Checked without accessing the meshes, which would load lazily loaded geometry
+            if force or not shape._meshes:
+                shapes.append(shape)
+        return shapes
+
+    def _assign_loaded_meshes(self, shapes, filenames, results):
+        loaded = {}
+        timings = {}
+        for filename, (meshes, elapsed) in zip(filenames, results):
+            loaded[filename] = meshes
+            timings[filename] = elapsed
+
+        references = collections.Counter(shape.filename for shape in shapes)
+
+        # Results are assigned in model order, regardless of the order in which loading finished
+        for shape in shapes:
+            meshes = loaded[shape.filename]
+            if meshes is not None:
+                if references[shape.filename] > 1:
+                    shape._share_meshes(meshes)
+                else:
+                    shape.meshes = meshes
+
+            if not shape.meshes:
+                raise Exception("Unable to load meshes for {}".format(shape.filename))
+
+        return timings
+
+    def ensure_geometry(self, visual: bool = True, collision: bool = True, links: Optional[list[Union[str, Link]]] = None) -> None:
         """Check if geometry has been loaded.
 
+        Geometry loaded lazily counts as loaded, even if its meshes have not been accessed yet.
+
+        Parameters
+        ----------
+        visual
+            True to check the geometry of visual elements, otherwise False.
+        collision
+            True to check the geometry of collision elements, otherwise False.
+        links
+            Links, or names of links, to check the geometry of. Defaults to all links.
+
         Raises
         ------
         Exception
             If geometry has not been loaded.
 
+        Examples
+        --------
+        >>> robot = RobotModel.ur5()
+        >>> _ = robot.load_geometry(LocalPackageMeshLoader(compas_robots.DATA, "ur_description"), visual=False)
+        >>> robot.ensure_geometry(visual=False)
+
         """
-        for link in self.links:
-            for element in itertools.chain(link.collision, link.visual):
-                shape = element.geometry.shape
-                if not shape.meshes:
-                    raise Exception("This method is only callable once the geometry has been loaded.")
+        for element in self._iter_geometry_elements(visual, collision, links):
+            shape = element.geometry.shape
+            if getattr(shape, "_resolver", None) is None and not shape.meshes:
+                raise Exception("This method is only callable once the geometry has been loaded.")
 
     @property
     def frames(self) -> list[Frame]:
@@ -808,21 +1130,25 @@ class RobotModel(Data):
             Parent transformation to apply to the link when creating the structure.
 
         """
+        self._clear_kinematic_caches()
         if link is None:  # some urdfs would fail here otherwise
             return
 
-        for item in itertools.chain(link.visual, link.collision):
-            if item.origin:
-                # transform visual or collision geometry with the transformation specified in origin
-                transformation = Transformation.from_frame(item.origin)
-                item.init_transformation = parent_transformation * transformation
-            else:
-                item.init_transformation = parent_transformation
+        stack = [(link, parent_transformation)]
+        while stack:
+            link, parent_transformation = stack.pop()
+            for item in itertools.chain(link.visual, link.collision):
+                if item.origin:
+                    # transform visual or collision geometry with the transformation specified in origin
+                    transformation = Transformation.from_frame(item.origin)
+                    item.init_transformation = parent_transformation * transformation
+                else:
+                    item.init_transformation = parent_transformation
 
-        for child_joint in link.joints:
-            child_joint._create(parent_transformation)
-            # Recursively call creation
-            self._create(child_joint.child_link, child_joint.current_transformation)
+            for child_joint in link.joints:
+                child_joint._create(parent_transformation)
+                if child_joint.child_link:
+                    stack.append((child_joint.child_link, child_joint.current_transformation))
 
     def scale(self, factor: float, link: Optional[Link] = None) -> None:
         """Scales the robot by factor (absolute).
@@ -841,16 +1167,15 @@ class RobotModel(Data):
         >>> robot.scale(100)
 
         """
+        self._clear_kinematic_caches()
         if not link or link == self.root:
             link = self.root
             relative_factor = factor / self._scale_factor  # relative scaling factor
         else:
             relative_factor = factor
 
-        for child_joint in link.joints:
-            child_joint.scale(relative_factor)
-            # Recursive call
-            self.scale(relative_factor, child_joint.child_link)
+        for joint in self._get_joint_order(link):
+            joint.scale(relative_factor)
 
         self._scale_factor = factor
 
@@ -864,7 +1189,7 @@ class RobotModel(Data):
         link: Optional[Link] = None,
         parent_transformation: Optional[Transformation] = None,
     ) -> dict[str, Transformation]:
-        """Recursive function to calculate the transformations of each joint.
+        """Calculate the transformations of each joint.
 
         Parameters
         ----------
@@ -895,8 +1220,11 @@ class RobotModel(Data):
             parent_transformation = Transformation()
 
         transformations = {}
+        link_transformations = {link.name: parent_transformation}
 
-        for child_joint in link.joints:
+        # Parent links always precede their children joints in the traversal order
+        for child_joint in self._get_joint_order(link):
+            parent_transformation = link_transformations[str(child_joint.parent)]
             if child_joint.name in joint_state.keys():  # if passive/mimicking joint is in the joint_state, the transformation will be calculated according to this value
                 position = joint_state[child_joint.name]
                 transformation = parent_transformation * child_joint.calculate_transformation(position)
@@ -906,12 +1234,34 @@ class RobotModel(Data):
                 transformation = parent_transformation * child_joint.calculate_transformation(position)
             else:
                 transformation = parent_transformation
-            transformations.update({child_joint.name: transformation})
-            # call function on child
-            transformations.update(self.compute_transformations(joint_state, child_joint.child_link, transformation))
+            transformations[child_joint.name] = transformation
+            link_transformations[str(child_joint.child)] = transformation
 
         return transformations
 
+    def get_forward_kinematics_cache(self) -> ForwardKinematicsCache:
+        """Get the incremental forward kinematics cache of the robot.
+
+        The cache is reset whenever the structure or the rest pose of the robot changes.
+
+        Returns
+        -------
+        [ForwardKinematicsCache][compas_robots.model.ForwardKinematicsCache]
+            The cache, shared by all callers of this method.
+
+        Examples
+        --------
+        >>> robot = RobotModel.ur5()
+        >>> cache = robot.get_forward_kinematics_cache()
+        >>> _ = cache.update(robot.zero_configuration())
+        >>> sorted(cache.transformations) == sorted(robot.compute_transformations(robot.zero_configuration()))
+        True
+
+        """
+        if self._forward_kinematics_cache is None:
+            self._forward_kinematics_cache = ForwardKinematicsCache(self)
+        return self._forward_kinematics_cache
+
     def transformed_frames(self, joint_state: Union[Configuration, dict[str, float]]) -> list[Frame]:
         """Returns the transformed Joint frames (relative to the Robot Coordinate Frame) based on the joint_state ([Configuration][compas_robots.Configuration]).
 
@@ -1007,13 +1357,207 @@ class RobotModel(Data):
             ee_link = self.get_end_effector_link()
         else:
             ee_link = self.get_link_by_name(link_name)
-        joint = ee_link.parent_joint
-        if joint:
-            transformations = self.compute_transformations(joint_state)
-            return joint.current_origin.transformed(transformations[joint.name])
+        if ee_link.parent_joint:
+            chain = self.get_kinematic_chain(self.root.name, ee_link.name)
+            return chain.forward_kinematics(joint_state)
         else:
             return Frame.worldXY()  # if we ask forward from base link
 
+    def forward_kinematics_batch(self, joint_values: np.ndarray, link_name: Optional[str] = None) -> np.ndarray:
+        """Calculate the robot's forward kinematics for many configurations at once.
+
+        Parameters
+        ----------
+        joint_values
+            An (N, dof) array of joint values, with columns ordered like [get_configurable_joint_names][].
+        link_name
+            The name of the link we want to calculate the forward kinematics for.
+            Defaults to the end-effector link name.
+
+        Returns
+        -------
+        numpy.ndarray
+            An (N, 4, 4) array with the pose matrices of the link in the world coordinate system.
+
+        Examples
+        --------
+        >>> robot = RobotModel.ur5()
+        >>> joint_values = np.zeros((100, 6))
+        >>> matrices = robot.forward_kinematics_batch(joint_values)
+        >>> matrices.shape
+        (100, 4, 4)
+        >>> Frame.from_transformation(Transformation.from_matrix(matrices[0].tolist())).point
+        Point(x=0.817, y=0.191, z=-0.005)
+
+        """
+        if link_name is None:
+            ee_link = self.get_end_effector_link()
+        else:
+            ee_link = self.get_link_by_name(link_name)
+        joint_names = self.get_configurable_joint_names()
+
+        if ee_link.parent_joint:
+            chain = self.get_kinematic_chain(self.root.name, ee_link.name)
+            return chain.compute_matrices(joint_values, joint_names)
+
+        # if we ask forward from base link
+        return np.tile(np.identity(4), (len(np.atleast_2d(joint_values)), 1, 1))
+
+    def jacobian(self, joint_state: Union[Configuration, dict[str, float]], link_name: Optional[str] = None) -> np.ndarray:
+        """Calculate the geometric Jacobian of a link of the robot.
+
+        Parameters
+        ----------
+        joint_state
+            A configuration instance or a dictionary with joint names and joint values in radians and
+            meters (depending on the joint type).
+        link_name
+            The name of the link we want to calculate the Jacobian for.
+            Defaults to the end-effector link name.
+
+        Returns
+        -------
+        numpy.ndarray
+            The 6xdof Jacobian of the link origin in the world coordinate system, with linear velocity rows first and
+            columns ordered like [get_configurable_joint_names][].
+
+        Examples
+        --------
+        >>> robot = RobotModel.ur5()
+        >>> J = robot.jacobian(robot.zero_configuration())
+        >>> J.shape
+        (6, 6)
+
+        """
+        return self._get_link_chain(link_name).jacobian(joint_state, self.get_configurable_joint_names())
+
+    def jacobian_batch(self, joint_values: np.ndarray, link_name: Optional[str] = None) -> np.ndarray:
+        """Calculate the geometric Jacobians of a link of the robot for many configurations at once.
+
+        Parameters
+        ----------
+        joint_values
+            An (N, dof) array of joint values, with columns ordered like [get_configurable_joint_names][].
+        link_name
+            The name of the link we want to calculate the Jacobian for.
+            Defaults to the end-effector link name.
+
+        Returns
+        -------
+        numpy.ndarray
+            An (N, 6, dof) array of Jacobians of the link origin in the world coordinate system.
+
+        """
+        return self._get_link_chain(link_name).jacobian_batch(joint_values, self.get_configurable_joint_names())
+
+    def inverse_kinematics(
+        self,
+        frame: Frame,
+        start_configuration: Optional[Configuration] = None,
+        link_name: Optional[str] = None,
+        tool: Optional[ToolModel] = None,
+        attempts: int = 1,
+        random_seed: Optional[int] = None,
+        return_result: bool = False,
+        **kwargs,
+    ) -> Union[Configuration, InverseKinematicsResult, None]:
+        """Calculate a configuration that places a link of the robot at a target frame.
+
+        The solution is computed numerically with an
+        [InverseKinematicsSolver][compas_robots.model.InverseKinematicsSolver].
+
+        Parameters
+        ----------
+        frame
+            The target frame in the world coordinate system.
+        start_configuration
+            The configuration to start from. Defaults to the zero configuration.
+        link_name
+            The name of the link to place at the target frame.
+            Defaults to the link the tool is connected to, or to the end-effector link name.
+        tool
+            A tool attached to the link. If given, the target frame refers to the tool coordinate frame (TCF).
+        attempts
+            Total number of attempts, all but the first one start from a random configuration.
+        random_seed
+            Seed of the random restarts.
+        return_result
+            If `True`, return the full [InverseKinematicsResult][compas_robots.model.InverseKinematicsResult]
+            with all solutions and statistics instead of the best configuration only.
+
+        Other Parameters
+        ----------------
+        max_iterations : int, optional
+            Maximum number of iterations per attempt.
+        position_tolerance : float, optional
+            Position tolerance of a solution, in meters.
+        orientation_tolerance : float, optional
+            Orientation tolerance of a solution, in radians.
+        damping : float, optional
+            Initial damping factor of the least-squares step.
+
+        Returns
+        -------
+        Configuration | InverseKinematicsResult | None
+            The solution closest to the start configuration, or `None` if the solver did not converge.
+
+        Examples
+        --------
+        >>> robot = RobotModel.ur5()
+        >>> config = robot.random_configuration()
+        >>> frame = robot.forward_kinematics(config)
+        >>> solution = robot.inverse_kinematics(frame, start_configuration=config)
+        >>> robot.forward_kinematics(solution).point.distance_to_point(frame.point) < 1e-4
+        True
+
+        """
+        solver = InverseKinematicsSolver(self, link_name=link_name, tool=tool, **kwargs)
+        result = solver.solve(frame, start_configuration, attempts=attempts, random_seed=random_seed)
+        if return_result:
+            return result
+        return result.configuration
+
+    def _get_link_chain(self, link_name=None):
+        if link_name is None:
+            link_name = self.get_end_effector_link_name()
+        return self.get_kinematic_chain(self.root.name, link_name)
+
+    def compute_link_matrices_batch(self, joint_values: np.ndarray) -> np.ndarray:
+        """Calculate the pose matrices of all links for many configurations at once.
+
+        Parameters
+        ----------
+        joint_values
+            An (N, dof) array of joint values, with columns ordered like [get_configurable_joint_names][].
+
+        Returns
+        -------
+        numpy.ndarray
+            An (N, L, 4, 4) array with the pose matrices of the links in the world coordinate system,
+            in the order of [iter_links][].
+
+        Examples
+        --------
+        >>> robot = RobotModel.ur5()
+        >>> robot.compute_link_matrices_batch(np.zeros((100, 6))).shape
+        (100, 11, 4, 4)
+
+        """
+        if self._kinematic_tree is None or not self._kinematic_tree._is_current():
+            self._kinematic_tree = KinematicChain(self.iter_joints())
+        tree = self._kinematic_tree
+
+        joint_matrices = tree.compute_joint_matrices(joint_values, self.get_configurable_joint_names())
+        count = joint_matrices.shape[0]
+        index_by_joint_name = {name: i for i, name in enumerate(tree.joint_names)}
+
+        links = list(self.iter_links())
+        matrices = np.tile(np.identity(4), (count, len(links), 1, 1))
+        for i, link in enumerate(links):
+            if link.parent_joint:
+                matrices[:, i] = joint_matrices[:, index_by_joint_name[link.parent_joint.name]]
+        return matrices
+
     @staticmethod
     def _consolidate_meshes(meshes, key, **kwargs):
         meshes = meshes or []
@@ -1024,8 +1568,8 @@ class RobotModel(Data):
         return meshes, kwargs
 
     def _check_link_name(self, name):
-        all_link_names = [l.name for l in self.links]  # noqa: E741
-        if name in all_link_names:
+        # The index of links by name does not contain the child links of removed joints, which are still part of the model
+        if any(link.name == name for link in self.links):
             raise ValueError("Link name '%s' already used in chain." % name)
 
     # --------------------------------------------------------------------------
@@ -1267,10 +1811,14 @@ class RobotModel(Data):
 
         link = Link(name, visual=visuals, collision=collisions, **kwargs)
         self.links.append(link)
+        self._clear_caches()
         # Must build the tree structure, if adding the first link to an empty robot
         if len(self.links) == 1:
             self._rebuild_tree()
             self._create(self.root, Transformation())
+        else:
+            self._links[name] = link
+            self._adjacency[name] = []
         return link
 
     def remove_link(self, name: str) -> None:
@@ -1285,6 +1833,9 @@ class RobotModel(Data):
 
         """
         self.links = [link for link in self.links if link.name != name]
+        self._links.pop(name, None)
+        self._adjacency.pop(name, None)
+        self._clear_caches()
 
     def add_joint(
         self,
@@ -1342,8 +1893,7 @@ class RobotModel(Data):
         >>> j = robot.add_joint("joint1", Joint.CONTINUOUS, parent_link, child_link, origin, axis)
 
         """
-        all_joint_names = [j.name for j in self.joints]
-        if name in all_joint_names:
+        if name in self._joints:
             raise ValueError("Joint name '%s' already used in chain." % name)
 
         if origin:
@@ -1360,14 +1910,19 @@ class RobotModel(Data):
 
         self.joints.append(joint)
 
-        # Using only part of self._rebuild_tree()
+        # Update the indexes of self._rebuild_tree() incrementally
         parent_link.joints.append(joint)
         child_link.parent_joint = joint
+        self._children_joints.setdefault(parent_link.name, []).append(joint)
+        self._parent_joints[child_link.name] = joint
 
         self._links[parent_link.name] = parent_link
         self._adjacency[parent_link.name] = [joint.name for joint in parent_link.joints]
         self._links[child_link.name] = child_link
+        self._adjacency.setdefault(child_link.name, [j.name for j in child_link.joints])
 
+        self._clear_caches()
+        root = self.root
         if not parent_link.parent_joint:
             self.root = parent_link
 
@@ -1375,7 +1930,13 @@ class RobotModel(Data):
         self._joints[joint.name] = joint
         self._adjacency[joint.name] = [child_link.name]
 
-        self._create(self.root, Transformation())
+        if self.root is not root:
+            self._create(self.root, Transformation())
+        else:
+            # Only the new joint and the subtree below it need their rest pose
+            parent_joint = parent_link.parent_joint
+            joint._create(parent_joint.current_transformation if parent_joint else Transformation())
+            self._create(child_link, joint.current_transformation)
 
         return joint
 
@@ -1397,11 +1958,16 @@ class RobotModel(Data):
         joint = self.get_joint_by_name(name)
         self.joints = [j for j in self.joints if j.name != name]
         parent_link = self.get_link_by_name(joint.parent.link)
-        parent_link.joints = [j for j in parent_link.joints if j.name != name]
-        self._adjacency[parent_link.name] = [j.name for j in parent_link.joints]
-        del self._links[joint.child.link]
+        if parent_link:
+            parent_link.joints = [j for j in parent_link.joints if j.name != name]
+            self._adjacency[parent_link.name] = [j.name for j in parent_link.joints]
+        self._children_joints[joint.parent.link] = [j for j in self._children_joints.get(joint.parent.link, []) if j.name != name]
+        if self._parent_joints.get(joint.child.link) is joint:
+            del self._parent_joints[joint.child.link]
+        self._links.pop(joint.child.link, None)
         del self._joints[name]
         del self._adjacency[name]
+        self._clear_caches()
 
 
 URDFParser.install_parser(RobotModel, "robot")
@@ -6,8 +6,12 @@ provides loader classes that automate fetching and processing those resources.
 
 from __future__ import absolute_import
 
+from .cache import MeshCache
+from .cache import get_mesh_cache
+from .cache import set_mesh_cache
 from .mesh_importer import get_file_format
 from .mesh_importer import mesh_import
+from .remote import HttpClient
 from .basic import AbstractMeshLoader
 from .basic import DefaultMeshLoader
 from .basic import LocalPackageMeshLoader
@@ -18,6 +22,10 @@ __all__ = [
     "DefaultMeshLoader",
     "LocalPackageMeshLoader",
     "GithubPackageMeshLoader",
+    "HttpClient",
+    "MeshCache",
+    "get_mesh_cache",
+    "set_mesh_cache",
     "get_file_format",
     "mesh_import",
 ]
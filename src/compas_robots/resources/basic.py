@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import asyncio
+import functools
 import os
 from typing import TYPE_CHECKING
 from urllib.parse import urlparse
 
+from .mesh_importer import SUPPORTED_FORMATS
 from .mesh_importer import get_file_format
 from .mesh_importer import mesh_import
 
@@ -12,6 +15,8 @@ if TYPE_CHECKING:
 
     from compas.datastructures import Mesh
 
+    from .remote import HttpClient
+
 
 class AbstractMeshLoader(object):
     """Basic contract/interface for all mesh loaders."""
@@ -49,18 +54,53 @@ class AbstractMeshLoader(object):
         """
         raise NotImplementedError
 
+    async def load_meshes_async(self, url: str, precision: Optional[int] = None) -> list[Mesh]:
+        """Load meshes from the given URL without blocking the event loop.
+
+        The default implementation runs [load_meshes][compas_robots.resources.AbstractMeshLoader.load_meshes]
+        in the default executor of the running event loop. Loaders that can fetch or parse
+        files asynchronously override this method.
+
+        Parameters
+        ----------
+        url
+            Mesh URL
+        precision
+            The precision for parsing geometric data.
+
+        Returns
+        -------
+        List of meshes.
+        """
+        load = functools.partial(self.load_meshes, url, precision=precision)
+        return await asyncio.get_running_loop().run_in_executor(None, load)
+
 
 class DefaultMeshLoader(AbstractMeshLoader):
     """Handles basic mesh loader tasks, mostly from local files.
 
+    Files of all supported formats can also be loaded from HTTP(S) URLs.
+    They are fetched with an [HttpClient][compas_robots.resources.HttpClient], which applies
+    its timeout, offline mode and HTTP cache, and the meshes are kept in the process-wide
+    mesh cache by URL, if enabled, see [get_mesh_cache][compas_robots.resources.get_mesh_cache].
+
+    Parameters
+    ----------
+    client
+        HTTP client to fetch remote files with.
+        Defaults to a client shared by all loaders, with a temporary cache directory.
+
     Attributes
     ----------
     kwargs (optional): dict
         Additional keyword arguments.
+    client : [HttpClient][compas_robots.resources.HttpClient] | None
+        HTTP client to fetch remote files with.
     """
 
-    def __init__(self, **kwargs):
+    def __init__(self, client: Optional[HttpClient] = None, **kwargs):
         super(DefaultMeshLoader, self).__init__()
+        self.client = client
         self.attr = kwargs or dict()
 
     def can_load_mesh(self, url: str) -> bool:
@@ -74,7 +114,8 @@ class DefaultMeshLoader(AbstractMeshLoader):
         Returns
         -------
         bool
-            `True` if the URL points to a local and valid file.
+            `True` if the URL points to a local and valid file,
+            or to a remote file of a supported format over HTTP(S).
             Otherwise `False`.
         """
 
@@ -91,9 +132,9 @@ class DefaultMeshLoader(AbstractMeshLoader):
             if os.path.isfile(url):
                 return True
 
-        # Only OBJ loader supports remote files atm
-        is_obj = get_file_format(url) == "obj"
-        return scheme in ("http", "https") and is_obj
+        # Remote files of all supported formats are fetched into the HTTP cache
+        is_supported = get_file_format(url) in SUPPORTED_FORMATS
+        return scheme in ("http", "https") and is_supported
 
     def load_meshes(self, url: str, precision: Optional[int] = None) -> list[Mesh]:
         """Load meshes from the given URL.
@@ -112,7 +153,7 @@ class DefaultMeshLoader(AbstractMeshLoader):
         List of meshes.
         """
         url = self._get_mesh_url(url)
-        return mesh_import(url, url, precision)
+        return mesh_import(url, url, precision, client=self.client)
 
     def _get_mesh_url(self, url: str) -> str:
         """Concatenates basepath directory to URL only if defined in the keyword arguments.
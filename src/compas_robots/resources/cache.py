@@ -0,0 +1,308 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import pickle
+import re
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+
+import numpy as np
+from compas.datastructures import Mesh
+
+if TYPE_CHECKING:
+    from typing import Hashable
+    from typing import Optional
+
+
+_DISK_FORMAT = 1
+_ENTRY_NAME = re.compile(r"^[0-9a-f]{64}$")
+
+
+def _write_entry(directory, name, meshes):
+    """Write meshes as one binary file of arrays and a JSON manifest describing them."""
+    arrays = []
+    descriptions = []
+    offset = 0
+    for mesh in meshes:
+        vertices, faces = mesh.to_vertices_and_faces()
+        face_sizes = np.array([len(face) for face in faces], dtype=np.int32)
+        mesh_arrays = {
+            "vertices": np.array(vertices, dtype=np.float64).reshape(-1, 3),
+            "faces": np.array([index for face in faces for index in face], dtype=np.int32),
+            "face_sizes": face_sizes,
+        }
+        description = {"name": mesh.name, "attributes": dict(mesh.attributes)}
+        for key, array in mesh_arrays.items():
+            description[key] = {"offset": offset, "dtype": array.dtype.str, "shape": array.shape}
+            arrays.append(array)
+            offset += array.nbytes
+        descriptions.append(description)
+    manifest = json.dumps({"format": _DISK_FORMAT, "size": offset, "meshes": descriptions})
+
+    # The manifest is moved in place last, so that readers only see complete entries
+    for extension, content in ((".bin", b"".join(array.tobytes() for array in arrays)), (".json", manifest.encode("utf-8"))):
+        handle, temp_filepath = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(handle, "wb") as f:
+                f.write(content)
+            os.replace(temp_filepath, os.path.join(directory, name + extension))
+        except Exception:
+            os.remove(temp_filepath)
+            raise
+
+
+def _read_entry(directory, name):
+    """Read meshes written by `_write_entry`, mapping the binary file into memory."""
+    with open(os.path.join(directory, name + ".json"), "r") as f:
+        manifest = json.load(f)
+    if manifest.get("format") != _DISK_FORMAT:
+        return None
+
+    data = np.memmap(os.path.join(directory, name + ".bin"), dtype=np.uint8, mode="r") if manifest["size"] else np.zeros(0, dtype=np.uint8)
+    if data.size != manifest["size"]:
+        return None
+
+    def array(description):
+        dtype = np.dtype(description["dtype"])
+        count = int(np.prod(description["shape"]))
+        start = description["offset"]
+        return data[start : start + count * dtype.itemsize].view(dtype).reshape(description["shape"])
+
+    meshes = []
+    for description in manifest["meshes"]:
+        vertices = array(description["vertices"])
+        indices = array(description["faces"])
+        face_sizes = array(description["face_sizes"])
+        if face_sizes.size and np.all(face_sizes == face_sizes[0]):
+            faces = indices.reshape(-1, int(face_sizes[0])).tolist()
+        else:
+            faces = [face.tolist() for face in np.split(indices, np.cumsum(face_sizes)[:-1])]
+
+        mesh = Mesh.from_vertices_and_faces(vertices.tolist(), faces)
+        mesh.name = description["name"]
+        mesh.attributes.update(description["attributes"])
+        meshes.append(mesh)
+    return meshes
+
+
+class MeshCache(object):
+    """In-memory cache of loaded meshes with least-recently-used eviction.
+
+    Meshes are stored serialized, so that every lookup returns new mesh objects
+    that can be modified without affecting the cache or other robot models.
+    The size of the serialized meshes counts against the memory budget of the cache.
+
+    The cache is safe to use from several threads.
+
+    If a directory is given, meshes are also stored on disk and survive the process:
+    each entry is a binary file of vertex and face index arrays, which is memory-mapped when read,
+    next to a JSON manifest with the layout of the arrays and the mesh attributes, such as colors.
+    Since keys of local files include their modification time, modified files are loaded again.
+    Remote files are keyed by URL only, so their entries need to be removed with
+    [clear][compas_robots.resources.MeshCache.clear] to fetch them again.
+
+    Parameters
+    ----------
+    max_size
+        Memory budget in bytes. The least recently used meshes are evicted
+        when the budget is exceeded.
+    directory
+        Directory to store the meshes on disk, or `None` to keep them only in memory.
+
+    Attributes
+    ----------
+    max_size : int
+        Memory budget in bytes.
+    directory : str | None
+        Directory to store the meshes on disk.
+    size : int
+        Bytes currently used by the cached meshes.
+    hits : int
+        Number of lookups that found the meshes in the cache.
+    disk_hits : int
+        Number of lookups that found the meshes on disk but not in memory.
+    misses : int
+        Number of lookups that did not find the meshes in the cache.
+    evictions : int
+        Number of entries evicted to stay within the memory budget.
+
+    Examples
+    --------
+    >>> from compas.datastructures import Mesh
+    >>> cache = MeshCache(max_size=2**20)
+    >>> cache.put("box", [Mesh.from_polyhedron(6)])
+    >>> cache.get("box")[0].number_of_faces()
+    6
+    >>> cache.get("sphere") is None
+    True
+    >>> cache.hits, cache.misses
+    (1, 1)
+
+    """
+
+    def __init__(self, max_size: int = 256 * 2**20, directory: Optional[str] = None):
+        self.max_size = max_size
+        self.directory = directory
+        self.size = 0
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def get(self, key: Hashable) -> Optional[list[Mesh]]:
+        """Get the meshes stored under a key.
+
+        Parameters
+        ----------
+        key
+            Key of the meshes.
+
+        Returns
+        -------
+        list[[compas.datastructures.Mesh]] | None
+            New copies of the cached meshes, or `None` if the key is not cached.
+
+        """
+        with self._lock:
+            blob = self._entries.get(key)
+            if blob is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+
+        if blob is not None:
+            return pickle.loads(blob)
+
+        meshes = self._read_from_disk(key)
+        with self._lock:
+            if meshes is None:
+                self.misses += 1
+                return None
+            self.disk_hits += 1
+        self._store(key, meshes)
+        return meshes
+
+    def put(self, key: Hashable, meshes: list[Mesh]) -> None:
+        """Store meshes under a key.
+
+        Meshes larger than the memory budget are not stored.
+
+        Parameters
+        ----------
+        key
+            Key of the meshes.
+        meshes
+            The meshes to store.
+
+        """
+        self._store(key, meshes)
+        self._write_to_disk(key, meshes)
+
+    def _store(self, key, meshes):
+        blob = pickle.dumps(meshes, protocol=pickle.HIGHEST_PROTOCOL)
+        if len(blob) > self.max_size:
+            return
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.size -= len(previous)
+            self._entries[key] = blob
+            self.size += len(blob)
+
+            while self.size > self.max_size:
+                _, evicted = self._entries.popitem(last=False)
+                self.size -= len(evicted)
+                self.evictions += 1
+
+    @staticmethod
+    def _entry_name(key):
+        return hashlib.sha256(repr(key).encode("utf-8")).hexdigest()
+
+    def _read_from_disk(self, key):
+        if not self.directory or not os.path.exists(os.path.join(self.directory, self._entry_name(key) + ".json")):
+            return None
+        try:
+            return _read_entry(self.directory, self._entry_name(key))
+        except Exception:
+            # Unreadable entries are loaded again and overwritten
+            return None
+
+    def _write_to_disk(self, key, meshes):
+        if not self.directory:
+            return
+        if not os.path.isdir(self.directory):
+            os.makedirs(self.directory, exist_ok=True)
+        _write_entry(self.directory, self._entry_name(key), meshes)
+
+    def clear(self) -> None:
+        """Remove all meshes from the cache, including the ones stored on disk, and reset its statistics.
+
+        Other files in the directory of the cache are kept.
+
+        """
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+            self.hits = 0
+            self.disk_hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+            if self.directory and os.path.isdir(self.directory):
+                # Only entries written by the cache are removed, the directory may be shared with other files
+                filenames = set(os.listdir(self.directory))
+                for filename in filenames:
+                    name, extension = os.path.splitext(filename)
+                    if extension == ".json" and _ENTRY_NAME.match(name) and name + ".bin" in filenames:
+                        os.remove(os.path.join(self.directory, name + ".json"))
+                        os.remove(os.path.join(self.directory, name + ".bin"))
+
+
+_MESH_CACHE = None
+
+
+def get_mesh_cache() -> Optional[MeshCache]:
+    """Get the process-wide mesh cache used by the mesh loaders.
+
+    Caching is disabled by default, use [set_mesh_cache][compas_robots.resources.set_mesh_cache] to enable it.
+
+    Returns
+    -------
+    [MeshCache][compas_robots.resources.MeshCache] | None
+        The mesh cache, or `None` if caching is disabled.
+
+    """
+    return _MESH_CACHE
+
+
+def set_mesh_cache(cache: Optional[MeshCache]) -> None:
+    """Set the process-wide mesh cache used by the mesh loaders.
+
+    Parameters
+    ----------
+    cache
+        The mesh cache, or `None` to disable caching.
+
+    Examples
+    --------
+    >>> previous = get_mesh_cache()
+    >>> set_mesh_cache(MeshCache(max_size=64 * 2**20))
+    >>> get_mesh_cache().max_size
+    67108864
+    >>> set_mesh_cache(previous)
+
+    """
+    global _MESH_CACHE
+    _MESH_CACHE = cache
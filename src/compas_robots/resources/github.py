@@ -1,10 +1,11 @@
 from __future__ import annotations
 
+import io
 from typing import TYPE_CHECKING
-from urllib.request import urlopen
 
 from .basic import AbstractMeshLoader
 from .mesh_importer import mesh_import
+from .remote import HttpClient
 
 if TYPE_CHECKING:
     from typing import Optional
@@ -15,6 +16,31 @@ if TYPE_CHECKING:
 class GithubPackageMeshLoader(AbstractMeshLoader):
     """Loads resources stored in Github.
 
+    Files are fetched with an [HttpClient][compas_robots.resources.HttpClient],
+    which reuses connections and keeps the files in a local HTTP cache,
+    so that only files changed on the server are downloaded again.
+
+    Parameters
+    ----------
+    repository
+        Repository name including organization, e.g. `ros-industrial/abb`.
+    support_package
+        Name of the support package containing URDF, Meshes
+        and additional assets, e.g. `abb_irb4400_support`
+    branch
+        Branch name, defaults to `main`.
+    relative_path
+        Relative path of the support package within the repository.
+        Defaults to `support_package`.
+    cache_directory
+        Directory of the HTTP cache, to keep fetched files across sessions.
+        Defaults to a temporary directory.
+    offline
+        If `True`, load files only from the HTTP cache, without sending requests.
+    client
+        HTTP client to fetch files with, e.g. to share connections and cache between loaders.
+        Overrides `cache_directory` and `offline`.
+
     Attributes
     ----------
     repository : str
@@ -29,17 +55,35 @@ class GithubPackageMeshLoader(AbstractMeshLoader):
         Relative path of the support package within the repository.
         If the repository itself is the support package, set
         `relative_path` to `'.'`.  Defaults to `support_package`
+    client : [HttpClient][compas_robots.resources.HttpClient]
+        HTTP client to fetch files with.
+
+    Examples
+    --------
+    >>> loader = GithubPackageMeshLoader("ros-industrial/abb", "abb_irb6600_support", "kinetic-devel", offline=True)
+    >>> loader.build_url("urdf/irb6640.urdf")
+    'https://raw.githubusercontent.com/ros-industrial/abb/kinetic-devel/abb_irb6600_support/urdf/irb6640.urdf'
     """
 
     HOST = "https://raw.githubusercontent.com"
 
-    def __init__(self, repository: str, support_package: str, branch: str = "main", relative_path: Optional[str] = None) -> None:
+    def __init__(
+        self,
+        repository: str,
+        support_package: str,
+        branch: str = "main",
+        relative_path: Optional[str] = None,
+        cache_directory: Optional[str] = None,
+        offline: bool = False,
+        client: Optional[HttpClient] = None,
+    ) -> None:
         super(GithubPackageMeshLoader, self).__init__()
         self.repository = repository
         self.support_package = support_package
         self.branch = branch
         self.schema_prefix = "package://" + self.support_package + "/"
         self.relative_path = support_package if relative_path is None else relative_path
+        self.client = client or HttpClient(cache_directory=cache_directory, offline=offline)
 
     def build_url(self, file: str) -> str:
         """Returns the corresponding url of the file.
@@ -56,7 +100,7 @@ class GithubPackageMeshLoader(AbstractMeshLoader):
         """
         relative_path_component = None if self.relative_path == "." else self.relative_path
         url_components = [
-            GithubPackageMeshLoader.HOST,
+            self.HOST,
             self.repository,
             self.branch,
             relative_path_component,
@@ -72,9 +116,15 @@ class GithubPackageMeshLoader(AbstractMeshLoader):
         file
             File name. Following convention, the file should reside
             inside a `urdf` folder.
+
+        Returns
+        -------
+        io.BytesIO
+            The content of the URDF file.
         """
         url = self.build_url("urdf/{}".format(file))
-        return urlopen(url)
+        with open(self.client.fetch(url), "rb") as f:
+            return io.BytesIO(f.read())
 
     def can_load_mesh(self, url: str) -> bool:
         """Determine whether this loader can load a given mesh URL.
@@ -111,4 +161,4 @@ class GithubPackageMeshLoader(AbstractMeshLoader):
         _prefix, path = url.split(self.schema_prefix)
         url = self.build_url(path)
 
-        return mesh_import(url, url, precision)
+        return mesh_import(url, self.client.fetch(url), precision)
@@ -1,11 +1,17 @@
 import logging
-from collections import OrderedDict
+import math
+import os
+import threading
 
+import numpy as np
 from compas.datastructures import Mesh
 from compas.files import XML
-from compas.geometry import Transformation
+from compas.geometry import matrix_from_axis_and_angle
 from compas.tolerance import TOL
 
+from .cache import get_mesh_cache
+from .remote import HttpClient
+
 LOGGER = logging.getLogger(__file__)
 
 SUPPORTED_FORMATS = ("obj", "stl", "ply", "dae")
@@ -29,6 +35,120 @@ def _xml_local_name(tag):
     return tag
 
 
+def _parse_array(text, dtype=float):
+    return np.fromstring(text or "", dtype=dtype, sep=" ")
+
+
+def _geometric_keys(vertices, precision=None):
+    """Vectorized equivalent of `TOL.geometric_key`, as an (N, 3) array of integers.
+
+    Two vertices have the same key exactly when `TOL.geometric_key` returns the same string for both.
+    """
+    if not precision:
+        precision = TOL.precision
+
+    if precision < 0:
+        # Rounding to tens and beyond is rare enough to simply use the string keys
+        _, keys = np.unique(np.array([TOL.geometric_key(xyz, precision) for xyz in vertices.tolist()]), return_inverse=True)
+        return keys.reshape(-1, 1)
+
+    scaled = vertices * 10.0**precision
+    keys = np.rint(scaled)
+
+    # Scaling is not exact, so values close to a tie are rounded as string formatting does
+    near_tie = np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6
+    for index in zip(*np.nonzero(near_tie)):
+        keys[index] = int("{0:.{1}f}".format(vertices[index], precision).replace(".", ""))
+
+    # Integers have no negative zero, which sanitizes keys like `TOL.geometric_key` does
+    return keys.astype(np.int64)
+
+
+def _weld_vertices(vertices, faces, precision=None):
+    """Merge vertices with the same geometric key, like the other importers do.
+
+    Welded vertices are ordered by their first occurrence and keep the coordinates of their last occurrence.
+
+    Parameters
+    ----------
+    vertices : numpy.ndarray
+        (N, 3) vertex coordinates.
+    faces : numpy.ndarray
+        Vertex indices of the faces, in any shape.
+    precision : int, optional
+        The precision of the geometric keys.
+
+    Returns
+    -------
+    tuple[numpy.ndarray, numpy.ndarray]
+        The welded vertex coordinates and the faces with remapped vertex indices.
+
+    """
+    if not len(vertices):
+        return vertices, faces
+
+    _, first, inverse = np.unique(_geometric_keys(vertices, precision), axis=0, return_index=True, return_inverse=True)
+    inverse = inverse.reshape(-1)
+    last = np.zeros(len(first), dtype=np.int64)
+    np.maximum.at(last, inverse, np.arange(len(vertices)))
+
+    order = np.argsort(first)
+    rank = np.empty_like(order)
+    rank[order] = np.arange(len(order))
+    return vertices[last[order]], rank[inverse][faces]
+
+
+def _transform_vertices(vertices, matrix):
+    """Transform (N, 3) vertex coordinates with a 4x4 matrix.
+
+    Products are summed in the same order as `compas.geometry.transform_points`,
+    so the coordinates are identical to transforming the mesh afterwards."""
+    xyzw = []
+    for row in matrix:
+        value = 0.0 + vertices[:, 0] * row[0]
+        value = value + vertices[:, 1] * row[1]
+        value = value + vertices[:, 2] * row[2]
+        xyzw.append(value + 1.0 * row[3])
+    x, y, z, w = xyzw
+    w = np.where(w == 0.0, 1.0, w)
+    return np.stack((x / w, y / w, z / w), axis=1)
+
+
+_STL_FACET = np.dtype([("normal", "<f4", (3,)), ("vertices", "<u4", (3, 3)), ("attribute_byte_count", "<u2")])
+
+
+def _mesh_from_binary_stl(filename):
+    """Read a binary STL file into a mesh, or return `None` if the file is not a local binary STL file.
+
+    The facets are memory-mapped and welded as arrays. Like `Mesh.from_stl`, vertices are welded
+    by their exact binary coordinates, ordered by first occurrence, and the precision is not used.
+    """
+    if not isinstance(filename, str) or not os.path.isfile(filename):
+        return None
+
+    size = os.path.getsize(filename)
+    if size < 84:
+        return None
+    data = np.memmap(filename, dtype=np.uint8, mode="r")
+    facet_count = int(data[80:84].view("<u4")[0])
+    # ASCII files, or binary files with a wrong facet count, are left to the generic reader
+    if size != 84 + facet_count * _STL_FACET.itemsize:
+        return None
+
+    # Coordinates are read as integers, so that vertices are compared by their bits
+    corners = data[84:].view(_STL_FACET)["vertices"].reshape(-1, 3)
+    _, first, inverse = np.unique(corners, axis=0, return_index=True, return_inverse=True)
+    inverse = inverse.reshape(-1)
+
+    order = np.argsort(first)
+    rank = np.empty_like(order)
+    rank[order] = np.arange(len(order))
+
+    vertices = np.ascontiguousarray(corners[first[order]]).view("<f4").astype(np.float64)
+    faces = rank[inverse].reshape(-1, 3)
+    return Mesh.from_vertices_and_faces(vertices.tolist(), faces.tolist())
+
+
 def get_file_format(url):
     # This could be much more elaborate
     # with an actual header check
@@ -37,19 +157,71 @@ def get_file_format(url):
     return file_extension
 
 
-def mesh_import(name, file, precision=None):
+def _is_remote(file):
+    return isinstance(file, str) and file.startswith(("http://", "https://"))
+
+
+def _mesh_cache_key(file_extension, file, precision):
+    # Local files are identified by their path and modification, remote files by their URL
+    if not isinstance(file, str):
+        return None
+    precision = TOL.precision if precision is None else precision
+    if _is_remote(file):
+        return (file, file_extension, precision)
+    try:
+        stat = os.stat(file)
+    except OSError:
+        return None
+    return (os.path.abspath(file), stat.st_mtime_ns, stat.st_size, file_extension, precision)
+
+
+def mesh_import(name, file, precision=None, client=None):
     """Internal function to load meshes using the correct loader.
 
-    Name and file might be the same but not always, e.g. temp files."""
+    Name and file might be the same but not always, e.g. temp files.
+    Remote files are fetched with the given HTTP client, or with a shared client with a temporary cache,
+    so that all formats can be loaded from URLs.
+    Meshes are looked up in and stored to the process-wide mesh cache, if enabled, see
+    [get_mesh_cache][compas_robots.resources.get_mesh_cache]."""
     file_extension = get_file_format(name)
 
     if file_extension not in SUPPORTED_FORMATS:
         raise NotImplementedError("Mesh type not supported: {}".format(file_extension))
 
+    cache = get_mesh_cache()
+    key = _mesh_cache_key(file_extension, file, precision) if cache is not None else None
+    if key is not None:
+        meshes = cache.get(key)
+        if meshes is not None:
+            return meshes
+
+    if _is_remote(file):
+        meshes = _mesh_import(file_extension, (client or _get_http_client()).fetch(file), precision)
+    else:
+        meshes = _mesh_import(file_extension, file, precision)
+    if key is not None:
+        cache.put(key, meshes)
+    return meshes
+
+
+_HTTP_CLIENT = None
+_HTTP_CLIENT_LOCK = threading.Lock()
+
+
+def _get_http_client():
+    global _HTTP_CLIENT
+    with _HTTP_CLIENT_LOCK:
+        if _HTTP_CLIENT is None:
+            _HTTP_CLIENT = HttpClient()
+        return _HTTP_CLIENT
+
+
+def _mesh_import(file_extension, file, precision):
     if file_extension == "obj":
         return [Mesh.from_obj(file, precision)]
     elif file_extension == "stl":
-        return [Mesh.from_stl(file, precision)]
+        mesh = _mesh_from_binary_stl(file)
+        return [mesh if mesh is not None else Mesh.from_stl(file, precision)]
     elif file_extension == "ply":
         return [Mesh.from_ply(file, precision)]
     elif file_extension == "dae":
@@ -58,6 +230,124 @@ def mesh_import(name, file, precision=None):
     raise Exception
 
 
+_COLLADA_PRIMITIVES = ("triangles", "polylist", "polygons", "tristrips", "trifans")
+_COLLADA_LINE_PRIMITIVES = ("lines", "linestrips")
+
+
+def _collada_node_matrix(node, parent):
+    """Accumulated transformation matrix of a node, from the matrix of its parent and its own transformation elements."""
+    matrices = [] if parent is None else [parent]
+    for element in node:
+        name = _xml_local_name(element.tag)
+        if name not in ("matrix", "translate", "rotate", "scale"):
+            continue
+
+        values = [float(i) for i in element.text.split()]
+        if name == "matrix":
+            matrix = np.array(values).reshape(4, 4)
+        elif name == "translate":
+            matrix = np.identity(4)
+            matrix[:3, 3] = values
+        elif name == "rotate":
+            matrix = np.array(matrix_from_axis_and_angle(values[:3], math.radians(values[3])))
+        else:
+            matrix = np.diag(values + [1.0])
+        matrices.append(matrix)
+
+    if not matrices:
+        return None
+    matrix = matrices[0]
+    for other in matrices[1:]:
+        matrix = matrix @ other
+    return matrix
+
+
+def _collada_instances(root, tag):
+    """Find the transformation and material bindings of the first instance of each geometry.
+
+    Visual scenes are traversed once, following node instances, and in document order,
+    so that a geometry instanced several times uses the first node that instances it."""
+    nodes = {node.attrib["id"]: node for node in root.iter(tag("node")) if "id" in node.attrib}
+    instances = {}
+
+    stack = []
+    for scene in root.iterfind("{}/{}".format(tag("library_visual_scenes"), tag("visual_scene"))):
+        stack.extend((node, None, ()) for node in scene.findall(tag("node")))
+    stack.reverse()
+
+    while stack:
+        node, parent, ancestors = stack.pop()
+        matrix = _collada_node_matrix(node, parent)
+        ancestors = ancestors + (node.attrib.get("id"),)
+
+        children = []
+        for element in node:
+            name = _xml_local_name(element.tag)
+            if name == "node":
+                children.append((element, matrix, ancestors))
+            elif name == "instance_node":
+                node_id = element.attrib.get("url", "")[1:]
+                # Skip unknown and recursive node instances
+                if node_id in nodes and node_id not in ancestors:
+                    children.append((nodes[node_id], matrix, ancestors))
+            elif name == "instance_geometry":
+                geometry_id = element.attrib.get("url", "")[1:]
+                if geometry_id not in instances:
+                    bindings = {material.attrib.get("symbol"): material.attrib.get("target", "")[1:] for material in element.iter(tag("instance_material"))}
+                    instances[geometry_id] = (matrix, bindings)
+        stack.extend(reversed(children))
+
+    return instances
+
+
+def _collada_colors(effect, tag):
+    colors = {}
+    phong = effect.find("{}/{}/{}".format(tag("profile_COMMON"), tag("technique"), tag("phong")))
+    for color_node in phong.findall(".//{}".format(tag("color"))):
+        rgba = [float(i) for i in color_node.text.split()]
+        if "sid" in color_node.attrib:
+            colors["mesh_color.{}".format(color_node.attrib["sid"])] = rgba
+    return colors
+
+
+def _collada_faces(primitive_element_set, primitive_tag, skip_step, tag):
+    """Vertex indices of the faces of a primitive element, and the number of vertices of each face."""
+    primitive_count = int(primitive_element_set.attrib["count"])
+
+    if primitive_tag in ("triangles", "polylist"):
+        fkeys = _parse_array(primitive_element_set.find(tag("p")).text, dtype=np.int64)[::skip_step]
+        if primitive_tag == "triangles":
+            vcount = np.full(primitive_count, 3, dtype=np.int64)
+        else:
+            vcount = _parse_array(primitive_element_set.find(tag("vcount")).text, dtype=np.int64)
+        if len(vcount) != primitive_count:
+            raise Exception("Primitive count does not match vertex per face count, primitive tag={}".format(primitive_tag))
+        return fkeys, vcount
+
+    # The remaining primitives have one <p> element per polygon, strip or fan
+    # Holes of polygons are ignored, only the outer boundary in <ph> elements is used
+    elements = primitive_element_set.findall(tag("p")) + primitive_element_set.findall("{}/{}".format(tag("ph"), tag("p")))
+    primitives = [_parse_array(p.text, dtype=np.int64)[::skip_step] for p in elements]
+
+    if primitive_tag == "polygons":
+        fkeys = np.concatenate(primitives) if primitives else np.zeros(0, dtype=np.int64)
+        return fkeys, np.array([len(keys) for keys in primitives], dtype=np.int64)
+
+    triangles = []
+    for keys in primitives:
+        if len(keys) < 3:
+            continue
+        if primitive_tag == "tristrips":
+            # Every other triangle of a strip is flipped to keep a consistent winding
+            strip = np.stack((keys[:-2], keys[1:-1], keys[2:]), axis=1)
+            strip[1::2, :2] = strip[1::2, 1::-1]
+            triangles.append(strip)
+        else:
+            triangles.append(np.stack((np.full(len(keys) - 2, keys[0]), keys[1:-1], keys[2:]), axis=1))
+    fkeys = np.concatenate(triangles).reshape(-1) if triangles else np.zeros(0, dtype=np.int64)
+    return fkeys, np.full(len(fkeys) // 3, 3, dtype=np.int64)
+
+
 def _meshes_from_collada(filename, precision):
     """This is a very simple implementation of a DAE/Collada parser.
 
@@ -70,66 +360,52 @@ def _meshes_from_collada(filename, precision):
     def tag(name):
         return _xml_tag(name, namespace)
 
-    visual_scenes = dae.root.find(tag("library_visual_scenes"))
-    materials = dae.root.find(tag("library_materials"))
-    effects = dae.root.find(tag("library_effects"))
+    # Index everything referenced by id once, instead of searching the document for every geometry
+    instances = _collada_instances(dae.root, tag)
+    materials = {}
+    for material in dae.root.iterfind("{}/{}".format(tag("library_materials"), tag("material"))):
+        instance_effect = material.find(tag("instance_effect"))
+        if instance_effect is not None:
+            materials[material.attrib.get("id")] = instance_effect.attrib["url"][1:]
+    effects = {effect.attrib.get("id"): effect for effect in dae.root.iterfind("{}/{}".format(tag("library_effects"), tag("effect")))}
 
     for geometry in dae.root.findall("{}/{}".format(tag("library_geometries"), tag("geometry"))):
         mesh_xml = geometry.find(tag("mesh"))
-        mesh_id = geometry.attrib["id"]
-        matrix_node = None
-        transform = None
-
-        if visual_scenes is not None:
-            for node in visual_scenes.findall(".//{}".format(tag("node"))):
-                instance_geometry = node.find('{}[@url="#{}"]'.format(tag("instance_geometry"), mesh_id))
-                if instance_geometry is not None:
-                    matrix_node = node.find(tag("matrix"))
-                    break
-
-        if matrix_node is not None:
-            M = [float(i) for i in matrix_node.text.split()]
+        if mesh_xml is None:
+            LOGGER.debug("Skipping geometry %s of mesh file %s without mesh", geometry.attrib.get("id"), filename)
+            continue
 
+        matrix, bindings = instances.get(geometry.attrib.get("id"), (None, {}))
+        if matrix is not None and np.array_equal(matrix, np.identity(4)):
             # If it's the identity matrix, then ignore, we don't need to transform it
-            if M != [1.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 0.0, 1.0]:
-                M = M[0:4], M[4:8], M[8:12], M[12:16]
-                transform = Transformation.from_matrix(M)
+            matrix = None
+
+        sources = {source.attrib.get("id"): source for source in mesh_xml.findall(tag("source"))}
+        vertices_sources = {vertices.attrib.get("id"): vertices for vertices in mesh_xml.findall(tag("vertices"))}
 
         # primitive elements can be any combination of:
         # lines, linestrips, polygons, polylist, triangles, trifans, tristrips
-        # The current implementation only supports triangles and polylist of triangular meshes
+        # Lines and linestrips have no faces and are ignored
         primitive_element_sets = []
-        primitive_element_sets.extend(mesh_xml.findall(tag("triangles")))
-        primitive_element_sets.extend(mesh_xml.findall(tag("polylist")))
+        for primitive_tag in _COLLADA_PRIMITIVES:
+            primitive_element_sets.extend(mesh_xml.findall(tag(primitive_tag)))
 
         if len(primitive_element_sets) == 0:
-            raise Exception("No primitive elements found (currently only triangles and polylist are supported)")
+            if any(mesh_xml.find(tag(primitive_tag)) is not None for primitive_tag in _COLLADA_LINE_PRIMITIVES):
+                continue
+            raise Exception("No primitive elements found (supported are {})".format(", ".join(_COLLADA_PRIMITIVES)))
 
         for primitive_element_set in primitive_element_sets:
             primitive_tag = _xml_local_name(primitive_element_set.tag)
-            primitive_set_data = primitive_element_set.find(tag("p")).text.split()
-            primitive_count = int(primitive_element_set.attrib["count"])
 
             # Try to retrieve mesh colors
             mesh_colors = {}
+            material_symbol = primitive_element_set.attrib.get("material")
+            effect = effects.get(materials.get(bindings.get(material_symbol, material_symbol)))
 
-            if materials is not None and effects is not None:
+            if effect is not None:
                 try:
-                    instance_effect = None
-                    material_id = primitive_element_set.attrib.get("material")
-
-                    if material_id is not None:
-                        instance_effect = materials.find('{}[@id="{}"]/{}'.format(tag("material"), material_id, tag("instance_effect")))
-
-                    if instance_effect is not None:
-                        instance_effect_id = instance_effect.attrib["url"][1:]
-                        effect = effects.find('{}[@id="{}"]'.format(tag("effect"), instance_effect_id))
-                        phong = effect.find("{}/{}/{}".format(tag("profile_COMMON"), tag("technique"), tag("phong")))
-                        colors = phong.findall(".//{}".format(tag("color")))
-                        for color_node in colors:
-                            rgba = [float(i) for i in color_node.text.split()]
-                            if "sid" in color_node.attrib:
-                                mesh_colors["mesh_color.{}".format(color_node.attrib["sid"])] = rgba
+                    mesh_colors = _collada_colors(effect, tag)
                 except Exception:
                     LOGGER.exception("Exception while loading materials, all materials of mesh file %s will be ignored ", filename)
 
@@ -140,55 +416,36 @@ def _meshes_from_collada(filename, precision):
 
             vertices_input = primitive_element_set.find('{}[@semantic="VERTEX"]'.format(tag("input")))
             vertices_id = vertices_input.attrib["source"][1:]
-            vertices_link = mesh_xml.find('{}[@id="{}"]/{}'.format(tag("vertices"), vertices_id, tag("input")))
-            positions = mesh_xml.find('{}[@id="{}"]/{}'.format(tag("source"), vertices_link.attrib["source"][1:], tag("float_array")))
-            positions = positions.text.split()
+            vertices_link = vertices_sources[vertices_id].find(tag("input"))
+            positions = sources[vertices_link.attrib["source"][1:]].find(tag("float_array"))
 
-            vertices = [[float(p) for p in positions[i : i + 3]] for i in range(0, len(positions), 3)]
+            vertices = _parse_array(positions.text).reshape(-1, 3)
 
             # Parse faces
             # Every nth element is a vertex key, we ignore the rest based on the offsets defined
             # Usually, every second item is the normal, but there can be other items offset in there (vertex tangents, etc)
             skip_step = 1 + all_offsets[-1]
-
-            if primitive_tag == "triangles":
-                vcount = [3] * primitive_count
-            elif primitive_tag == "polylist":
-                vcount = [int(v) for v in primitive_element_set.find(tag("vcount")).text.split()]
-
-            if len(vcount) != primitive_count:
-                raise Exception("Primitive count does not match vertex per face count, vertex input id={}".format(vertices_id))
-
-            fkeys = [int(f) for f in primitive_set_data[::skip_step]]
-            faces = []
-            for i in range(primitive_count):
-                a = i * vcount[i]
-                b = a + vcount[i]
-                faces.append(fkeys[a:b])
+            fkeys, vcount = _collada_faces(primitive_element_set, primitive_tag, skip_step, tag)
 
             # Rebuild vertices and faces using the same logic that other importers
             # use remapping everything based on a selected precision
-            index_key = OrderedDict()
-            vertex = OrderedDict()
-
-            for i, xyz in enumerate(vertices):
-                key = TOL.geometric_key(xyz, precision)
-                index_key[i] = key
-                vertex[key] = xyz
-
-            key_index = {key: index for index, key in enumerate(vertex)}
-            index_index = {index: key_index[key] for index, key in iter(index_key.items())}
-            vertices = [xyz for xyz in iter(vertex.values())]
-            faces = [[index_index[index] for index in face] for face in faces]
+            vertices, fkeys = _weld_vertices(vertices, fkeys, precision)
+            if matrix is not None:
+                vertices = _transform_vertices(vertices, matrix)
+
+            if not len(vcount):
+                faces = []
+            elif np.all(vcount == vcount[0]):
+                faces = fkeys[: len(vcount) * vcount[0]].reshape(-1, vcount[0]).tolist()
+            else:
+                faces = [face.tolist() for face in np.split(fkeys, np.cumsum(vcount)[:-1])]
+            vertices = vertices.tolist()
 
             mesh = Mesh.from_vertices_and_faces(vertices, faces)
 
             if mesh_colors:
                 mesh.attributes.update(mesh_colors)
 
-            if transform:
-                mesh.transform(transform)
-
             meshes.append(mesh)
 
     return meshes
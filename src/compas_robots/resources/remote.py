@@ -0,0 +1,302 @@
+from __future__ import annotations
+
+import hashlib
+import http.client
+import json
+import logging
+import os
+import shutil
+import tempfile
+import threading
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+from urllib.error import HTTPError
+from urllib.parse import urljoin
+from urllib.parse import urlsplit
+
+import compas_robots
+
+if TYPE_CHECKING:
+    from typing import Optional
+
+LOGGER = logging.getLogger(__name__)
+
+_REDIRECT_STATUSES = (301, 302, 303, 307, 308)
+_RETRY_STATUSES = (502, 503, 504)
+_MAX_REDIRECTS = 5
+
+
+class HttpClient(object):
+    """Fetches remote files over pooled keep-alive connections and keeps them in a local HTTP cache.
+
+    Every fetched file is stored in the cache directory together with its `ETag` and `Last-Modified` headers.
+    Fetching the file again sends a conditional request, and the cached copy is used when the server
+    answers that it is unchanged, or when the server cannot be reached.
+    In offline mode, no requests are sent and files are served only from the cache.
+
+    Connections are kept open and reused for further requests to the same host, also from several threads.
+    Clients can be pickled, e.g. to send them to other processes. Copies open their own connections and share the cache directory,
+    which is still removed only together with the original client.
+
+    Parameters
+    ----------
+    cache_directory
+        Directory of the HTTP cache. Defaults to a temporary directory that is removed with the client.
+    offline
+        If `True`, serve files only from the cache.
+    max_connections
+        Maximum number of idle connections kept open per host.
+    timeout
+        Timeout of connections, in seconds.
+    retries
+        Number of times a request is retried after a connection error or a temporary server error.
+    backoff
+        Delay before the first retry, in seconds. The delay doubles with every retry.
+
+    Attributes
+    ----------
+    cache_directory : str
+        Directory of the HTTP cache.
+    offline : bool
+        If `True`, serve files only from the cache.
+    downloads : int
+        Number of files downloaded from the server.
+    revalidations : int
+        Number of files that the server confirmed as unchanged.
+    cache_hits : int
+        Number of files served from the cache without asking the server, in offline mode or when the server could not be reached.
+
+    Examples
+    --------
+    >>> client = HttpClient(offline=True)
+    >>> client.fetch("https://example.com/missing.stl")
+    Traceback (most recent call last):
+    ...
+    OSError: https://example.com/missing.stl is not in the cache and cannot be fetched offline
+    >>> client.close()
+
+    """
+
+    def __init__(
+        self,
+        cache_directory: Optional[str] = None,
+        offline: bool = False,
+        max_connections: int = 8,
+        timeout: float = 30.0,
+        retries: int = 2,
+        backoff: float = 0.5,
+    ):
+        if cache_directory is None:
+            cache_directory = tempfile.mkdtemp(prefix="compas_robots_")
+            weakref.finalize(self, shutil.rmtree, cache_directory, True)
+        self.cache_directory = cache_directory
+        self.offline = offline
+        self.max_connections = max_connections
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.downloads = 0
+        self.revalidations = 0
+        self.cache_hits = 0
+        self._connections = {}
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_connections"]
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._connections = {}
+        self._lock = threading.Lock()
+
+    def fetch(self, url: str) -> str:
+        """Fetch a file, unless the cached copy is up to date.
+
+        Parameters
+        ----------
+        url
+            URL of the file.
+
+        Returns
+        -------
+        str
+            Path of the local copy of the file in the cache directory.
+
+        Raises
+        ------
+        OSError
+            If the file cannot be fetched and is not in the cache.
+        urllib.error.HTTPError
+            If the server answers with an error.
+
+        """
+        path, metadata = self._cached(url)
+        if self.offline:
+            if path is None:
+                raise OSError("{} is not in the cache and cannot be fetched offline".format(url))
+            self._count("cache_hits")
+            return path
+
+        headers = {}
+        if path is not None:
+            if metadata.get("etag"):
+                headers["If-None-Match"] = metadata["etag"]
+            if metadata.get("last_modified"):
+                headers["If-Modified-Since"] = metadata["last_modified"]
+
+        try:
+            status, reason, response_headers, body = self._get(url, headers)
+        except (http.client.HTTPException, OSError):
+            if path is None:
+                raise
+            LOGGER.warning("Could not reach %s, using the cached copy", url)
+            self._count("cache_hits")
+            return path
+
+        if status == 304 and path is not None:
+            self._count("revalidations")
+            return path
+        if status != 200:
+            raise HTTPError(url, status, reason, response_headers, None)
+
+        self._count("downloads")
+        metadata = {"url": url, "etag": response_headers.get("ETag"), "last_modified": response_headers.get("Last-Modified")}
+        return self._store(url, body, metadata)
+
+    def fetch_many(self, urls: list[str], max_workers: int = 8) -> list[str]:
+        """Fetch several files concurrently.
+
+        Parameters
+        ----------
+        urls
+            URLs of the files.
+        max_workers
+            Maximum number of concurrent requests.
+
+        Returns
+        -------
+        list[str]
+            Paths of the local copies of the files, in the order of the URLs.
+
+        """
+        if max_workers <= 1 or len(urls) <= 1:
+            return [self.fetch(url) for url in urls]
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(self.fetch, urls))
+
+    def close(self) -> None:
+        """Close all idle connections."""
+        with self._lock:
+            connections = [connection for idle in self._connections.values() for connection in idle]
+            self._connections.clear()
+        for connection in connections:
+            connection.close()
+
+    def _count(self, name):
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    # ==========================================================================
+    # Cache
+    # ==========================================================================
+
+    def _paths(self, url):
+        name = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        extension = os.path.splitext(urlsplit(url).path)[1]
+        return os.path.join(self.cache_directory, name + extension), os.path.join(self.cache_directory, name + ".http.json")
+
+    def _cached(self, url):
+        path, metadata_path = self._paths(url)
+        if not os.path.isfile(path) or not os.path.isfile(metadata_path):
+            return None, None
+        try:
+            with open(metadata_path, "r") as f:
+                return path, json.load(f)
+        except ValueError:
+            return None, None
+
+    def _store(self, url, body, metadata):
+        if not os.path.isdir(self.cache_directory):
+            os.makedirs(self.cache_directory, exist_ok=True)
+
+        # The metadata is moved in place last, so that readers only see complete entries
+        path, metadata_path = self._paths(url)
+        for filepath, content in ((path, body), (metadata_path, json.dumps(metadata).encode("utf-8"))):
+            handle, temp_filepath = tempfile.mkstemp(dir=self.cache_directory, suffix=".tmp")
+            try:
+                with os.fdopen(handle, "wb") as f:
+                    f.write(content)
+                os.replace(temp_filepath, filepath)
+            except Exception:
+                os.remove(temp_filepath)
+                raise
+        return path
+
+    # ==========================================================================
+    # Connections
+    # ==========================================================================
+
+    def _acquire(self, scheme, netloc):
+        with self._lock:
+            idle = self._connections.get((scheme, netloc))
+            if idle:
+                return idle.pop(), True
+        connection_class = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+        return connection_class(netloc, timeout=self.timeout), False
+
+    def _release(self, scheme, netloc, connection):
+        with self._lock:
+            idle = self._connections.setdefault((scheme, netloc), [])
+            if len(idle) < self.max_connections:
+                idle.append(connection)
+                return
+        connection.close()
+
+    def _get(self, url, headers):
+        headers = dict(headers, **{"User-Agent": "compas_robots/{}".format(compas_robots.__version__)})
+        for _ in range(_MAX_REDIRECTS + 1):
+            status, reason, response_headers, body = self._request(url, headers)
+            if status not in _REDIRECT_STATUSES or "Location" not in response_headers:
+                return status, reason, response_headers, body
+            url = urljoin(url, response_headers["Location"])
+        raise HTTPError(url, status, "Too many redirects", response_headers, None)
+
+    def _request(self, url, headers):
+        parts = urlsplit(url)
+        target = parts.path or "/"
+        if parts.query:
+            target += "?" + parts.query
+
+        attempt = 0
+        while True:
+            connection, reused = self._acquire(parts.scheme, parts.netloc)
+            try:
+                connection.request("GET", target, headers=headers)
+                response = connection.getresponse()
+                body = response.read()
+            except (http.client.HTTPException, OSError):
+                connection.close()
+                # Idle connections may have been closed by the server in the meantime, which is retried right away
+                if reused:
+                    continue
+                if attempt == self.retries:
+                    raise
+                attempt += 1
+                time.sleep(self.backoff * 2 ** (attempt - 1))
+                continue
+
+            if response.will_close:
+                connection.close()
+            else:
+                self._release(parts.scheme, parts.netloc, connection)
+
+            if response.status in _RETRY_STATUSES and attempt < self.retries:
+                attempt += 1
+                time.sleep(self.backoff * 2 ** (attempt - 1))
+                continue
+            return response.status, response.reason, response.headers, body
@@ -217,7 +217,7 @@ class BaseRobotModelObject(AbstractRobotModelObject, SceneObject):
             items.pop(name, None)
 
     def create(self, link: Optional[Link] = None, context: Optional[str] = None) -> None:
-        """Recursive function that triggers the drawing of the robot model's geometry.
+        """Triggers the drawing of the robot model's geometry.
 
         This method delegates the geometry drawing to the `create_geometry`
         method. It transforms the geometry based on the saved initial
@@ -234,6 +234,12 @@ class BaseRobotModelObject(AbstractRobotModelObject, SceneObject):
         if link is None:
             link = self.model.root
 
+        for link in self.model._get_link_order(link):
+            self._create_link(link, context)
+            # Only the start link is created in the given context
+            context = None
+
+    def _create_link(self, link, context):
         for item in itertools.chain(link.visual, link.collision):
             meshes = LinkGeometry._get_item_meshes(item)
 
@@ -272,9 +278,6 @@ class BaseRobotModelObject(AbstractRobotModelObject, SceneObject):
                 item.native_geometry = native_geometry
                 item.current_transformation = Transformation()
 
-        for child_joint in link.joints:
-            self.create(child_joint.child_link)
-
     def meshes(
         self,
         link: Optional[Link] = None,
@@ -282,7 +285,7 @@ class BaseRobotModelObject(AbstractRobotModelObject, SceneObject):
         collision: bool = False,
         attached_meshes: bool = True,
     ) -> list[Mesh]:
-        """Returns all compas meshes of the model.
+        """Returns copies of all compas meshes of the model, in their current position.
 
         Parameters
         ----------
@@ -301,20 +304,17 @@ class BaseRobotModelObject(AbstractRobotModelObject, SceneObject):
             link = self.model.root
 
         meshes = []
-        items = []
-        if visual:
-            items += link.visual
-        if collision:
-            items += link.collision
-        if attached_meshes:
-            items += list(self.attached_items.get(link.name, {}).values())
-        for item in items:
-            new_meshes = LinkGeometry._get_item_meshes(item)
-            for mesh in new_meshes:
-                mesh.transform(item.current_transformation)
-            meshes += new_meshes
-        for child_joint in link.joints:
-            meshes += self.meshes(child_joint.child_link, visual, collision, attached_meshes)
+        for link in self.model._get_link_order(link):
+            items = []
+            if visual:
+                items += link.visual
+            if collision:
+                items += link.collision
+            if attached_meshes:
+                items += list(self.attached_items.get(link.name, {}).values())
+            for item in items:
+                # The meshes of the model may be shared between items, so they are not transformed in place
+                meshes += [mesh.transformed(item.current_transformation) for mesh in LinkGeometry._get_item_meshes(item)]
         return meshes
 
     def scale(self, factor: float) -> None:
@@ -334,7 +334,7 @@ class BaseRobotModelObject(AbstractRobotModelObject, SceneObject):
         self.scale_factor = factor
 
     def scale_link(self, link: Link, transformation: Transformation) -> None:
-        """Recursive function to apply the scale transformation on each link.
+        """Apply the scale transformation on each link of the subtree starting at `link`.
 
         Parameters
         ----------
@@ -350,15 +350,13 @@ class BaseRobotModelObject(AbstractRobotModelObject, SceneObject):
             self._scale_link_helper(tool.root, transformation)
 
     def _scale_link_helper(self, link, transformation):
-        for item in itertools.chain(link.visual, link.collision):
-            # Some links have only collision geometry, not visual. These meshes
-            # have not been loaded.
-            if item.native_geometry:
-                for geometry in item.native_geometry:
-                    self.transform(geometry, transformation)
-
-        for child_joint in link.joints:
-            self._scale_link_helper(child_joint.child_link, transformation)
+        for link in self.model._get_link_order(link):
+            for item in itertools.chain(link.visual, link.collision):
+                # Some links have only collision geometry, not visual. These meshes
+                # have not been loaded.
+                if item.native_geometry:
+                    for geometry in item.native_geometry:
+                        self.transform(geometry, transformation)
 
     def _apply_transformation_on_transformed_link(self, item: Union[Visual, Collision], transformation: Transformation) -> None:
         """Applies a transformation on a link that is already transformed.
@@ -374,6 +372,8 @@ class BaseRobotModelObject(AbstractRobotModelObject, SceneObject):
             The (absolute) transformation to apply onto the link's geometry.
 
         """
+        if transformation is item.current_transformation:
+            return
         if getattr(item, "current_transformation"):
             relative_transformation = transformation * item.current_transformation.inverse()
         else:
@@ -413,7 +413,10 @@ class BaseRobotModelObject(AbstractRobotModelObject, SceneObject):
         collision=True,
         parent_transformation=None,
     ):
-        transformations = model.compute_transformations(joint_state, parent_transformation=parent_transformation)
+        # Transformations of links that did not move are kept as the same objects and skipped
+        cache = model.get_forward_kinematics_cache()
+        cache.update(joint_state, parent_transformation)
+        transformations = cache.transformations
         for j in model.iter_joints():
             self._transform_link_geometry(j.child_link, transformations[j.name], collision)
         return transformations
@@ -0,0 +1,299 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+from compas.data import Data
+
+from .configuration import _JOINT_REVOLUTE
+from .configuration import Configuration
+from .configuration import ConfigurationArray
+from .configuration import _wrapped_differences
+from .configuration import joint_names_validator
+
+if TYPE_CHECKING:
+    from typing import Iterator
+    from typing import Optional
+    from typing import Union
+
+    from compas_robots.model import JointType
+
+
+class JointTrajectory(Data):
+    """Represents a sequence of configurations of the same joints, optionally timed.
+
+    Positions, velocities, accelerations and time stamps are stored as contiguous NumPy
+    arrays, and the joint types and names only once for the whole trajectory.
+
+    Parameters
+    ----------
+    positions
+        An (N, dof) array of joint positions expressed in radians or meters, depending on the respective type.
+    joint_types
+        Joint types, e.g. a list of `JointType.REVOLUTE` for revolute joints.
+        Defaults to revolute joints.
+    joint_names
+        List of joint names.
+    time_from_start
+        An (N,) array of increasing time stamps in seconds, relative to the start of the trajectory.
+    velocities
+        An (N, dof) array of joint velocities.
+    accelerations
+        An (N, dof) array of joint accelerations.
+
+    Attributes
+    ----------
+    positions : numpy.ndarray
+        The (N, dof) joint positions.
+    joint_types : list[compas_robots.model.JointType]
+        Joint types of the columns of the arrays.
+    joint_names : list[str]
+        Joint names of the columns of the arrays.
+    time_from_start : numpy.ndarray | None
+        The (N,) time stamps in seconds, if the trajectory is timed.
+    velocities : numpy.ndarray | None
+        The (N, dof) joint velocities, if available.
+    accelerations : numpy.ndarray | None
+        The (N, dof) joint accelerations, if available.
+    duration : float
+        Time stamp of the last point, or 0 if the trajectory is not timed.
+
+    Examples
+    --------
+    >>> trajectory = JointTrajectory([[0.0, 0.0], [1.0, 2.0]], joint_names=["a", "b"], time_from_start=[0.0, 2.0])
+    >>> trajectory.configuration_at(0.5)
+    Configuration((0.250, 0.500), (0, 0), ('a', 'b'))
+    >>> len(trajectory.resampled(0.5))
+    5
+
+    """
+
+    def __init__(
+        self,
+        positions: Optional[np.ndarray] = None,
+        joint_types: Optional[list[JointType]] = None,
+        joint_names: Optional[list[str]] = None,
+        time_from_start: Optional[np.ndarray] = None,
+        velocities: Optional[np.ndarray] = None,
+        accelerations: Optional[np.ndarray] = None,
+        **kwargs,
+    ):
+        super(JointTrajectory, self).__init__(**kwargs)
+        positions = np.zeros((0, len(joint_types or []))) if positions is None else np.asarray(positions, dtype=float)
+        if positions.ndim != 2:
+            raise ValueError("Expected an (N, dof) array of joint positions, got shape {}.".format(positions.shape))
+        count, dof = positions.shape
+
+        joint_types = list(joint_types) if joint_types is not None else [_JOINT_REVOLUTE] * dof
+        joint_names = list(joint_names or [])
+        joint_names_validator(joint_names)
+        if len(joint_types) != dof:
+            raise ValueError("{} joint positions per point must have {} joint_types, but {} given.".format(dof, dof, len(joint_types)))
+        if joint_names and len(joint_names) != dof:
+            raise ValueError("{} joint positions per point must have either 0 or {} names, but {} given".format(dof, dof, len(joint_names)))
+
+        if time_from_start is not None:
+            time_from_start = np.asarray(time_from_start, dtype=float)
+            if time_from_start.shape != (count,):
+                raise ValueError("Expected {} time stamps, got shape {}.".format(count, time_from_start.shape))
+            if np.any(np.diff(time_from_start) < 0):
+                raise ValueError("Time stamps must be increasing.")
+
+        self.positions = positions
+        self.joint_types = joint_types
+        self.joint_names = joint_names
+        self.time_from_start = time_from_start
+        self.velocities = self._point_array(velocities, "velocities")
+        self.accelerations = self._point_array(accelerations, "accelerations")
+
+    def _point_array(self, values, name):
+        if values is None:
+            return None
+        values = np.asarray(values, dtype=float)
+        if values.shape != self.positions.shape:
+            raise ValueError("Expected {} of shape {}, got shape {}.".format(name, self.positions.shape, values.shape))
+        return values
+
+    @property
+    def __dtype__(self):
+        return "compas_robots/JointTrajectory"
+
+    @property
+    def __data__(self):
+        return {
+            "positions": self.positions.tolist(),
+            "joint_types": self.joint_types,
+            "joint_names": self.joint_names,
+            "time_from_start": None if self.time_from_start is None else self.time_from_start.tolist(),
+            "velocities": None if self.velocities is None else self.velocities.tolist(),
+            "accelerations": None if self.accelerations is None else self.accelerations.tolist(),
+        }
+
+    @classmethod
+    def __from_data__(cls, data):
+        dof = len(data["joint_types"])
+        return cls(
+            positions=np.array(data["positions"], dtype=float).reshape(-1, dof),
+            joint_types=data["joint_types"],
+            joint_names=data.get("joint_names"),
+            time_from_start=data.get("time_from_start"),
+            velocities=data.get("velocities"),
+            accelerations=data.get("accelerations"),
+        )
+
+    def __str__(self):
+        return "JointTrajectory({} points, {:.3f} s)".format(len(self), self.duration)
+
+    def __repr__(self):
+        return self.__str__()
+
+    def __len__(self):
+        return self.positions.shape[0]
+
+    def __iter__(self) -> Iterator[Configuration]:
+        for i in range(len(self)):
+            yield self[i]
+
+    def __getitem__(self, index):
+        if isinstance(index, (int, np.integer)):
+            return Configuration(self.positions[index].tolist(), list(self.joint_types), list(self.joint_names))
+        return JointTrajectory(
+            self.positions[index],
+            self.joint_types,
+            self.joint_names,
+            time_from_start=None if self.time_from_start is None else self.time_from_start[index],
+            velocities=None if self.velocities is None else self.velocities[index],
+            accelerations=None if self.accelerations is None else self.accelerations[index],
+        )
+
+    @property
+    def duration(self) -> float:
+        if self.time_from_start is None or not len(self.time_from_start):
+            return 0.0
+        return float(self.time_from_start[-1])
+
+    @property
+    def configurations(self) -> ConfigurationArray:
+        """The positions as a [ConfigurationArray][compas_robots.ConfigurationArray] sharing the same memory."""
+        return ConfigurationArray(self.positions, self.joint_types, self.joint_names)
+
+    @classmethod
+    def from_configurations(cls, configurations: list[Configuration], time_from_start: Optional[np.ndarray] = None) -> JointTrajectory:
+        """Construct a trajectory from configurations of the same joints.
+
+        Parameters
+        ----------
+        configurations
+            The configurations, reordered to the joint names of the first one.
+        time_from_start
+            The time stamps of the configurations in seconds.
+
+        Returns
+        -------
+        JointTrajectory
+            A newly created trajectory.
+
+        """
+        configurations = ConfigurationArray.from_configurations(configurations)
+        return cls(configurations.values, configurations.joint_types, configurations.joint_names, time_from_start)
+
+    def to_configurations(self) -> list[Configuration]:
+        """Get the positions of the trajectory as configurations.
+
+        Returns
+        -------
+        list[Configuration]
+            One configuration per point.
+
+        """
+        return list(self)
+
+    def sample(self, times: Union[float, np.ndarray]) -> JointTrajectory:
+        """Interpolate the trajectory at the given times.
+
+        Positions of revolute and continuous joints are interpolated along the smaller
+        difference (+/- 2*`\\pi`) between neighbouring points, velocities and accelerations linearly.
+        Times outside of the trajectory are clamped to its start and end.
+
+        Parameters
+        ----------
+        times
+            The times in seconds. If the trajectory is not timed, point indices are used as times instead.
+
+        Returns
+        -------
+        JointTrajectory
+            A trajectory with one point per time.
+
+        """
+        if not len(self):
+            raise ValueError("Cannot sample an empty trajectory.")
+
+        stamps = self.time_from_start if self.time_from_start is not None else np.arange(len(self), dtype=float)
+        times = np.clip(np.atleast_1d(np.asarray(times, dtype=float)), stamps[0], stamps[-1])
+
+        # Index of the segment start and parameter within each segment
+        indices = np.clip(np.searchsorted(stamps, times, side="right") - 1, 0, max(len(self) - 2, 0))
+        following = np.minimum(indices + 1, len(self) - 1)
+        spans = stamps[following] - stamps[indices]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            parameters = np.where(spans > 0, (times - stamps[indices]) / spans, 0.0)[:, None]
+
+        start = self.positions[indices]
+        positions = start - parameters * _wrapped_differences(start, self.positions[following], self.joint_types)
+
+        def interpolate(values):
+            if values is None:
+                return None
+            return values[indices] + parameters * (values[following] - values[indices])
+
+        return JointTrajectory(
+            positions,
+            self.joint_types,
+            self.joint_names,
+            time_from_start=times if self.time_from_start is not None else None,
+            velocities=interpolate(self.velocities),
+            accelerations=interpolate(self.accelerations),
+        )
+
+    def configuration_at(self, time: float) -> Configuration:
+        """Interpolate the configuration at a given time.
+
+        Parameters
+        ----------
+        time
+            The time in seconds, or the fractional point index if the trajectory is not timed.
+
+        Returns
+        -------
+        Configuration
+            The interpolated configuration.
+
+        """
+        return self.sample(time)[0]
+
+    def resampled(self, time_step: float) -> JointTrajectory:
+        """Resample the trajectory at a constant time step.
+
+        Parameters
+        ----------
+        time_step
+            The time step in seconds, or in point indices if the trajectory is not timed.
+
+        Returns
+        -------
+        JointTrajectory
+            A trajectory from the start to the end of this one, including the end.
+
+        """
+        if time_step <= 0:
+            raise ValueError("The time step must be positive.")
+        if not len(self):
+            return self[:]
+
+        start = self.time_from_start[0] if self.time_from_start is not None else 0.0
+        end = self.time_from_start[-1] if self.time_from_start is not None else float(len(self) - 1)
+        times = start + np.arange(int(np.floor((end - start) / time_step + 1e-9)) + 1) * time_step
+        if end - times[-1] > 1e-9:
+            times = np.append(times, end)
+        return self.sample(times)
@@ -0,0 +1,79 @@
+import os
+
+import pytest
+
+import compas_robots
+from compas_robots.files import URDF
+from compas_robots.model import RobotModelCache
+from compas_robots.resources import LocalPackageMeshLoader
+
+
+@pytest.fixture
+def ur5_urdf():
+    return compas_robots.get("ur_description/urdf/ur5.urdf")
+
+
+def test_cache_hit_returns_same_model(tmp_path, ur5_urdf):
+    cache = RobotModelCache(str(tmp_path / "models"))
+    parsed = cache.load(ur5_urdf)
+    cached = cache.load(ur5_urdf)
+
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert cached is not parsed
+    assert URDF.from_robot(cached).to_string() == URDF.from_robot(parsed).to_string()
+    assert cached.get_configurable_joint_names() == parsed.get_configurable_joint_names()
+
+
+def test_cache_with_geometry(tmp_path, ur5_urdf):
+    cache = RobotModelCache(str(tmp_path))
+    loader = LocalPackageMeshLoader(compas_robots.DATA, "ur_description")
+    cache.load(ur5_urdf)
+    robot = cache.load(ur5_urdf, loader)
+    cached = cache.load(ur5_urdf, loader)
+
+    # Models with and without geometry, or loaded from other packages, are different entries
+    assert (cache.hits, cache.misses) == (1, 2)
+    cached.ensure_geometry()
+    expected = robot.links[1].visual[0].geometry.shape.meshes[0]
+    mesh = cached.links[1].visual[0].geometry.shape.meshes[0]
+    assert mesh.number_of_vertices() == expected.number_of_vertices()
+
+    cache.load(ur5_urdf, LocalPackageMeshLoader(compas_robots.DATA, "ur_description"), precision=3)
+    assert cache.misses == 3
+
+    # An explicit load_geometry=False is honoured even if loaders are given
+    robot = cache.load(ur5_urdf, loader, load_geometry=False)
+    assert (cache.hits, cache.misses) == (2, 3)
+    assert robot.links[1].visual[0].geometry.shape.meshes == []
+
+
+def test_cache_key_depends_on_content(tmp_path, ur5_urdf):
+    cache = RobotModelCache(str(tmp_path))
+    with open(ur5_urdf, "rb") as f:
+        urdf = f.read()
+    assert cache.key(urdf) == cache.key(urdf)
+    assert cache.key(urdf) != cache.key(urdf + b" ")
+
+
+def test_cache_replaces_unreadable_entries(tmp_path, ur5_urdf):
+    cache = RobotModelCache(str(tmp_path))
+    cache.load(ur5_urdf)
+    (entry,) = [name for name in os.listdir(str(tmp_path)) if name.endswith(".pickle")]
+    with open(os.path.join(str(tmp_path), entry), "wb") as f:
+        f.write(b"truncated")
+
+    robot = cache.load(ur5_urdf)
+    assert robot.name == "ur5"
+    assert cache.misses == 2
+    assert cache.load(ur5_urdf).name == "ur5"
+    assert cache.hits == 1
+
+    (tmp_path / "robot.pickle").write_bytes(b"")
+    cache.clear()
+    assert os.listdir(str(tmp_path)) == ["robot.pickle"]
+
+
+def test_cache_creates_directory(tmp_path):
+    directory = tmp_path / "models" / "ur5"
+    RobotModelCache(str(directory))
+    assert directory.is_dir()
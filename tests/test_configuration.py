@@ -1,9 +1,11 @@
 import copy
 import math
 
+import numpy as np
 import pytest
 
 from compas_robots import Configuration
+from compas_robots import ConfigurationArray
 from compas_robots.configuration import FixedLengthList
 from compas_robots.model import Joint
 
@@ -254,3 +256,70 @@ def test_length_altering_ops():
         fll.remove(1)
     with pytest.raises(TypeError):
         fll.remove(7)
+
+
+def test_config_array_interop():
+    config = Configuration.from_array(np.array([1.0, 2.0, 3.0]), joint_names=["a", "b", "c"])
+    assert config.joint_values == [1.0, 2.0, 3.0]
+    assert config.joint_types == [Joint.REVOLUTE] * 3
+    assert np.array_equal(np.asarray(config), [1.0, 2.0, 3.0])
+    with pytest.raises(ValueError):
+        np.array(config, copy=False)
+    with pytest.raises(ValueError):
+        Configuration.from_array(np.zeros((2, 3)))
+
+
+def test_config_array_zero_copy():
+    values = np.random.uniform(-1.0, 1.0, (100, 3))
+    configs = ConfigurationArray.from_array(values, [Joint.REVOLUTE, Joint.PRISMATIC, Joint.CONTINUOUS], ["a", "b", "c"])
+    assert np.shares_memory(np.asarray(configs), values)
+    assert len(configs) == 100
+    assert configs[3]["b"] == values[3, 1]
+    assert len(configs[10:20]) == 10
+    assert np.shares_memory(configs[10:20].values, values)
+
+
+def test_config_array_differences_match_configuration():
+    joint_types = [Joint.REVOLUTE, Joint.PRISMATIC, Joint.CONTINUOUS]
+    configs = ConfigurationArray(np.random.uniform(-10.0, 10.0, (50, 3)), joint_types, ["a", "b", "c"])
+    other = Configuration([1.0, 2.0, -3.0], joint_types, ["a", "b", "c"])
+
+    differences = configs.differences(other)
+    for config, diff in zip(configs, differences):
+        assert np.allclose(diff, list(config.iter_differences(other)))
+    assert np.allclose(configs.max_differences(other), [config.max_difference(other) for config in configs])
+    assert np.allclose(configs.distances(other), np.linalg.norm(differences, axis=-1))
+    assert list(configs.close_to(other, tol=0.5)) == [config.close_to(other, tol=0.5) for config in configs]
+
+
+def test_config_array_reorders_joint_names():
+    configs = ConfigurationArray([[0.0, 1.0]], [Joint.PRISMATIC, Joint.PRISMATIC], ["a", "b"])
+    other = Configuration([1.0, 0.5], [Joint.PRISMATIC, Joint.PRISMATIC], ["b", "a"])
+    assert np.allclose(configs.differences(other), [[-0.5, 0.0]])
+
+    with pytest.raises(ValueError):
+        configs.differences(Configuration([1.0, 0.5], [Joint.PRISMATIC, Joint.PRISMATIC], ["b", "c"]))
+
+
+def test_config_array_interpolated():
+    start = ConfigurationArray([[0.0, 3.0]], [Joint.PRISMATIC, Joint.REVOLUTE])
+    end = Configuration([1.0, -3.0], [Joint.PRISMATIC, Joint.REVOLUTE])
+    path = start.interpolated(end, np.linspace(0.0, 1.0, 3))
+
+    assert path.values.shape == (3, 2)
+    assert np.allclose(path.values[:, 0], [0.0, 0.5, 1.0])
+    # The revolute joint passes through pi instead of 0
+    assert np.allclose(path.values[1, 1], 3.0 + (2 * math.pi - 6.0) / 2)
+    assert path.close_to(end)[-1]
+
+
+def test_config_array_from_configurations_and_data():
+    a = Configuration.from_revolute_values([1.0, 2.0], ["a", "b"])
+    b = Configuration.from_revolute_values([4.0, 3.0], ["b", "a"])
+    configs = ConfigurationArray.from_configurations([a, b])
+    assert np.allclose(configs.values, [[1.0, 2.0], [3.0, 4.0]])
+    assert [config.joint_values for config in configs.to_configurations()] == [[1.0, 2.0], [3.0, 4.0]]
+
+    copied = ConfigurationArray.__from_data__(configs.__data__)
+    assert np.array_equal(copied.values, configs.values)
+    assert copied.joint_names == ["a", "b"]
@@ -0,0 +1,421 @@
+import numpy as np
+import pytest
+from compas.geometry import Frame
+from compas.geometry import Transformation
+from compas.geometry import Translation
+
+from compas_robots import RobotModel
+from compas_robots import ToolModel
+from compas_robots.model import ForwardKinematicsCache
+from compas_robots.model import InverseKinematicsSolver
+from compas_robots.model import Joint
+from compas_robots.model import KinematicChain
+from compas_robots.model import Mimic
+from compas_robots.model import condition_number
+from compas_robots.model import manipulability
+
+
+@pytest.fixture
+def ur5():
+    return RobotModel.ur5()
+
+
+@pytest.fixture
+def gripper():
+    """Return a prismatic gripper with a mimicking finger created programmatically."""
+    robot = RobotModel("gripper")
+    base = robot.add_link("base")
+    palm = robot.add_link("palm")
+    left = robot.add_link("left_finger")
+    right = robot.add_link("right_finger")
+    robot.add_joint("wrist", Joint.REVOLUTE, base, palm, Frame([0, 0, 0.1], [1, 0, 0], [0, 1, 0]), (0, 0, 1), (-3.0, 3.0))
+    robot.add_joint("left", Joint.PRISMATIC, palm, left, Frame([0, 0.02, 0.05], [1, 0, 0], [0, 1, 0]), (0, 1, 0), (0.0, 0.04))
+    robot.add_joint("right", Joint.PRISMATIC, palm, right, Frame([0, -0.02, 0.05], [1, 0, 0], [0, 1, 0]), (0, 1, 0), (-0.04, 0.0), mimic=Mimic("left", -1.0))
+    return robot
+
+
+def assert_frames_close(a, b, tol=1e-9):
+    assert a.point.distance_to_point(b.point) < tol
+    assert (a.xaxis - b.xaxis).length < tol
+    assert (a.yaxis - b.yaxis).length < tol
+
+
+def frame_from_matrix(matrix):
+    return Frame.from_transformation(Transformation.from_matrix(matrix.tolist()))
+
+
+def reference_frame(robot, joint_state, link_name):
+    joint = robot.get_link_by_name(link_name).parent_joint
+    transformations = robot.compute_transformations(joint_state)
+    return joint.current_origin.transformed(transformations[joint.name])
+
+
+def test_chain_joint_names(ur5):
+    chain = KinematicChain.from_robot_model(ur5, "base_link", "forearm_link")
+    assert chain.joint_names == ["shoulder_pan_joint", "shoulder_lift_joint", "elbow_joint"]
+    assert chain.configurable_joint_names == chain.joint_names
+    assert len(chain) == 3
+
+
+def test_chain_matches_compute_transformations(ur5):
+    for _ in range(20):
+        config = ur5.random_configuration()
+        for link_name in ["ee_link", "tool0", "forearm_link", "shoulder_link"]:
+            chain = ur5.get_kinematic_chain(ur5.root.name, link_name)
+            assert_frames_close(chain.forward_kinematics(config), reference_frame(ur5, config, link_name))
+
+
+def test_chain_from_link_below_root(ur5):
+    chain = ur5.get_kinematic_chain("upper_arm_link", "wrist_2_link")
+    assert chain.configurable_joint_names == ["elbow_joint", "wrist_1_joint", "wrist_2_joint"]
+
+    config = ur5.zero_configuration()
+    config["elbow_joint"] = 0.5
+    config["wrist_1_joint"] = -0.3
+    config["wrist_2_joint"] = 0.8
+    # Poses are in the world coordinate system, with the joints upstream of the base at rest
+    assert_frames_close(chain.forward_kinematics(config), reference_frame(ur5, config, "wrist_2_link"))
+    moved = config.copy()
+    moved["shoulder_lift_joint"] = 1.0
+    assert_frames_close(chain.forward_kinematics(moved), reference_frame(ur5, config, "wrist_2_link"))
+    assert np.allclose(chain.compute_matrices(np.array([[0.5, -0.3, 0.8]]))[0], chain.compute_matrix(config))
+
+
+def test_forward_kinematics_clamps_to_limits(ur5):
+    config = ur5.zero_configuration()
+    config["elbow_joint"] = 100.0
+    assert_frames_close(ur5.forward_kinematics(config), reference_frame(ur5, config, "ee_link"))
+
+
+def test_forward_kinematics_with_partial_joint_state(ur5):
+    joint_state = {"shoulder_pan_joint": 0.5}
+    assert_frames_close(ur5.forward_kinematics(joint_state), reference_frame(ur5, joint_state, "ee_link"))
+
+
+def test_forward_kinematics_mimic(gripper):
+    for value in (0.0, 0.01, 0.03, 0.1):
+        joint_state = {"wrist": 0.3, "left": value}
+        frame = gripper.forward_kinematics(joint_state, link_name="right_finger")
+        assert_frames_close(frame, reference_frame(gripper, joint_state, "right_finger"))
+
+
+def test_forward_kinematics_root_link(ur5):
+    assert ur5.forward_kinematics(ur5.zero_configuration(), link_name="world") == Frame.worldXY()
+
+
+def test_kinematic_chain_cache(ur5):
+    chain = ur5.get_kinematic_chain("world", "tool0")
+    assert ur5.get_kinematic_chain("world", "tool0") is chain
+    point = ur5.forward_kinematics(ur5.zero_configuration(), "tool0").point
+
+    ur5.scale(2.0)
+    assert ur5.get_kinematic_chain("world", "tool0") is not chain
+    scaled_point = ur5.forward_kinematics(ur5.zero_configuration(), "tool0").point
+    assert scaled_point.distance_to_point(point * 2.0) < 1e-9
+
+
+def test_kinematic_chain_cache_joint_edit(ur5):
+    config = ur5.zero_configuration()
+    config["elbow_joint"] = 2.0
+    ur5.forward_kinematics(config)
+    ur5.forward_kinematics_batch(np.array([config.joint_values]))
+
+    ur5.get_joint_by_name("elbow_joint").limit.upper = 0.5
+    assert_frames_close(ur5.forward_kinematics(config), reference_frame(ur5, config, "ee_link"))
+    assert ur5.forward_kinematics(config).point.distance_to_point([0.724, 0.191, -0.182]) < 1e-3
+
+    ur5.get_joint_by_name("wrist_1_joint").transform(Translation.from_vector([0, 0, 0.1]))
+    assert_frames_close(ur5.forward_kinematics(config), reference_frame(ur5, config, "ee_link"))
+
+    joint = ur5.get_joint_by_name("wrist_3_joint")
+    joint.current_origin = joint.current_origin.translated([0.1, 0, 0])
+    expected = reference_frame(ur5, config, "ee_link")
+    assert_frames_close(ur5.forward_kinematics(config), expected)
+    assert_frames_close(frame_from_matrix(ur5.forward_kinematics_batch(np.array([config.joint_values]))[0]), expected)
+
+
+def test_kinematic_chain_cache_structural_edit(gripper):
+    frame = gripper.forward_kinematics({"wrist": 0.2}, link_name="palm")
+    tip = gripper.add_link("tip")
+    gripper.add_joint("tip_joint", Joint.FIXED, gripper.get_link_by_name("palm"), tip, Frame([0, 0, 0.2], [1, 0, 0], [0, 1, 0]))
+
+    tip_frame = gripper.forward_kinematics({"wrist": 0.2}, link_name="tip")
+    assert_frames_close(tip_frame, reference_frame(gripper, {"wrist": 0.2}, "tip"))
+    assert_frames_close(gripper.forward_kinematics({"wrist": 0.2}, link_name="palm"), frame)
+
+
+def test_forward_kinematics_batch(ur5):
+    joint_names = ur5.get_configurable_joint_names()
+    joint_values = np.random.uniform(-4.0, 4.0, (20, len(joint_names)))
+    matrices = ur5.forward_kinematics_batch(joint_values, link_name="tool0")
+
+    assert matrices.shape == (20, 4, 4)
+    for values, matrix in zip(joint_values, matrices):
+        frame = ur5.forward_kinematics(dict(zip(joint_names, values)), link_name="tool0")
+        assert_frames_close(frame_from_matrix(matrix), frame)
+
+
+def test_forward_kinematics_batch_mimic(gripper):
+    joint_values = np.array([[0.3, value] for value in (0.0, 0.01, 0.03, 0.1)])
+    matrices = gripper.forward_kinematics_batch(joint_values, link_name="right_finger")
+
+    for values, matrix in zip(joint_values, matrices):
+        joint_state = dict(zip(gripper.get_configurable_joint_names(), values))
+        assert_frames_close(frame_from_matrix(matrix), reference_frame(gripper, joint_state, "right_finger"))
+
+
+def test_forward_kinematics_batch_wrong_shape(ur5):
+    with pytest.raises(ValueError):
+        ur5.forward_kinematics_batch(np.zeros((3, 5)))
+
+
+def test_compute_link_matrices_batch(ur5):
+    joint_names = ur5.get_configurable_joint_names()
+    joint_values = np.random.uniform(-4.0, 4.0, (5, len(joint_names)))
+    matrices = ur5.compute_link_matrices_batch(joint_values)
+    links = list(ur5.iter_links())
+
+    assert matrices.shape == (5, len(links), 4, 4)
+    assert np.allclose(matrices[:, 0], np.identity(4))
+    for values, link_matrices in zip(joint_values, matrices):
+        joint_state = dict(zip(joint_names, values))
+        for link, matrix in zip(links[1:], link_matrices[1:]):
+            assert_frames_close(frame_from_matrix(matrix), reference_frame(ur5, joint_state, link.name))
+
+
+def numerical_jacobian(robot, joint_values, link_name, delta=1e-6):
+    joint_values = np.asarray(joint_values, dtype=float)
+    perturbed = np.repeat(joint_values[None, :], 2 * len(joint_values), axis=0)
+    for i in range(len(joint_values)):
+        perturbed[2 * i, i] += delta
+        perturbed[2 * i + 1, i] -= delta
+    matrices = robot.forward_kinematics_batch(perturbed, link_name=link_name)
+    rotation = robot.forward_kinematics_batch(joint_values[None, :], link_name=link_name)[0, :3, :3]
+
+    jacobian = np.zeros((6, len(joint_values)))
+    for i in range(len(joint_values)):
+        derivative = (matrices[2 * i] - matrices[2 * i + 1]) / (2 * delta)
+        angular = derivative[:3, :3] @ rotation.T
+        jacobian[:3, i] = derivative[:3, 3]
+        jacobian[3:, i] = [angular[2, 1], angular[0, 2], angular[1, 0]]
+    return jacobian
+
+
+def test_jacobian_matches_numerical(ur5):
+    joint_names = ur5.get_configurable_joint_names()
+    for _ in range(10):
+        config = ur5.random_configuration()
+        jacobian = ur5.jacobian(config, link_name="tool0")
+        assert np.allclose(jacobian, numerical_jacobian(ur5, config.joint_values, "tool0"), atol=1e-6)
+        assert jacobian.shape == (6, len(joint_names))
+
+
+def test_jacobian_of_chain_from_link_below_root(ur5):
+    chain = ur5.get_kinematic_chain("upper_arm_link", "wrist_3_link")
+    config = ur5.random_configuration()
+    for name in ("shoulder_pan_joint", "shoulder_lift_joint"):
+        config[name] = 0.0
+    jacobian = chain.jacobian(config)
+
+    # The Jacobian is in the world coordinate system, with the joints upstream of the base at rest
+    columns = [ur5.get_configurable_joint_names().index(name) for name in chain.configurable_joint_names]
+    expected = numerical_jacobian(ur5, config.joint_values, "wrist_3_link")[:, columns]
+    assert np.allclose(jacobian, expected, atol=1e-6)
+    config["shoulder_lift_joint"] = 1.0
+    assert np.allclose(chain.jacobian(config), jacobian)
+
+
+def test_jacobian_batch(ur5):
+    joint_values = np.array([ur5.random_configuration().joint_values for _ in range(10)])
+    jacobians = ur5.jacobian_batch(joint_values)
+    assert jacobians.shape == (10, 6, 6)
+    for values, jacobian in zip(joint_values, jacobians):
+        joint_state = dict(zip(ur5.get_configurable_joint_names(), values))
+        assert np.allclose(jacobian, ur5.jacobian(joint_state))
+
+
+def test_jacobian_mimic(gripper):
+    joint_values = [0.3, 0.02]
+    jacobian = gripper.jacobian(dict(zip(gripper.get_configurable_joint_names(), joint_values)), link_name="right_finger")
+    assert np.allclose(jacobian, numerical_jacobian(gripper, joint_values, "right_finger"), atol=1e-6)
+    # The mimicking finger moves opposite to the joint it mimics
+    assert np.allclose(jacobian[:3, 1], -gripper.jacobian({"wrist": 0.3, "left": 0.02}, link_name="left_finger")[:3, 1])
+
+
+def test_jacobian_of_chain_columns(ur5):
+    chain = ur5.get_kinematic_chain("base_link", "forearm_link")
+    jacobian = chain.jacobian(ur5.random_configuration())
+    assert jacobian.shape == (6, 3)
+
+
+def test_manipulability_and_condition_number(ur5):
+    config = ur5.zero_configuration()
+    # The UR5 is singular at zero: the wrist is aligned with the shoulder
+    assert manipulability(ur5.jacobian(config)) < 1e-9
+    assert condition_number(ur5.jacobian(config)) > 1e9
+
+    config["shoulder_lift_joint"] = -1.0
+    config["elbow_joint"] = 1.5
+    config["wrist_2_joint"] = 1.0
+    jacobian = ur5.jacobian(config)
+    assert manipulability(jacobian) > 1e-3
+    assert np.isclose(manipulability(jacobian), np.sqrt(np.linalg.det(jacobian @ jacobian.T)))
+
+    jacobians = ur5.jacobian_batch(np.array([config.joint_values] * 3))
+    assert np.allclose(condition_number(jacobians), np.linalg.cond(jacobian))
+
+
+def test_manipulability_fewer_than_six_dof():
+    robot = RobotModel("planar")
+    parent = robot.add_link("base")
+    for i in range(3):
+        link = robot.add_link("link%d" % i)
+        robot.add_joint("joint%d" % i, Joint.REVOLUTE, parent, link, Frame([0.5 if i else 0, 0, 0], [1, 0, 0], [0, 1, 0]), (0, 0, 1), (-3, 3))
+        parent = link
+
+    jacobian = robot.jacobian({"joint0": 0.1, "joint1": 0.5, "joint2": -0.7})
+    assert jacobian.shape == (6, 3)
+    assert np.isclose(np.linalg.det(jacobian @ jacobian.T), 0.0)
+    assert manipulability(jacobian) > 1e-3
+    assert np.isclose(manipulability(jacobian), np.sqrt(np.linalg.det(jacobian.T @ jacobian)))
+
+
+def reachable_configuration(robot):
+    config = robot.zero_configuration()
+    config["shoulder_pan_joint"] = 0.4
+    config["shoulder_lift_joint"] = -1.0
+    config["elbow_joint"] = 1.5
+    config["wrist_1_joint"] = -0.3
+    config["wrist_2_joint"] = 1.0
+    config["wrist_3_joint"] = 0.2
+    return config
+
+
+def test_inverse_kinematics_round_trip(ur5):
+    frame = ur5.forward_kinematics(reachable_configuration(ur5))
+    result = ur5.inverse_kinematics(frame, attempts=16, random_seed=1, return_result=True)
+
+    assert result.success
+    assert result.position_error < 1e-5
+    assert result.orientation_error < 1e-4
+    assert result.attempts == 16
+    assert 0 < result.iterations <= result.total_iterations
+    assert result.elapsed_time > 0
+    assert_frames_close(ur5.forward_kinematics(result.configuration), frame, tol=1e-4)
+    for solution in result.solutions:
+        assert_frames_close(ur5.forward_kinematics(solution), frame, tol=1e-4)
+
+
+def test_inverse_kinematics_prefers_start_configuration(ur5):
+    config = reachable_configuration(ur5)
+    frame = ur5.forward_kinematics(config)
+    start = config.copy()
+    start["elbow_joint"] += 0.05
+    solution = ur5.inverse_kinematics(frame, start_configuration=start, attempts=8, random_seed=2)
+    assert np.allclose(solution.joint_values, config.joint_values, atol=1e-3)
+
+
+def test_inverse_kinematics_respects_limits(ur5):
+    ur5.get_joint_by_name("elbow_joint").limit.upper = 0.5
+    ur5._clear_caches()
+    frame = ur5.forward_kinematics(reachable_configuration(ur5))
+    result = InverseKinematicsSolver(ur5).solve(frame, attempts=8, random_seed=3)
+    for solution in result.solutions:
+        assert solution["elbow_joint"] <= 0.5 + 1e-12
+    assert result.configuration is None or result.configuration["elbow_joint"] <= 0.5 + 1e-12
+
+
+def test_inverse_kinematics_unreachable(ur5):
+    frame = Frame([5.0, 0, 0], [1, 0, 0], [0, 1, 0])
+    result = ur5.inverse_kinematics(frame, attempts=4, random_seed=0, return_result=True, max_iterations=30)
+    assert not result.success
+    assert result.configuration is None
+    assert result.position_error > 1.0
+
+
+def test_inverse_kinematics_with_tool(ur5):
+    tool = ToolModel(None, Frame([0, 0, 0.15], [1, 0, 0], [0, 1, 0]), connected_to="tool0")
+    config = reachable_configuration(ur5)
+    tcf = tool.from_t0cf_to_tcf([ur5.forward_kinematics(config, link_name="tool0")])[0]
+
+    solution = ur5.inverse_kinematics(tcf, tool=tool, attempts=16, random_seed=4)
+    flange = ur5.forward_kinematics(solution, link_name="tool0")
+    assert_frames_close(tool.from_t0cf_to_tcf([flange])[0], tcf, tol=1e-4)
+
+
+def test_inverse_kinematics_mimic(gripper):
+    frame = gripper.forward_kinematics({"wrist": 0.5, "left": 0.03}, link_name="right_finger")
+    solution = gripper.inverse_kinematics(frame, link_name="right_finger", attempts=4, random_seed=5)
+    assert np.allclose(solution.joint_values, [0.5, 0.03], atol=1e-4)
+
+
+def test_inverse_kinematics_solve_batch(ur5):
+    joint_values = np.array([reachable_configuration(ur5).joint_values] * 3) + np.random.uniform(-0.2, 0.2, (3, 6))
+    frames = [frame_from_matrix(matrix) for matrix in ur5.forward_kinematics_batch(joint_values)]
+    results = InverseKinematicsSolver(ur5).solve_batch(frames, attempts=16, random_seed=6)
+
+    assert len(results) == 3
+    for frame, result in zip(frames, results):
+        assert result.success
+        assert_frames_close(ur5.forward_kinematics(result.configuration), frame, tol=1e-4)
+
+
+def assert_transformations_close(a, b):
+    assert a.keys() == b.keys()
+    for name in a:
+        assert np.allclose(a[name].matrix, b[name].matrix)
+
+
+def test_forward_kinematics_cache_matches_compute_transformations(ur5):
+    cache = ForwardKinematicsCache(ur5)
+    config = ur5.zero_configuration()
+    for _ in range(10):
+        name = np.random.choice(config.joint_names)
+        config[name] = np.random.uniform(-3.0, 3.0)
+        cache.update(config)
+        assert_transformations_close(cache.transformations, ur5.compute_transformations(config))
+
+
+def test_forward_kinematics_cache_dirty_subtree(ur5):
+    cache = ur5.get_forward_kinematics_cache()
+    config = ur5.random_configuration()
+    assert len(cache.update(config)) == len(ur5.joints)
+    transformations = dict(cache.transformations)
+
+    assert cache.update(config) == []
+    config["wrist_2_joint"] += 0.1
+    assert cache.update(config) == ["wrist_2_joint", "wrist_3_joint", "ee_fixed_joint", "wrist_3_link-tool0_fixed_joint"]
+    assert cache.transformations["elbow_joint"] is transformations["elbow_joint"]
+    assert cache.transformations["wrist_3_joint"] is not transformations["wrist_3_joint"]
+
+    changed = cache.update(config, Translation.from_vector([0, 0, 1]))
+    assert len(changed) == len(ur5.joints)
+    assert_transformations_close(cache.transformations, ur5.compute_transformations(config, parent_transformation=Translation.from_vector([0, 0, 1])))
+
+
+def test_forward_kinematics_cache_default_parent_transformation(ur5):
+    cache = ForwardKinematicsCache(ur5)
+    config = ur5.random_configuration()
+    cache.update(config, Translation.from_vector([1, 0, 0]))
+
+    assert len(cache.update(config)) == len(ur5.joints)
+    assert_transformations_close(cache.transformations, ur5.compute_transformations(config))
+    assert cache.update(config) == []
+
+
+def test_forward_kinematics_cache_mimic(gripper):
+    cache = gripper.get_forward_kinematics_cache()
+    cache.update({"wrist": 0.1, "left": 0.01})
+    assert cache.update({"wrist": 0.1, "left": 0.02}) == ["left", "right"]
+    assert_transformations_close(cache.transformations, gripper.compute_transformations({"wrist": 0.1, "left": 0.02}))
+
+
+def test_forward_kinematics_cache_reset_on_edit(ur5):
+    cache = ur5.get_forward_kinematics_cache()
+    config = ur5.random_configuration()
+    cache.update(config)
+
+    ur5.scale(2.0)
+    assert ur5.get_forward_kinematics_cache() is cache
+    assert len(cache.update(config)) == len(ur5.joints)
+    assert_transformations_close(cache.transformations, ur5.compute_transformations(config))
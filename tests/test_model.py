@@ -1,6 +1,11 @@
+import asyncio
+import collections
 import os
 import re
 import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
 from compas.colors import Color
@@ -9,6 +14,7 @@ from compas.geometry import Cylinder
 from compas.geometry import Frame
 from compas.geometry import Sphere
 
+import compas_robots
 from compas_robots import RobotModel
 from compas_robots.files import URDF
 from compas_robots.model import Joint
@@ -16,6 +22,7 @@ from compas_robots.model import Link
 from compas_robots.model.geometry import BoxProxy
 from compas_robots.model.geometry import CylinderProxy
 from compas_robots.model.geometry import SphereProxy
+from compas_robots.resources import LocalPackageMeshLoader
 
 BASE_FOLDER = os.path.dirname(__file__)
 
@@ -87,6 +94,52 @@ def test_programmatic_robot_model():
     assert ["link0", "joint1", "link1"] == list(robot.iter_chain())
 
 
+def test_programmatic_robot_model_matches_rebuilt_tree():
+    robot = RobotModel("robot")
+    base = robot.add_link("base")
+    parent = base
+    for i in range(20):
+        link = robot.add_link("link%d" % i)
+        origin = Frame([0.1, 0, 0.2], [0, 1, 0], [0, 0, 1])
+        robot.add_joint("joint%d" % i, Joint.REVOLUTE, parent, link, origin, (0, 0, 1), (-1, 1))
+        parent = link if i % 5 else base
+
+    rebuilt = RobotModel("robot", joints=robot.joints, links=robot.links)
+    assert [link.name for link in robot.iter_links()] == [link.name for link in rebuilt.iter_links()]
+    for link in robot.links:
+        assert robot.find_parent_joint(link) is link.parent_joint
+        assert robot.find_children_joints(link) == link.joints
+    for joint in robot.joints:
+        expected = rebuilt.get_joint_by_name(joint.name)
+        assert joint.current_origin.point.distance_to_point(expected.current_origin.point) < 1e-9
+        assert (joint.current_axis.vector - expected.current_axis.vector).length < 1e-9
+
+    with pytest.raises(ValueError):
+        robot.add_link("link3")
+    with pytest.raises(ValueError):
+        robot.add_joint("joint3", Joint.FIXED, base, robot.get_link_by_name("link3"))
+
+
+def test_programmatic_robot_model_remove_joint_then_add_link():
+    robot = RobotModel("robot")
+    base = robot.add_link("base")
+    link1 = robot.add_link("link1")
+    robot.add_joint("joint1", Joint.FIXED, base, link1)
+    robot.remove_joint("joint1")
+
+    with pytest.raises(ValueError):
+        robot.add_link("link1")
+
+    joint2 = robot.add_joint("joint2", Joint.FIXED, base, link1)
+    assert link1.parent_joint is joint2
+    assert robot.find_parent_joint(link1) is joint2
+
+    link2 = robot.add_link("link2")
+    robot.add_joint("joint3", Joint.FIXED, base, link2)
+    joint4 = robot.add_joint("joint4", Joint.FIXED, link1, link2)
+    assert robot.find_parent_joint(link2) is link2.parent_joint is joint4
+
+
 def test_programmatic_robot_model_with_geometry():
     robot = RobotModel("robot")
     geo0 = Box(1, 1, 1, Frame.worldXY())
@@ -253,6 +306,83 @@ def test_robot_with_prefixed_nested_namespaces_to_string():
     assert b"<ns0:visual" in urdf_string
 
 
+@pytest.mark.parametrize(
+    "filename",
+    ["sample.urdf", "sample.with_shapes.urdf", "sample_unknown_attributes.urdf", "ur5.xacro"],
+)
+def test_streaming_parser_matches_xml_parser(filename):
+    path = os.path.join(BASE_FOLDER, "fixtures", filename)
+    streamed = URDF.from_file(path, streaming=True)
+    parsed = URDF.from_file(path)
+    assert [link.name for link in streamed.robot.iter_links()] == [link.name for link in parsed.robot.iter_links()]
+    assert streamed.to_string() == URDF.from_robot(parsed.robot).to_string()
+
+
+def test_streaming_parser_namespaces():
+    text = """<?xml version="1.0" encoding="UTF-8"?><robot xmlns="https://ethz.ch" xmlns:xacro="http://www.ros.org/wiki/xacro" name="Acrobot"><xacro:bamboo/><link xmlns="https://ita.ethz.ch" name="test"><visual><geometry><box size="0.2 0.2 0.2"/></geometry></visual></link></robot>"""
+    streamed = URDF.from_string(text, streaming=True).robot
+    parsed = URDF.from_string(text).robot
+    assert URDF.from_robot(streamed).to_string() == URDF.from_robot(parsed).to_string()
+    assert streamed.attr["xmlns:xacro"] == "http://www.ros.org/wiki/xacro"
+    assert streamed.links[0].attr["xmlns"] == "https://ita.ethz.ch"
+    assert isinstance(streamed.links[0].visual[0].geometry.shape, BoxProxy)
+
+
+def test_streaming_parser_releases_xml(urdf_file):
+    urdf = URDF.from_file(urdf_file, streaming=True)
+    link = urdf.robot.links[0]
+    assert len(link._urdf_source) == 0
+    assert not link._urdf_source.attrib
+    assert urdf.xml.root.tag == "robot"
+
+
+@pytest.mark.parametrize("streaming", [False, True])
+def test_parser_resolves_metadata_once_per_path(urdf_with_unknown_attr, streaming, monkeypatch):
+    from compas_robots.files import urdf
+
+    expected = URDF.from_file(urdf_with_unknown_attr, streaming=streaming).robot
+    calls = []
+
+    def get_metadata(parser_type):
+        calls.append(parser_type)
+        return original(parser_type)
+
+    original = urdf.get_metadata
+    monkeypatch.setattr(urdf, "get_metadata", get_metadata)
+    robot = URDF.from_file(urdf_with_unknown_attr, streaming=streaming).robot
+    assert calls == []
+    assert [joint.name for joint in robot.joints] == [joint.name for joint in expected.joints]
+
+
+@pytest.mark.parametrize("streaming", [False, True])
+def test_parser_without_source(urdf_with_unknown_attr, streaming):
+    urdf = URDF.from_file(urdf_with_unknown_attr, streaming=streaming, keep_source=False)
+    robot = urdf.robot
+    generic = robot.attr["random"]
+    parsed = [robot, generic] + generic.elements + robot.links + robot.joints
+    parsed += [item for link in robot.links for item in link.visual + link.collision]
+    parsed += [joint.origin for joint in robot.joints] + [joint.dynamics for joint in robot.joints]
+    assert not any(hasattr(obj, "_urdf_source") for obj in parsed)
+    assert generic.tag == "random"
+
+    expected = URDF.from_robot(URDF.from_file(urdf_with_unknown_attr).robot).to_string()
+    assert URDF.from_robot(robot).to_string() == expected
+
+
+def test_robot_from_urdf_keep_source(urdf_file):
+    robot = RobotModel.from_urdf_file(urdf_file)
+    assert robot._urdf_source.tag == "robot"
+    assert hasattr(robot.links[0], "_urdf_source")
+
+    robot = RobotModel.from_urdf_file(urdf_file, keep_source=False)
+    assert not hasattr(robot, "_urdf_source")
+    assert not hasattr(robot.links[0], "_urdf_source")
+
+    with open(urdf_file, "r") as f:
+        robot = RobotModel.from_urdf_string(f.read(), keep_source=False)
+    assert not hasattr(robot.links[0], "_urdf_source")
+
+
 def test_programmatic_model(ur5):
     chain = list(ur5.iter_chain("base_link", "wrist_3_link"))
     expected_chain = [
@@ -572,6 +702,36 @@ def test_iter_joints(urdf_file):
     assert joints == expected_joints
 
 
+def test_iter_deep_serial_chain():
+    count = 3000
+    links = [Link("link%d" % i) for i in range(count)]
+    joints = [Joint("joint%d" % i, "continuous", "link%d" % i, "link%d" % (i + 1), origin=Frame([0, 0, 0.01], [1, 0, 0], [0, 1, 0])) for i in range(count - 1)]
+    robot = RobotModel("snake", joints=joints, links=links)
+
+    assert [link.name for link in robot.iter_links()] == ["link%d" % i for i in range(count)]
+    assert [joint.name for joint in robot.iter_joints()] == ["joint%d" % i for i in range(count - 1)]
+    transformations = robot.compute_transformations({"joint0": 0.1})
+    assert len(transformations) == count - 1
+    assert robot.joints[-1].current_origin.point.z == pytest.approx(0.01 * (count - 1))
+
+    robot.scale(2.0)
+    assert robot.joints[-1].current_origin.point.z == pytest.approx(0.02 * (count - 1))
+
+
+def test_traversal_order_cache(urdf_file):
+    r = RobotModel.from_urdf_file(urdf_file)
+    assert r._get_link_order() is r._get_link_order()
+    links = [link.name for link in r.iter_links()]
+
+    tip = r.add_link("tip")
+    r.add_joint("tip_joint", Joint.FIXED, r.get_link_by_name("panda_hand"), tip)
+    assert [link.name for link in r.iter_links()] == links + ["tip"]
+    assert "tip_joint" in [joint.name for joint in r.iter_joints()]
+
+    r.remove_joint("tip_joint")
+    assert [link.name for link in r.iter_links()] == links
+
+
 def test_iter_link_chain(urdf_file):
     r = RobotModel.from_urdf_file(urdf_file)
     names = [i.name for i in r.iter_link_chain("panda_link2", "panda_rightfinger")]
@@ -608,6 +768,26 @@ def test_iter_link_chain_defaults(urdf_file):
     assert names == expected_chain
 
 
+def test_iter_chain_memoized(urdf_file):
+    r = RobotModel.from_urdf_file(urdf_file)
+    chain = list(r.iter_chain("panda_link6", "panda_leftfinger"))
+    assert chain == ["panda_link6", "panda_joint7", "panda_link7", "panda_joint8", "panda_link8", "panda_hand_joint", "panda_hand", "panda_finger_joint1", "panda_leftfinger"]
+    assert r._get_chain("panda_link6", "panda_leftfinger") is r._get_chain("panda_link6", "panda_leftfinger")
+    assert list(r.iter_chain("panda_hand", "panda_hand")) == ["panda_hand"]
+
+    r.remove_joint("panda_finger_joint1")
+    with pytest.raises(Exception):
+        list(r.iter_chain("panda_link6", "panda_leftfinger"))
+
+
+def test_iter_chain_not_found(urdf_file):
+    r = RobotModel.from_urdf_file(urdf_file)
+    with pytest.raises(Exception):
+        list(r.iter_chain("panda_leftfinger", "panda_rightfinger"))
+    with pytest.raises(Exception):
+        list(r.iter_chain("panda_link0", "unknown_link"))
+
+
 def test_unknown_joint_attribute(urdf_with_unknown_attr):
     r = RobotModel.__from_data__(RobotModel.from_urdf_file(urdf_with_unknown_attr).__data__)
     assert r.joints[0].attr["unknown"] == "unknown_too"
@@ -657,6 +837,138 @@ def test_ensure_geometry(urdf_file, urdf_file_with_shapes_only):
     robot.ensure_geometry()
 
 
+def _mesh_sizes(robot):
+    return [[(mesh.number_of_vertices(), mesh.number_of_faces()) for mesh in element.geometry.shape.meshes] for link in robot.links for element in link.collision + link.visual]
+
+
+def test_load_geometry_concurrently():
+    loader = LocalPackageMeshLoader(compas_robots.DATA, "ur_description")
+    robot = RobotModel.ur5()
+    timings = robot.load_geometry(loader)
+    expected = _mesh_sizes(robot)
+    filenames = [getattr(element.geometry.shape, "filename", None) for link in robot.links for element in link.collision + link.visual]
+    assert list(timings) == [filename for filename in filenames if filename]
+    assert all(elapsed > 0 for elapsed in timings.values())
+
+    threaded = RobotModel.ur5()
+    assert list(threaded.load_geometry(loader, max_workers=4)) == list(timings)
+    assert _mesh_sizes(threaded) == expected
+
+    processes = RobotModel.ur5()
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        processes.load_geometry(loader, executor=executor)
+    assert _mesh_sizes(processes) == expected
+
+
+def test_load_geometry_concurrently_reports_missing_meshes(urdf_file):
+    robot = RobotModel.from_urdf_file(urdf_file)
+    with pytest.raises(Exception, match="Unable to load meshes"):
+        robot.load_geometry(max_workers=2)
+
+
+def test_load_geometry_shares_meshes_of_same_file():
+    filename = compas_robots.get("ur_description/meshes/ur5/collision/base.stl")
+    link = '<link name="{}"><visual><geometry><mesh filename="{}"/></geometry></visual><collision><geometry><mesh filename="{}"/></geometry></collision></link>'
+    robot = RobotModel.from_urdf_string(
+        '<robot name="twins">{}{}<joint name="j" type="fixed"><parent link="a"/><child link="b"/></joint></robot>'.format(
+            link.format("a", filename, filename), link.format("b", filename, compas_robots.get("ur_description/meshes/ur5/collision/forearm.stl"))
+        )
+    )
+    timings = robot.load_geometry()
+    assert len(timings) == 2
+
+    shapes = [element.geometry.shape for link in robot.links for element in link.visual + link.collision]
+    assert shapes[0].meshes[0] is shapes[1].meshes[0] is shapes[2].meshes[0]
+    assert shapes[0].shares_meshes and not shapes[3].shares_meshes
+
+    mesh = shapes[0].unshare_meshes()[0]
+    mesh.scale(2)
+    assert not shapes[0].shares_meshes
+    assert mesh is not shapes[1].meshes[0]
+    assert shapes[1].meshes[0].aabb().xsize < mesh.aabb().xsize
+
+
+def test_load_geometry_async():
+    loader = LocalPackageMeshLoader(compas_robots.DATA, "ur_description")
+    expected = RobotModel.ur5()
+    timings = expected.load_geometry(loader)
+
+    robot = RobotModel.ur5()
+    assert list(asyncio.run(robot.load_geometry_async(loader))) == list(timings)
+    assert _mesh_sizes(robot) == _mesh_sizes(expected)
+
+    class AsyncLoader(LocalPackageMeshLoader):
+        active = 0
+        max_active = 0
+
+        async def load_meshes_async(self, url, precision=None):
+            AsyncLoader.active += 1
+            AsyncLoader.max_active = max(AsyncLoader.max_active, AsyncLoader.active)
+            await asyncio.sleep(0.01)
+            AsyncLoader.active -= 1
+            return self.load_meshes(url, precision)
+
+    robot = RobotModel.ur5()
+    asyncio.run(robot.load_geometry_async(AsyncLoader(compas_robots.DATA, "ur_description"), max_concurrency=3))
+    assert AsyncLoader.max_active == 3
+    assert _mesh_sizes(robot) == _mesh_sizes(expected)
+
+
+def test_load_geometry_lazily():
+    class CountingLoader(LocalPackageMeshLoader):
+        def __init__(self, *args):
+            super(CountingLoader, self).__init__(*args)
+            self.calls = collections.Counter()
+
+        def load_meshes(self, url, precision=None):
+            self.calls[url] += 1
+            time.sleep(0.01)
+            return super(CountingLoader, self).load_meshes(url, precision)
+
+    loader = CountingLoader(compas_robots.DATA, "ur_description")
+    robot = RobotModel.ur5()
+    robot.load_geometry(loader, visual=False)
+    assert sum(loader.calls.values()) == 7
+    with pytest.raises(Exception):
+        robot.ensure_geometry()
+
+    assert robot.load_geometry(loader, collision=False, lazy=True) == {}
+    robot.ensure_geometry()
+    assert sum(loader.calls.values()) == 7
+
+    visual = robot.links[1].visual[0].geometry.shape
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(lambda _: visual.meshes, range(4)))
+    assert all(meshes[0] is results[0][0] for meshes in results)
+    assert loader.calls[visual.filename] == 1
+
+    expected = RobotModel.ur5(load_geometry=True)
+    assert _mesh_sizes(robot) == _mesh_sizes(expected)
+    assert sum(loader.calls.values()) == 14
+
+
+def test_load_geometry_of_selected_links():
+    robot = RobotModel.ur5()
+    loader = LocalPackageMeshLoader(compas_robots.DATA, "ur_description")
+    timings = robot.load_geometry(loader, visual=False, links=["shoulder_link", robot.get_link_by_name("forearm_link")])
+    assert sorted(timings) == ["package://ur_description/meshes/ur5/collision/forearm.stl", "package://ur_description/meshes/ur5/collision/shoulder.stl"]
+
+    robot.ensure_geometry(visual=False, links=["forearm_link", "shoulder_link"])
+    with pytest.raises(Exception):
+        robot.ensure_geometry(links=["forearm_link"])
+    with pytest.raises(Exception):
+        robot.ensure_geometry(visual=False)
+    with pytest.raises(ValueError, match="Unknown links: elbow"):
+        robot.load_geometry(loader, links=["elbow", "forearm_link"])
+
+
+def test_load_geometry_lazily_reports_missing_meshes(urdf_file):
+    robot = RobotModel.from_urdf_file(urdf_file)
+    robot.load_geometry(lazy=True)
+    with pytest.raises(Exception, match="Unable to load meshes"):
+        robot.links[0].visual[0].geometry.shape.meshes
+
+
 def test_json_serialization(urdf_file):
     robot = RobotModel.from_urdf_file(urdf_file)
     with tempfile.TemporaryFile("w+") as f:
@@ -1,8 +1,17 @@
 import os
+import struct
+
+import numpy as np
+import pytest
+from compas.datastructures import Mesh
 
 import compas_robots
+from compas_robots.resources import DefaultMeshLoader
 from compas_robots.resources import LocalPackageMeshLoader
+from compas_robots.resources import MeshCache
+from compas_robots.resources import get_mesh_cache
 from compas_robots.resources import mesh_import
+from compas_robots.resources import set_mesh_cache
 
 
 def test_build_path():
@@ -23,3 +32,397 @@ def test_mesh_import_namespaced_collada():
     assert meshes[0].number_of_faces() == 2598
     assert meshes[1].number_of_vertices() == 1158
     assert meshes[1].number_of_faces() == 2240
+
+
+@pytest.fixture
+def mesh_cache():
+    previous = get_mesh_cache()
+    cache = MeshCache()
+    set_mesh_cache(cache)
+    yield cache
+    set_mesh_cache(previous)
+
+
+def test_mesh_cache_shared_between_loaders(mesh_cache):
+    loader = LocalPackageMeshLoader(compas_robots.DATA, "ur_description")
+    url = "package://ur_description/meshes/ur5/collision/base.stl"
+    meshes = loader.load_meshes(url)
+    cached = DefaultMeshLoader().load_meshes(loader._get_local_path(url))
+
+    assert (mesh_cache.hits, mesh_cache.misses) == (1, 1)
+    assert cached[0] is not meshes[0]
+    assert cached[0].to_vertices_and_faces() == meshes[0].to_vertices_and_faces()
+    assert mesh_cache.size > 0
+
+    # Different precision is a different entry
+    loader.load_meshes(url, precision=6)
+    assert mesh_cache.misses == 2
+
+
+def test_mesh_cache_invalidated_by_modification(mesh_cache, tmp_path):
+    filename = str(tmp_path / "box.obj")
+    Mesh.from_polyhedron(6).to_obj(filename)
+    assert mesh_import(filename, filename)[0].number_of_faces() == 6
+
+    Mesh.from_polyhedron(8).to_obj(filename)
+    os.utime(filename, ns=(0, 0))
+    assert mesh_import(filename, filename)[0].number_of_faces() == 8
+    assert mesh_cache.hits == 0
+
+
+def test_mesh_cache_evicts_least_recently_used():
+    meshes = [Mesh.from_polyhedron(6)]
+    cache = MeshCache()
+    cache.put("a", meshes)
+    entry_size = cache.size
+    cache.max_size = entry_size * 2
+
+    cache.put("b", meshes)
+    cache.get("a")
+    cache.put("c", meshes)
+
+    assert "a" in cache and "c" in cache and "b" not in cache
+    assert (len(cache), cache.size, cache.evictions) == (2, entry_size * 2, 1)
+
+    cache.clear()
+    assert (len(cache), cache.size, cache.hits) == (0, 0, 0)
+
+
+def test_mesh_cache_disabled():
+    assert get_mesh_cache() is None
+
+    previous = get_mesh_cache()
+    set_mesh_cache(None)
+    try:
+        filename = compas_robots.get("ur_description/meshes/ur5/collision/base.stl")
+        assert mesh_import(filename, filename)[0].number_of_faces() > 0
+    finally:
+        set_mesh_cache(previous)
+
+
+def test_mesh_cache_on_disk(tmp_path):
+    directory = str(tmp_path / "meshes")
+    filename = compas_robots.get("ur_description/meshes/ur5e/visual/base.dae")
+    cache = MeshCache(directory=directory)
+    cache.put("base", mesh_import(filename, filename))
+    assert sorted(name.split(".")[1] for name in os.listdir(directory)) == ["bin", "json"]
+
+    # A new cache, e.g. in another process, reads the meshes from disk
+    restarted = MeshCache(directory=directory)
+    meshes = restarted.get("base")
+    expected = mesh_import(filename, filename)
+    assert (restarted.disk_hits, restarted.misses) == (1, 0)
+    assert [mesh.to_vertices_and_faces() for mesh in meshes] == [mesh.to_vertices_and_faces() for mesh in expected]
+    assert meshes[0].attributes["mesh_color.diffuse"] == expected[0].attributes["mesh_color.diffuse"]
+    restarted.get("base")
+    assert restarted.hits == 1
+
+    restarted.clear()
+    assert not os.listdir(directory)
+    assert restarted.get("base") is None
+
+
+def test_mesh_cache_clear_keeps_other_files(http_server, tmp_path):
+    from compas_robots.resources import HttpClient
+
+    http_server.files["/a.json"] = b"{}"
+    http_server.files["/b.bin"] = b"data"
+    client = HttpClient(cache_directory=str(tmp_path))
+    client.fetch_many([http_server.url + "/a.json", http_server.url + "/b.bin"], max_workers=1)
+    (tmp_path / "notes.json").write_text("{}")
+    files = sorted(os.listdir(str(tmp_path)))
+
+    cache = MeshCache(directory=str(tmp_path))
+    cache.put("box", [Mesh.from_polyhedron(6)])
+    cache.clear()
+    assert sorted(os.listdir(str(tmp_path))) == files
+
+
+def test_mesh_cache_on_disk_mixed_faces_and_unreadable_entries(tmp_path):
+    mesh = Mesh.from_vertices_and_faces([[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0], [2, 0, 0]], [[0, 1, 2, 3], [1, 4, 2]])
+    MeshCache(directory=str(tmp_path)).put(("mixed", 3), [mesh])
+    assert MeshCache(directory=str(tmp_path)).get(("mixed", 3))[0].to_vertices_and_faces() == mesh.to_vertices_and_faces()
+
+    (binary,) = [name for name in os.listdir(str(tmp_path)) if name.endswith(".bin")]
+    with open(os.path.join(str(tmp_path), binary), "wb") as f:
+        f.write(b"truncated")
+    cache = MeshCache(directory=str(tmp_path))
+    assert cache.get(("mixed", 3)) is None
+    assert cache.misses == 1
+
+
+def test_weld_vertices_matches_geometric_keys():
+    from compas.tolerance import TOL
+
+    from compas_robots.resources.mesh_importer import _weld_vertices
+
+    vertices = np.array([[0.0005, -0.0, 1.0], [0.0015, 0.0, 1.0], [0.0, 0.0, 1.0], [0.001, 0.0, 1.0], [0.0025, 2.5, -1.0], [0.002, 2.5, -1.0]])
+    for precision in (None, 3, -1):
+        welded, faces = _weld_vertices(vertices, np.arange(len(vertices)), precision)
+
+        keys = [TOL.geometric_key(xyz, precision) for xyz in vertices.tolist()]
+        expected = {}
+        for xyz, key in zip(vertices.tolist(), keys):
+            expected[key] = xyz
+        assert welded.tolist() == list(expected.values())
+        assert faces.tolist() == [list(expected).index(key) for key in keys]
+
+
+def test_mesh_import_collada_mixed_polylist(tmp_path):
+    filename = str(tmp_path / "mixed.dae")
+    with open(filename, "w") as f:
+        f.write(
+            """<?xml version="1.0"?>
+<COLLADA xmlns="http://www.collada.org/2005/11/COLLADASchema" version="1.4.1">
+  <library_geometries>
+    <geometry id="mixed">
+      <mesh>
+        <source id="positions"><float_array id="positions-array" count="15">0 0 0 1 0 0 1 1 0 0 1 0 2 0 0</float_array></source>
+        <vertices id="vertices"><input semantic="POSITION" source="#positions"/></vertices>
+        <polylist count="2">
+          <input semantic="VERTEX" source="#vertices" offset="0"/>
+          <vcount>4 3</vcount>
+          <p>0 1 2 3 1 4 2</p>
+        </polylist>
+      </mesh>
+    </geometry>
+  </library_geometries>
+</COLLADA>"""
+        )
+
+    (mesh,) = mesh_import(filename, filename)
+    assert mesh.to_vertices_and_faces()[1] == [[0, 1, 2, 3], [1, 4, 2]]
+
+
+def test_mesh_import_collada_primitives_and_node_hierarchy(tmp_path):
+    filename = str(tmp_path / "primitives.dae")
+    positions = '<source id="{0}-positions"><float_array id="{0}-array" count="15">0 0 0 1 0 0 1 1 0 0 1 0 2 0 0</float_array></source>'
+    vertices = '<vertices id="{0}-vertices"><input semantic="POSITION" source="#{0}-positions"/></vertices>'
+    primitives = {
+        "polygons": '<polygons count="2" material="red"><input semantic="VERTEX" source="#polygons-vertices" offset="0"/><p>0 1 2 3</p><ph><p>1 4 2</p><h>1 2 4</h></ph></polygons>',
+        "strip": '<tristrips count="1"><input semantic="VERTEX" source="#strip-vertices" offset="0"/><p>3 0 2 1 4</p></tristrips>',
+        "fan": '<trifans count="1"><input semantic="VERTEX" source="#fan-vertices" offset="0"/><p>0 1 2 3</p></trifans>',
+        "lines": '<lines count="1"><input semantic="VERTEX" source="#lines-vertices" offset="0"/><p>0 1</p></lines>',
+    }
+    geometries = "".join(
+        '<geometry id="{0}"><mesh>{1}{2}{3}</mesh></geometry>'.format(name, positions.format(name), vertices.format(name), primitive) for name, primitive in primitives.items()
+    )
+    with open(filename, "w") as f:
+        f.write(
+            """<?xml version="1.0"?>
+<COLLADA xmlns="http://www.collada.org/2005/11/COLLADASchema" version="1.4.1">
+  <library_effects>
+    <effect id="red-effect"><profile_COMMON><technique sid="common"><phong><diffuse><color sid="diffuse">1 0 0 1</color></diffuse></phong></technique></profile_COMMON></effect>
+  </library_effects>
+  <library_materials>
+    <material id="red-material"><instance_effect url="#red-effect"/></material>
+  </library_materials>
+  <library_geometries>{}</library_geometries>
+  <library_nodes>
+    <node id="fan-node"><translate>0 0 1</translate><instance_geometry url="#fan"/></node>
+  </library_nodes>
+  <library_visual_scenes>
+    <visual_scene id="scene">
+      <node id="parent">
+        <translate>10 0 0</translate>
+        <node id="child">
+          <scale>2 2 2</scale>
+          <instance_geometry url="#polygons">
+            <bind_material><technique_common><instance_material symbol="red" target="#red-material"/></technique_common></bind_material>
+          </instance_geometry>
+          <instance_node url="#fan-node"/>
+        </node>
+      </node>
+      <node id="strip-node"><instance_geometry url="#strip"/><instance_geometry url="#lines"/></node>
+    </visual_scene>
+  </library_visual_scenes>
+</COLLADA>""".format(geometries)
+        )
+
+    polygons, strip, fan = mesh_import(filename, filename)
+
+    assert polygons.to_vertices_and_faces() == ([[10.0, 0.0, 0.0], [12.0, 0.0, 0.0], [12.0, 2.0, 0.0], [10.0, 2.0, 0.0], [14.0, 0.0, 0.0]], [[0, 1, 2, 3], [1, 4, 2]])
+    assert polygons.attributes["mesh_color.diffuse"] == [1.0, 0.0, 0.0, 1.0]
+    assert strip.to_vertices_and_faces()[1] == [[3, 0, 2], [2, 0, 1], [2, 1, 4]]
+    assert fan.to_vertices_and_faces() == ([[10.0, 0.0, 2.0], [12.0, 0.0, 2.0], [12.0, 2.0, 2.0], [10.0, 2.0, 2.0], [14.0, 0.0, 2.0]], [[0, 1, 2], [0, 2, 3]])
+
+
+def test_mesh_import_binary_stl_matches_compas(tmp_path):
+    from compas_robots.resources.mesh_importer import _mesh_from_binary_stl
+
+    filename = compas_robots.get("ur_description/meshes/ur5e/collision/upperarm.stl")
+    assert _mesh_from_binary_stl(filename).to_vertices_and_faces() == Mesh.from_stl(filename).to_vertices_and_faces()
+
+    # Vertices are welded by their exact binary coordinates, so -0.0 and 0.0 stay apart
+    binary = str(tmp_path / "binary.stl")
+    facets = [(0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 1.0, 0.0), (-0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 1.0, 0.0, 0.0), (1.0, 0.0, 0.0, 1.0, 1.0, 0.0, 0.0, 1.0, 0.0)]
+    with open(binary, "wb") as f:
+        f.write(b"binary".ljust(80, b" ") + struct.pack("<I", len(facets)))
+        for facet in facets:
+            f.write(struct.pack("<12fH", 0.0, 0.0, 1.0, *facet, 0))
+    assert _mesh_from_binary_stl(binary).to_vertices_and_faces() == Mesh.from_stl(binary).to_vertices_and_faces()
+    assert mesh_import(binary, binary)[0].number_of_vertices() == 5
+
+    ascii = str(tmp_path / "ascii.stl")
+    Mesh.from_polyhedron(4).to_stl(ascii)
+    assert _mesh_from_binary_stl(ascii) is None
+    assert mesh_import(ascii, ascii)[0].number_of_faces() == 4
+
+
+@pytest.fixture
+def http_server():
+    import hashlib
+    import threading
+    from http.server import BaseHTTPRequestHandler
+    from http.server import ThreadingHTTPServer
+
+    files = {}
+    requests = []
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            requests.append((self.path, self.client_address))
+            if self.path not in files:
+                self.send_response(404)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+
+            etag = '"{}"'.format(hashlib.sha1(files[self.path]).hexdigest())
+            if self.headers.get("If-None-Match") == etag:
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+
+            self.send_response(200)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", str(len(files[self.path])))
+            self.end_headers()
+            self.wfile.write(files[self.path])
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.files = files
+    server.requests = requests
+    server.url = "http://127.0.0.1:{}".format(server.server_address[1])
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_http_client_revalidates_and_works_offline(http_server, tmp_path):
+    from urllib.error import HTTPError
+
+    from compas_robots.resources import HttpClient
+
+    http_server.files["/a.obj"] = b"v 0 0 0\n"
+    http_server.files["/b.obj"] = b"v 1 0 0\n"
+    client = HttpClient(cache_directory=str(tmp_path))
+
+    path = client.fetch(http_server.url + "/a.obj")
+    assert client.fetch(http_server.url + "/a.obj") == path
+    http_server.files["/a.obj"] = b"v 2 0 0\n"
+    with open(client.fetch(http_server.url + "/a.obj"), "rb") as f:
+        assert f.read() == b"v 2 0 0\n"
+    client.fetch_many([http_server.url + "/a.obj", http_server.url + "/b.obj"], max_workers=1)
+
+    assert (client.downloads, client.revalidations) == (3, 2)
+    # All requests were sent over one keep-alive connection
+    assert len(set(address for _, address in http_server.requests)) == 1
+    with pytest.raises(HTTPError):
+        client.fetch(http_server.url + "/missing.obj")
+    client.close()
+
+    offline = HttpClient(cache_directory=str(tmp_path), offline=True)
+    request_count = len(http_server.requests)
+    assert [offline.fetch(http_server.url + "/a.obj"), offline.fetch(http_server.url + "/b.obj")] == client.fetch_many([http_server.url + "/a.obj", http_server.url + "/b.obj"])
+    assert offline.cache_hits == 2
+    with pytest.raises(OSError):
+        offline.fetch(http_server.url + "/missing.obj")
+    assert len(http_server.requests) == request_count + 2
+
+
+def test_github_loader_fetches_from_http_cache(http_server, tmp_path, mesh_cache):
+    from compas_robots.resources import GithubPackageMeshLoader
+
+    with open(compas_robots.get("ur_description/meshes/ur5/collision/base.stl"), "rb") as f:
+        http_server.files["/org/repo/main/pkg/meshes/base.stl"] = f.read()
+    http_server.files["/org/repo/main/pkg/urdf/robot.urdf"] = b'<robot name="robot"><link name="base"/></robot>'
+
+    loader = GithubPackageMeshLoader("org/repo", "pkg", cache_directory=str(tmp_path))
+    loader.HOST = http_server.url
+    meshes = loader.load_meshes("package://pkg/meshes/base.stl")
+    assert meshes[0].number_of_faces() > 0
+    assert compas_robots.RobotModel.from_urdf_file(loader.load_urdf("robot.urdf")).name == "robot"
+
+    offline = GithubPackageMeshLoader("org/repo", "pkg", cache_directory=str(tmp_path), offline=True)
+    offline.HOST = http_server.url
+    http_server.shutdown()
+    assert offline.load_meshes("package://pkg/meshes/base.stl")[0].number_of_faces() == meshes[0].number_of_faces()
+
+
+def test_github_loader_pickle(http_server, tmp_path, mesh_cache):
+    import pickle
+
+    from compas_robots.resources import GithubPackageMeshLoader
+
+    with open(compas_robots.get("ur_description/meshes/ur5/collision/base.stl"), "rb") as f:
+        http_server.files["/org/repo/main/pkg/meshes/base.stl"] = f.read()
+
+    loader = GithubPackageMeshLoader("org/repo", "pkg", cache_directory=str(tmp_path))
+    loader.HOST = http_server.url
+    meshes = loader.load_meshes("package://pkg/meshes/base.stl")
+
+    copy = pickle.loads(pickle.dumps(loader))
+    assert copy.client.cache_directory == loader.client.cache_directory
+    assert copy.client._connections == {}
+    mesh_cache.clear()
+    assert copy.load_meshes("package://pkg/meshes/base.stl")[0].number_of_faces() == meshes[0].number_of_faces()
+    assert copy.client.revalidations == 1
+
+
+def test_default_loader_streams_remote_files(http_server, mesh_cache):
+    for name in ("ur5e/visual/base.dae", "ur5/collision/base.stl"):
+        with open(compas_robots.get("ur_description/meshes/" + name), "rb") as f:
+            http_server.files["/" + name] = f.read()
+
+    loader = DefaultMeshLoader()
+    assert not loader.can_load_mesh(http_server.url + "/robot.fbx")
+    for name in ("ur5e/visual/base.dae", "ur5/collision/base.stl"):
+        url = http_server.url + "/" + name
+        assert loader.can_load_mesh(url)
+
+        filename = compas_robots.get("ur_description/meshes/" + name)
+        expected = [mesh.to_vertices_and_faces() for mesh in mesh_import(filename, filename)]
+        assert [mesh.to_vertices_and_faces() for mesh in loader.load_meshes(url)] == expected
+
+        # Loaded again from the mesh cache, without a request
+        request_count = len(http_server.requests)
+        assert [mesh.to_vertices_and_faces() for mesh in loader.load_meshes(url)] == expected
+        assert len(http_server.requests) == request_count
+
+
+def test_default_loader_fetches_with_http_client(http_server, tmp_path, mesh_cache):
+    from compas_robots.resources import HttpClient
+
+    with open(compas_robots.get("ur_description/meshes/ur5/collision/base.stl"), "rb") as f:
+        http_server.files["/base.stl"] = f.read()
+    url = http_server.url + "/base.stl"
+
+    client = HttpClient(cache_directory=str(tmp_path))
+    faces = DefaultMeshLoader(client=client).load_meshes(url)[0].number_of_faces()
+    assert client.downloads == 1
+
+    http_server.shutdown()
+    mesh_cache.clear()
+    offline = HttpClient(cache_directory=str(tmp_path), offline=True)
+    assert DefaultMeshLoader(client=offline).load_meshes(url)[0].number_of_faces() == faces
+    assert offline.cache_hits == 1
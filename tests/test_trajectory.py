@@ -0,0 +1,86 @@
+import math
+
+import numpy as np
+import pytest
+
+from compas_robots import Configuration
+from compas_robots import JointTrajectory
+from compas_robots.model import Joint
+
+
+@pytest.fixture
+def trajectory():
+    positions = np.array([[0.0, 3.0, 0.0], [1.0, -3.0, 0.1], [2.0, -2.0, 0.3]])
+    return JointTrajectory(
+        positions,
+        [Joint.REVOLUTE, Joint.CONTINUOUS, Joint.PRISMATIC],
+        ["a", "b", "c"],
+        time_from_start=[0.0, 1.0, 3.0],
+        velocities=np.ones((3, 3)),
+    )
+
+
+def test_trajectory_validation():
+    with pytest.raises(ValueError):
+        JointTrajectory(np.zeros(3))
+    with pytest.raises(ValueError):
+        JointTrajectory(np.zeros((2, 3)), time_from_start=[1.0, 0.0])
+    with pytest.raises(ValueError):
+        JointTrajectory(np.zeros((2, 3)), velocities=np.zeros((2, 2)))
+    with pytest.raises(ValueError):
+        JointTrajectory(np.zeros((2, 2)), joint_names=["a", "a"])
+
+
+def test_trajectory_indexing(trajectory):
+    assert len(trajectory) == 3
+    assert trajectory.duration == 3.0
+    assert trajectory[1]["b"] == -3.0
+    assert isinstance(trajectory[2], Configuration)
+
+    part = trajectory[1:]
+    assert len(part) == 2
+    assert np.shares_memory(part.positions, trajectory.positions)
+    assert part.time_from_start.tolist() == [1.0, 3.0]
+    assert part.velocities.shape == (2, 3)
+    assert np.shares_memory(trajectory.configurations.values, trajectory.positions)
+
+
+def test_trajectory_sample_wraps_revolute(trajectory):
+    sampled = trajectory.sample([0.5, 2.0, 10.0])
+    assert sampled.time_from_start.tolist() == [0.5, 2.0, 3.0]
+    # The continuous joint moves through pi instead of through 0
+    assert sampled.positions[0, 1] == pytest.approx(3.0 + (2 * math.pi - 6.0) / 2)
+    assert sampled.positions[0, 0] == pytest.approx(0.5)
+    assert sampled.positions[1].tolist() == pytest.approx([1.5, -2.5, 0.2])
+    assert sampled.positions[2].tolist() == pytest.approx([2.0, -2.0, 0.3])
+    assert np.allclose(sampled.velocities, 1.0)
+
+
+def test_trajectory_resampled(trajectory):
+    resampled = trajectory.resampled(0.25)
+    assert len(resampled) == 13
+    assert resampled.time_from_start[-1] == pytest.approx(3.0)
+    assert np.allclose(resampled.positions[[0, 4, 12]], trajectory.positions)
+
+    assert len(trajectory.resampled(0.7)) == 6
+
+
+def test_trajectory_untimed():
+    trajectory = JointTrajectory([[0.0], [1.0], [3.0]], [Joint.PRISMATIC])
+    assert trajectory.duration == 0.0
+    assert trajectory.configuration_at(1.5).joint_values == [2.0]
+    assert trajectory.resampled(0.5).positions[:, 0].tolist() == [0.0, 0.5, 1.0, 2.0, 3.0]
+
+
+def test_trajectory_from_configurations_and_data():
+    a = Configuration.from_revolute_values([1.0, 2.0], ["a", "b"])
+    b = Configuration.from_revolute_values([4.0, 3.0], ["b", "a"])
+    trajectory = JointTrajectory.from_configurations([a, b], time_from_start=[0.0, 0.5])
+    assert trajectory.positions.tolist() == [[1.0, 2.0], [3.0, 4.0]]
+    assert [config.joint_values for config in trajectory.to_configurations()] == [[1.0, 2.0], [3.0, 4.0]]
+
+    copied = JointTrajectory.__from_data__(trajectory.__data__)
+    assert np.array_equal(copied.positions, trajectory.positions)
+    assert copied.time_from_start.tolist() == [0.0, 0.5]
+    assert copied.velocities is None
+    assert copied.joint_names == ["a", "b"]